@@ -3,10 +3,12 @@ Escalation Agent for handling human escalation based on confidence scores and Fi
 Routes questions to the right department and identifies appropriate employees.
 Accepts citation agentic AI request format.
 """
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
+import asyncio
 import httpx
 import json
 from database import db
+from src.core.llm_client import extract_json_block
 
 # Try to use Fireworks AI SDK if available
 try:
@@ -27,17 +29,37 @@ from models.request_for_escalation_agent import (
 class EscalationAgent:
     """Agent that determines if human escalation is needed and routes to appropriate employees"""
     
-    def __init__(self, firework_api_key: str, confidence_threshold: float = 0.7):
+    def __init__(
+        self,
+        firework_api_key: str,
+        confidence_threshold: float = 0.7,
+        max_concurrency: int = 8,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize Escalation Agent
         
         Args:
             firework_api_key: Firework AI API key
             confidence_threshold: Minimum confidence score threshold (0-1)
+            max_concurrency: Maximum number of answers evaluated at once when streaming
+            http_client: Shared httpx client for Firework AI calls; one is created
+                (and owned by the agent) if not provided
         """
         self.firework_api_key = firework_api_key
         self.confidence_threshold = confidence_threshold
+        self._semaphore = asyncio.Semaphore(max_concurrency)
         self.firework_base_url = "https://api.fireworks.ai/inference/v1"
+        
+        # Reuse one connection pool for every Firework AI call instead of
+        # paying TCP + TLS setup per escalation decision
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(timeout=30.0)
+    
+    async def aclose(self):
+        """Close the HTTP client if it was created by the agent"""
+        if self._owns_http_client:
+            await self.http_client.aclose()
     
     async def process_batch(
         self,
@@ -57,59 +79,7 @@ class EscalationAgent:
         # Process all batches
         for batch in request.batches:
             for answer_item in batch.answers:
-                # Extract category from citations or question text
-                category = self._extract_category_from_answer(answer_item)
-                
-                # Check threshold-based escalation
-                threshold_escalation = answer_item.confidence_score < self.confidence_threshold
-                
-                # Use Firework AI to make intelligent escalation decision
-                # Include citations in the decision for better context
-                citations_context = self._format_citations_context(answer_item.citations)
-                firework_decision = await self._check_with_firework(
-                    answer_item.question_text,
-                    answer_item.answer,
-                    answer_item.confidence_score,
-                    category,
-                    citations_context=citations_context,
-                    reasoning=answer_item.reasoning
-                )
-                
-                # Final decision: escalate if either threshold or Firework says so
-                requires_escalation = threshold_escalation or firework_decision.get("requires_escalation", False)
-                
-                routed_to = None
-                department = None
-                escalation_reason = None
-                
-                if requires_escalation:
-                    # Route to appropriate employee
-                    routed_to = await self._route_to_employee(
-                        answer_item.question_text,
-                        category,
-                        firework_decision.get("department")
-                    )
-                    department = routed_to.get("department") if routed_to else None
-                    escalation_reason = firework_decision.get(
-                        "reason",
-                        f"Low confidence score: {answer_item.confidence_score:.2f}"
-                    )
-                
-                escalation_result = EscalationResult(
-                    question_id=answer_item.question_id,
-                    question_text=answer_item.question_text,
-                    answer=answer_item.answer,
-                    confidence=answer_item.confidence,
-                    confidence_score=answer_item.confidence_score,
-                    requires_escalation=requires_escalation,
-                    escalation_reason=escalation_reason,
-                    routed_to=routed_to,
-                    department=department,
-                    category=category,
-                    citations=answer_item.citations
-                )
-                
-                escalation_results.append(escalation_result)
+                escalation_results.append(await self._evaluate_answer_item(answer_item))
         
         escalations_required = sum(1 for r in escalation_results if r.requires_escalation)
         
@@ -121,6 +91,103 @@ class EscalationAgent:
             status="completed"
         )
     
+    async def process_batch_iter(
+        self,
+        request: EscalationRequest
+    ) -> AsyncIterator[EscalationResult]:
+        """
+        Stream escalation decisions for a request as each one completes
+        
+        Answers are evaluated concurrently (bounded by max_concurrency), so
+        results are yielded in completion order rather than request order.
+        Use question_id to correlate results with the original answers.
+        
+        Args:
+            request: EscalationRequest from citation agentic AI with batches of answers
+        
+        Yields:
+            EscalationResult for each answer in the request
+        """
+        async def evaluate(answer_item: AnswerItem) -> EscalationResult:
+            async with self._semaphore:
+                return await self._evaluate_answer_item(answer_item)
+        
+        tasks = [
+            asyncio.ensure_future(evaluate(answer_item))
+            for batch in request.batches
+            for answer_item in batch.answers
+        ]
+        
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # Client disconnected or consumer stopped early - don't leak LLM calls
+            for task in tasks:
+                task.cancel()
+    
+    async def _evaluate_answer_item(self, answer_item: AnswerItem) -> EscalationResult:
+        """
+        Decide whether a single answer needs escalation and route it if so
+        
+        Args:
+            answer_item: AnswerItem from the citation agent
+        
+        Returns:
+            EscalationResult for the answer
+        """
+        # Extract category from citations or question text
+        category = self._extract_category_from_answer(answer_item)
+        
+        # Check threshold-based escalation
+        threshold_escalation = answer_item.confidence_score < self.confidence_threshold
+        
+        # Use Firework AI to make intelligent escalation decision
+        # Include citations in the decision for better context
+        citations_context = self._format_citations_context(answer_item.citations)
+        firework_decision = await self._check_with_firework(
+            answer_item.question_text,
+            answer_item.answer,
+            answer_item.confidence_score,
+            category,
+            citations_context=citations_context,
+            reasoning=answer_item.reasoning
+        )
+        
+        # Final decision: escalate if either threshold or Firework says so
+        requires_escalation = threshold_escalation or firework_decision.get("requires_escalation", False)
+        
+        routed_to = None
+        department = None
+        escalation_reason = None
+        
+        if requires_escalation:
+            # Route to appropriate employee
+            routed_to = await self._route_to_employee(
+                answer_item.question_text,
+                category,
+                firework_decision.get("department")
+            )
+            department = routed_to.get("department") if routed_to else None
+            escalation_reason = firework_decision.get(
+                "reason",
+                f"Low confidence score: {answer_item.confidence_score:.2f}"
+            )
+        
+        return EscalationResult(
+            question_id=answer_item.question_id,
+            question_text=answer_item.question_text,
+            answer=answer_item.answer,
+            confidence=answer_item.confidence,
+            confidence_score=answer_item.confidence_score,
+            requires_escalation=requires_escalation,
+            escalation_reason=escalation_reason,
+            routed_to=routed_to,
+            department=department,
+            category=category,
+            citations=answer_item.citations
+        )
+    
     async def process_batch_legacy(
         self,
         questions: List[str],
@@ -145,18 +212,22 @@ class EscalationAgent:
         if categories is None:
             categories = [None] * len(questions)
         
-        if len(questions) != len(answers) != len(confidence_scores) != len(categories):
+        if not (len(questions) == len(answers) == len(confidence_scores) == len(categories)):
             raise ValueError("All input lists must have the same length")
         
+        below_threshold = [score < self.confidence_threshold for score in confidence_scores]
+        
+        # Use Firework AI to make intelligent escalation decisions, all checks in flight together
+        firework_decisions = await asyncio.gather(*(
+            self._check_with_firework(question, answer, confidence, category)
+            for question, answer, confidence, category in zip(questions, answers, confidence_scores, categories)
+        ))
+        
         escalation_results = []
         
-        for question, answer, confidence, category in zip(questions, answers, confidence_scores, categories):
-            # First check threshold-based escalation
-            threshold_escalation = confidence < self.confidence_threshold
-            
-            # Use Firework AI to make intelligent escalation decision
-            firework_decision = await self._check_with_firework(question, answer, confidence, category)
-            
+        for question, answer, confidence, category, threshold_escalation, firework_decision in zip(
+            questions, answers, confidence_scores, categories, below_threshold, firework_decisions
+        ):
             # Final decision: escalate if either threshold or Firework says so
             requires_escalation = threshold_escalation or firework_decision.get("requires_escalation", False)
             
@@ -326,64 +397,59 @@ Respond in JSON format:
         last_error = None
         for model_name in model_names:
             try:
-                # Use Fireworks AI API via httpx (OpenAI-compatible endpoint)
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.post(
-                        f"{self.firework_base_url}/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {self.firework_api_key}",
-                            "Content-Type": "application/json"
-                        },
-                        json={
-                            "model": model_name,
-                            "messages": [
-                                {
-                                    "role": "system",
-                                    "content": "You are an expert security analyst. Respond only with valid JSON. Do not include any explanation, only return the JSON object."
-                                },
-                                {
-                                    "role": "user",
-                                    "content": prompt
-                                }
-                            ],
-                            "temperature": 0.3,
-                            "max_tokens": 200
-                        }
-                    )
+                # Use Fireworks AI API via the shared httpx client (OpenAI-compatible endpoint)
+                response = await self.http_client.post(
+                    f"{self.firework_base_url}/chat/completions",
+                    headers={
+                        "Authorization": f"Bearer {self.firework_api_key}",
+                        "Content-Type": "application/json"
+                    },
+                    json={
+                        "model": model_name,
+                        "messages": [
+                            {
+                                "role": "system",
+                                "content": "You are an expert security analyst. Respond only with valid JSON. Do not include any explanation, only return the JSON object."
+                            },
+                            {
+                                "role": "user",
+                                "content": prompt
+                            }
+                        ],
+                        "temperature": 0.3,
+                        "max_tokens": 200
+                    }
+                )
+                
+                if response.status_code == 200:
+                    response_data = response.json()
+                    result_text = response_data["choices"][0]["message"]["content"].strip()
                     
-                    if response.status_code == 200:
-                        response_data = response.json()
-                        result_text = response_data["choices"][0]["message"]["content"].strip()
-                        
-                        # Extract JSON from response
-                        if "```json" in result_text:
-                            result_text = result_text.split("```json")[1].split("```")[0].strip()
-                        elif "```" in result_text:
-                            result_text = result_text.split("```")[1].split("```")[0].strip()
-                        
-                        result_text = result_text.strip()
-                        if result_text.startswith("{"):
-                            decision = json.loads(result_text)
-                            # Only log success once per batch to reduce noise
-                            if not hasattr(self, '_fireworks_success_logged'):
-                                print(f"✅ Fireworks AI model '{model_name}' working successfully")
-                                self._fireworks_success_logged = True
-                            return decision
-                        else:
-                            last_error = f"Invalid JSON format from model {model_name}"
-                            continue
-                    elif response.status_code == 404:
-                        # Model not found, try next model silently (don't log each 404)
-                        last_error = f"Model {model_name} not found (404)"
-                        continue
+                    # Extract JSON from response
+                    result_text = extract_json_block(result_text)
+                    
+                    if result_text.startswith("{"):
+                        decision = json.loads(result_text)
+                        # Only log success once per batch to reduce noise
+                        if not hasattr(self, '_fireworks_success_logged'):
+                            print(f"✅ Fireworks AI model '{model_name}' working successfully")
+                            self._fireworks_success_logged = True
+                        return decision
                     else:
-                        try:
-                            error_data = response.json()
-                            error_msg = error_data.get("error", {}).get("message", response.text[:100])
-                            last_error = f"Model {model_name}: {error_msg}"
-                        except:
-                            last_error = f"Model {model_name}: HTTP {response.status_code}"
+                        last_error = f"Invalid JSON format from model {model_name}"
                         continue
+                elif response.status_code == 404:
+                    # Model not found, try next model silently (don't log each 404)
+                    last_error = f"Model {model_name} not found (404)"
+                    continue
+                else:
+                    try:
+                        error_data = response.json()
+                        error_msg = error_data.get("error", {}).get("message", response.text[:100])
+                        last_error = f"Model {model_name}: {error_msg}"
+                    except:
+                        last_error = f"Model {model_name}: HTTP {response.status_code}"
+                    continue
             except json.JSONDecodeError:
                 continue
             except Exception as e:
@@ -435,30 +501,26 @@ Respond in JSON format:
         # Search for matching employee
         employees_collection = db.database.employees
         
+        # Departments and expertise areas are stored lowercase at seed time,
+        # so exact matches use the department/expertise_areas indexes (older
+        # title-case records: scripts/lowercase_employee_routing_fields.py)
+        department = department.lower()
+        expertise = category.lower().replace("_", "-") if category else None
+        
         # First, try to find employee by category/expertise match
-        if category:
-            employee_doc = await employees_collection.find_one({
-                "$or": [
-                    {"expertise_areas": {"$regex": category, "$options": "i"}},
-                    {"department": {"$regex": department, "$options": "i"}}
-                ]
-            })
-        else:
-            employee_doc = await employees_collection.find_one({
-                "department": {"$regex": department, "$options": "i"}
-            })
+        employee_doc = None
+        if expertise:
+            employee_doc = await employees_collection.find_one({"expertise_areas": expertise})
         
         if not employee_doc:
             # Fallback: get any employee from the department
-            employee_doc = await employees_collection.find_one({
-                "department": {"$regex": department, "$options": "i"}
-            })
+            employee_doc = await employees_collection.find_one({"department": department})
         
         if not employee_doc:
             # Last resort: get any security-related employee
             employee_doc = await employees_collection.find_one({
                 "$or": [
-                    {"department": "Security"},
+                    {"department": "security"},
                     {"expertise_areas": {"$ne": []}}
                 ]
             })
@@ -469,7 +531,7 @@ Respond in JSON format:
                 "name": employee_doc.get("name"),
                 "email": employee_doc.get("email"),
                 "role": employee_doc.get("role"),
-                "department": employee_doc.get("department")
+                "department": (employee_doc.get("department") or "").title() or None
             }
         
         return None
@@ -20,6 +20,8 @@ import voyageai
 from pymongo import MongoClient
 import anthropic
 
+from src.core.llm_client import extract_json_block
+
 load_dotenv()
 
 # ============================================================================
@@ -207,7 +209,13 @@ class KnowledgeAgent:
             print()
         
         # Step 2: Check qa_library FIRST (this is the agentic part!)
-        qa_match = self._check_qa_library(normalized['fingerprint'], question)
+        # An exact fingerprint match needs no embedding; otherwise embed once
+        # and reuse the vector for both the QA library and the chunk search
+        query_embedding = None
+        qa_match = self._find_exact_qa(normalized['fingerprint'])
+        if not qa_match:
+            query_embedding = self._embed_query(question)
+            qa_match = self._check_qa_library(query_embedding)
         if qa_match:
             if verbose:
                 print(f"✅ FOUND IN QA LIBRARY (verified answer)")
@@ -220,7 +228,7 @@ class KnowledgeAgent:
             print()
         
         # Step 3: Vector search for evidence
-        evidence = self._vector_search(question)
+        evidence = self._vector_search(question, query_embedding=query_embedding)
         if verbose:
             print(f"🔍 Found {len(evidence)} evidence chunks")
             for i, e in enumerate(evidence[:3]):
@@ -320,11 +328,7 @@ Return JSON only:
         try:
             text = response.content[0].text
             # Handle markdown code blocks
-            if "```" in text:
-                text = text.split("```")[1]
-                if text.startswith("json"):
-                    text = text[4:]
-            return json.loads(text.strip())
+            return json.loads(extract_json_block(text))
         except Exception:
             # Fallback
             return {
@@ -333,27 +337,28 @@ Return JSON only:
                 "category": "other"
             }
     
-    def _check_qa_library(self, fingerprint: str, question: str) -> Optional[dict]:
+    def _embed_query(self, question: str) -> List[float]:
+        """Embed a question for vector search (one Voyage call)."""
+        return self.voyage.embed(
+            [question],
+            model=VOYAGE_MODEL,
+            input_type="query"
+        ).embeddings[0]
+    
+    def _find_exact_qa(self, fingerprint: str) -> Optional[dict]:
+        """Exact fingerprint match in qa_library - the cheap pre-filter before embedding."""
+        return self.db["qa_library"].find_one({"question_fingerprint": fingerprint})
+    
+    def _check_qa_library(self, query_embedding: List[float]) -> Optional[dict]:
         """
-        Check if we have a verified answer for this question.
+        Check if we have a verified answer for a semantically similar question.
         
         This is the MEMORY component - the agent learns from past answers.
         """
         qa_collection = self.db["qa_library"]
         
-        # First try exact fingerprint match
-        exact_match = qa_collection.find_one({"question_fingerprint": fingerprint})
-        if exact_match:
-            return exact_match
-        
         # Try semantic similarity on question embeddings
         try:
-            query_embedding = self.voyage.embed(
-                [question], 
-                model=VOYAGE_MODEL, 
-                input_type="query"
-            ).embeddings[0]
-            
             # Vector search on qa_library
             pipeline = [
                 {
@@ -387,14 +392,16 @@ Return JSON only:
         
         return None
     
-    def _vector_search(self, question: str, limit: int = 5) -> List[Evidence]:
+    def _vector_search(
+        self,
+        question: str,
+        limit: int = 5,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Evidence]:
         """Search document chunks for relevant evidence."""
-        # Generate query embedding
-        query_embedding = self.voyage.embed(
-            [question],
-            model=VOYAGE_MODEL,
-            input_type="query"
-        ).embeddings[0]
+        # Generate query embedding unless the caller already has one
+        if query_embedding is None:
+            query_embedding = self._embed_query(question)
         
         # Vector search on chunks
         pipeline = [
@@ -684,9 +691,9 @@ Answer:"""
     def get_stats(self) -> dict:
         """Get statistics about the knowledge base."""
         return {
-            "qa_library_count": self.db["qa_library"].count_documents({}),
-            "chunks_count": self.db["chunks"].count_documents({}),
-            "documents_count": self.db["documents"].count_documents({})
+            "qa_library_count": self.db["qa_library"].estimated_document_count(),
+            "chunks_count": self.db["chunks"].estimated_document_count(),
+            "documents_count": self.db["documents"].estimated_document_count()
         }
 
 
@@ -732,4 +739,3 @@ def format_for_escalation_agent(responses: List[AgentResponse]) -> dict:
         "confidence_scores": [r.confidence for r in responses],
         "categories": [r.category for r in responses]
     }
-
@@ -1,6 +1,7 @@
 """
 Citation Agent - Extracts relevant citations from context documents for each question.
 """
+import asyncio
 import json
 from typing import Optional
 
@@ -117,17 +118,16 @@ Analyze the documents and provide citations in JSON format."""
         context_documents: list[ContextDocument]
     ) -> list[CitationResult]:
         """
-        Find citations for a batch of questions.
+        Find citations for a batch of questions concurrently.
         
         Args:
             questions: List of questions (max 5 recommended)
             context_documents: List of context documents
             
         Returns:
-            List of CitationResults for each question
+            List of CitationResults for each question, in question order
         """
-        results = []
-        for question in questions:
-            result = await self.find_citations(question, context_documents)
-            results.append(result)
-        return results
+        return list(await asyncio.gather(*(
+            self.find_citations(question, context_documents)
+            for question in questions
+        )))
@@ -1,6 +1,7 @@
 """
 Drafting Agent - Generates answers with confidence scores based on citations.
 """
+import asyncio
 import json
 from typing import Optional
 
@@ -116,7 +117,7 @@ Based on these citations, provide a comprehensive answer with confidence assessm
         citation_results: list[CitationResult]
     ) -> list[DraftResult]:
         """
-        Draft answers for a batch of questions.
+        Draft answers for a batch of questions concurrently.
         
         Args:
             questions: List of questions
@@ -128,13 +129,13 @@ Based on these citations, provide a comprehensive answer with confidence assessm
         # Create a mapping for quick lookup
         citation_map = {cr.question_id: cr for cr in citation_results}
         
-        results = []
-        for question in questions:
-            citation_result = citation_map.get(
-                question.question_id,
-                CitationResult(question_id=question.question_id, citations=[])
+        return list(await asyncio.gather(*(
+            self.draft_answer(
+                question,
+                citation_map.get(
+                    question.question_id,
+                    CitationResult(question_id=question.question_id, citations=[])
+                )
             )
-            result = await self.draft_answer(question, citation_result)
-            results.append(result)
-        
-        return results
+            for question in questions
+        )))
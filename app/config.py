@@ -18,6 +18,10 @@ class Settings(BaseSettings):
     temperature: float = 0.6
     top_p: float = 1.0
     
+    # Shared Fireworks HTTP connection pool
+    fireworks_max_connections: int = 64
+    fireworks_max_keepalive_connections: int = 32
+    
     # Batch Configuration
     batch_size: int = 5
     
@@ -6,6 +6,14 @@ import json
 from typing import Optional
 
 from app.config import settings
+from src.core.llm_client import extract_json_block
+
+# orjson decodes several times faster; its JSONDecodeError subclasses json's
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
 
 
 class FireworksClient:
@@ -18,6 +26,28 @@ class FireworksClient:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {settings.fireworks_api_key}"
         }
+        self._http: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Shared pooled HTTP/2 client, created on first use."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=120.0,
+                headers=self.headers,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=settings.fireworks_max_connections,
+                    max_keepalive_connections=settings.fireworks_max_keepalive_connections
+                )
+            )
+        return self._http
+    
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
     
     async def chat_completion(
         self,
@@ -48,21 +78,16 @@ class FireworksClient:
         if response_format:
             payload["response_format"] = response_format
         
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                self.base_url,
-                headers=self.headers,
-                json=payload
-            )
-            
-            # Better error handling
-            if response.status_code != 200:
-                error_text = response.text
-                print(f"❌ Fireworks API Error: {response.status_code}")
-                print(f"   Response: {error_text}")
-                response.raise_for_status()
-            
-            return response.json()
+        response = await self.http.post(self.base_url, json=payload)
+        
+        # Better error handling
+        if response.status_code != 200:
+            error_text = response.text
+            print(f"❌ Fireworks API Error: {response.status_code}")
+            print(f"   Response: {error_text}")
+            response.raise_for_status()
+        
+        return response.json()
     
     def extract_content(self, response: dict) -> str:
         """Extract the content from a chat completion response."""
@@ -72,11 +97,7 @@ class FireworksClient:
         """Extract and parse JSON content from a response."""
         content = self.extract_content(response)
         # Handle potential markdown code blocks
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
-        return json.loads(content.strip())
+        return json_loads(extract_json_block(content))
 
 
 # Singleton instance
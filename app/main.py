@@ -23,6 +23,7 @@ from app.models import (
 )
 from app.agents import CitationAgent, DraftingAgent
 from app.config import settings
+from app.llm_client import llm_client
 
 
 # Initialize agents
@@ -37,6 +38,11 @@ async def lifespan(app: FastAPI):
     print(f"📦 Batch size: {settings.batch_size}")
     print(f"🤖 Model: {settings.fireworks_model}")
     yield
+    
+    # Cleanup
+    await llm_client.aclose()
+    if _callback_http is not None:
+        await _callback_http.aclose()
     print("👋 Shutting down...")
 
 
@@ -48,12 +54,23 @@ app = FastAPI(
 )
 
 
+# Reused across callbacks so forwarding doesn't pay a new TCP/TLS handshake each time
+_callback_http: Optional[httpx.AsyncClient] = None
+
+
+def _callback_client() -> httpx.AsyncClient:
+    """Shared HTTP client for callback forwarding, created on first use."""
+    global _callback_http
+    if _callback_http is None or _callback_http.is_closed:
+        _callback_http = httpx.AsyncClient(timeout=30.0)
+    return _callback_http
+
+
 async def forward_to_callback(callback_url: str, data: dict):
     """Forward the response to a callback URL (another agent/service)."""
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(callback_url, json=data)
-            print(f"✅ Forwarded to {callback_url} - Status: {response.status_code}")
+        response = await _callback_client().post(callback_url, json=data)
+        print(f"✅ Forwarded to {callback_url} - Status: {response.status_code}")
     except Exception as e:
         print(f"❌ Failed to forward to {callback_url}: {e}")
 
@@ -2,6 +2,7 @@
 MongoDB database connection and schema setup for employees
 """
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import IndexModel
 from pymongo.server_api import ServerApi
 from typing import Optional
 import os
@@ -48,19 +49,17 @@ class MongoDB:
     @classmethod
     async def _create_employee_indexes(cls):
         """Create indexes for employee collection for efficient queries"""
-        employees_collection = cls.database.employees
-        
-        # Index on email for unique lookups
-        await employees_collection.create_index("email", unique=True)
-        
-        # Index on department for filtering
-        await employees_collection.create_index("department")
-        
-        # Index on expertise_areas for text search
-        await employees_collection.create_index("expertise_areas")
-        
-        # Index on codebase_modules for filtering
-        await employees_collection.create_index("codebase_modules")
+        # One createIndexes round-trip; existing indexes with the same spec are skipped
+        await cls.database.employees.create_indexes([
+            # Index on email for unique lookups
+            IndexModel("email", unique=True),
+            # Index on department for filtering
+            IndexModel("department"),
+            # Index on expertise_areas for text search
+            IndexModel("expertise_areas"),
+            # Index on codebase_modules for filtering
+            IndexModel("codebase_modules"),
+        ])
         
         print("Employee collection indexes created")
     
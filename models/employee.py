@@ -1,8 +1,10 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from bson import ObjectId
 
+from src.models.common import UTCDatetime
+
 
 class PyObjectId(ObjectId):
     @classmethod
@@ -41,7 +43,7 @@ class Employee(BaseModel):
     department: str
     codebase_modules: List[str] = []  # Parts of codebase they work on
     expertise_areas: List[str] = []  # Security domains they handle
-    created_at: datetime = datetime.utcnow()
+    created_at: UTCDatetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
     class Config:
         populate_by_name = True  # Pydantic v2 syntax (was allow_population_by_field_name)
@@ -76,7 +78,7 @@ class EmployeeResponse(BaseModel):
     department: str
     codebase_modules: List[str]
     expertise_areas: List[str]
-    created_at: datetime
+    created_at: UTCDatetime
     
     class Config:
         json_encoders = {ObjectId: str}
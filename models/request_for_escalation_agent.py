@@ -1,7 +1,7 @@
 """
 Pydantic models for escalation request format from citation agentic AI
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
 from typing import List, Optional
 
 
@@ -61,3 +61,21 @@ class EscalationResponse(BaseModel):
     escalations_required: int
     results: List[EscalationResult]
     status: str = "completed"
+
+
+class LegacyEscalationRequest(BaseModel):
+    """Parallel-list request format accepted by the legacy escalation endpoint"""
+    questions: List[str] = Field(min_length=1)
+    answers: List[str] = Field(min_length=1)
+    confidence_scores: List[float] = Field(min_length=1)
+    categories: Optional[List[Optional[str]]] = None
+    
+    @model_validator(mode="after")
+    def check_list_lengths(self):
+        """All parallel lists must describe the same questions"""
+        lengths = {len(self.questions), len(self.answers), len(self.confidence_scores)}
+        if self.categories is not None:
+            lengths.add(len(self.categories))
+        if len(lengths) != 1:
+            raise ValueError("questions, answers, confidence_scores and categories must have the same length")
+        return self
@@ -0,0 +1,78 @@
+"""
+One-time migration: copy each document's title onto its chunks as `doc_title`.
+
+KnowledgeAgent's chunk vector search reads `doc_title` straight from the
+chunk instead of joining `documents` with $lookup on every query, so chunks
+written before that change need the field stamped once. Anything that
+ingests new chunks should set `doc_title` when it writes them.
+
+Usage:
+    python scripts/denormalize_chunk_titles.py
+"""
+import asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from dotenv import load_dotenv
+
+from src.core.config import settings
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+async def denormalize_chunk_titles(mongodb_uri: str, db_name: str):
+    """Stamp doc_title on every chunk from its parent document, server-side."""
+    client = AsyncIOMotorClient(mongodb_uri)
+    database = client[db_name]
+
+    missing_before = await database.chunks.count_documents({"doc_title": {"$exists": False}})
+    print(f"Chunks without doc_title: {missing_before}")
+
+    # $lookup + $merge runs entirely on the server, no documents round-trip here
+    pipeline = [
+        {"$match": {"doc_title": {"$exists": False}}},
+        {
+            "$lookup": {
+                "from": "documents",
+                "localField": "doc_id",
+                "foreignField": "_id",
+                "as": "doc_info"
+            }
+        },
+        {
+            "$project": {
+                "doc_title": {
+                    "$ifNull": [{"$arrayElemAt": ["$doc_info.title", 0]}, "$doc_id"]
+                }
+            }
+        },
+        {
+            "$merge": {
+                "into": "chunks",
+                "on": "_id",
+                "whenMatched": "merge",
+                "whenNotMatched": "discard"
+            }
+        }
+    ]
+    await database.chunks.aggregate(pipeline).to_list(length=None)
+
+    missing_after = await database.chunks.count_documents({"doc_title": {"$exists": False}})
+    print(f"✅ Stamped doc_title on {missing_before - missing_after} chunks")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    mongodb_uri = settings.mongodb_uri or os.getenv("MONGODB_URI")
+
+    if not mongodb_uri:
+        print("Error: MONGODB_URI environment variable not set")
+        print("Please set MONGODB_URI in your .env file or environment")
+        sys.exit(1)
+
+    asyncio.run(denormalize_chunk_titles(mongodb_uri, settings.mongodb_db_name))
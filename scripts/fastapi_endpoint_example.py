@@ -2,13 +2,22 @@
 FastAPI endpoint example for Escalation Agent
 This shows how to integrate the escalation agent into a FastAPI service
 """
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import ValidationError
+import httpx
 import os
 from database import db
 from agents.escalation_agent import EscalationAgent
-from models.request_for_escalation_agent import EscalationRequest, EscalationResponse
+from models.request_for_escalation_agent import (
+    AnswerItem,
+    Batch,
+    Citation,
+    EscalationRequest,
+    EscalationResponse,
+    EscalationResult,
+    LegacyEscalationRequest,
+)
 
 app = FastAPI(
     title="Security Questionnaire Escalation API",
@@ -30,17 +39,33 @@ async def startup_event():
     
     await db.connect(mongodb_uri, db_name)
     
+    # One HTTP/2 connection pool shared by every Firework AI call for the app's lifetime
+    app.state.firework_client = httpx.AsyncClient(
+        http2=True,
+        timeout=30.0,
+        limits=httpx.Limits(max_keepalive_connections=64, max_connections=128)
+    )
+    
     firework_key = os.getenv("FIREWORK_API_KEY", "fw_LvS1WYi7mG6cU8k1p9BPuH")
     escalation_agent = EscalationAgent(
         firework_api_key=firework_key,
-        confidence_threshold=float(os.getenv("ESCALATION_CONFIDENCE_THRESHOLD", "0.7"))
+        confidence_threshold=float(os.getenv("ESCALATION_CONFIDENCE_THRESHOLD", "0.7")),
+        http_client=app.state.firework_client
     )
+    
+    # Build the nested request/response schemas now rather than on first request
+    for model in (Citation, AnswerItem, Batch, EscalationRequest, EscalationResult,
+                  EscalationResponse, LegacyEscalationRequest):
+        model.model_rebuild()
+        model.model_json_schema()
+    
     print("✅ Escalation Agent initialized")
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
-    """Close database connection on shutdown"""
+    """Close database connection and Firework AI client on shutdown"""
+    await app.state.firework_client.aclose()
     await db.disconnect()
     print("✅ Database connection closed")
 
@@ -81,14 +106,42 @@ async def process_escalation(request: EscalationRequest):
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
+@app.post("/api/v1/escalate/stream")
+async def process_escalation_stream(request: EscalationRequest):
+    """
+    Stream escalation decisions as newline-delimited JSON
+    
+    Each line is one EscalationResult, emitted as soon as that answer has been
+    evaluated, so large batches don't have to be buffered in memory before
+    the first result is sent. Results arrive in completion order.
+    
+    Args:
+        request: EscalationRequest from citation agentic AI
+    
+    Returns:
+        application/x-ndjson stream of EscalationResult objects
+    """
+    if escalation_agent is None:
+        raise HTTPException(status_code=503, detail="Escalation agent not initialized")
+    
+    async def generate_results():
+        async for result in escalation_agent.process_batch_iter(request):
+            yield result.model_dump_json() + "\n"
+    
+    return StreamingResponse(generate_results(), media_type="application/x-ndjson")
+
+
 @app.post("/api/v1/escalate/legacy")
-async def process_escalation_legacy(request: dict):
+async def process_escalation_legacy(request: Request):
     """
     Legacy endpoint for backward compatibility
     Accepts simple dictionary format
     
+    The raw body is validated straight into LegacyEscalationRequest so the
+    JSON is parsed once by pydantic-core instead of into an intermediate dict.
+    
     Args:
-        request: Dictionary with questions, answers, confidence_scores, categories
+        request: Body with questions, answers, confidence_scores, categories
     
     Returns:
         Dictionary with escalation decisions
@@ -97,22 +150,16 @@ async def process_escalation_legacy(request: dict):
         raise HTTPException(status_code=503, detail="Escalation agent not initialized")
     
     try:
-        questions = request.get("questions", [])
-        answers = request.get("answers", [])
-        confidence_scores = request.get("confidence_scores", [])
-        categories = request.get("categories", None)
-        
-        if not all([questions, answers, confidence_scores]):
-            raise HTTPException(
-                status_code=422,
-                detail="Missing required fields: questions, answers, confidence_scores"
-            )
-        
+        legacy_request = LegacyEscalationRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=f"Validation error: {str(e)}")
+    
+    try:
         result = await escalation_agent.process_batch_legacy(
-            questions=questions,
-            answers=answers,
-            confidence_scores=confidence_scores,
-            categories=categories
+            questions=legacy_request.questions,
+            answers=legacy_request.answers,
+            confidence_scores=legacy_request.confidence_scores,
+            categories=legacy_request.categories
         )
         
         return JSONResponse(content=result)
@@ -132,11 +179,13 @@ async def health_check():
 
 
 if __name__ == "__main__":
+    import sys
     import uvicorn
     
     uvicorn.run(
         "fastapi_endpoint_example:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=True,
+        loop="uvloop" if sys.platform != "win32" else "auto"
     )
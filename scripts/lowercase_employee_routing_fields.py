@@ -0,0 +1,75 @@
+"""
+One-time migration: lowercase each employee's `department` and `expertise_areas`.
+
+EscalationAgent routes with exact matches on these fields (so the indexes are
+used instead of case-insensitive regex scans), and seed_employees.py now
+writes them lowercase. Employees seeded before that change were stored in
+title case ("Security", "Compliance") and would never match, so existing
+databases need this run once.
+
+Usage:
+    python scripts/lowercase_employee_routing_fields.py            # "Employees", as seeded
+    python scripts/lowercase_employee_routing_fields.py security_qa
+"""
+import asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from dotenv import load_dotenv
+
+from src.core.config import settings
+
+# Load environment variables from .env file
+load_dotenv()
+
+DEFAULT_DB_NAME = "Employees"  # Database seed_employees.py writes to
+
+
+async def lowercase_employee_routing_fields(mongodb_uri: str, db_name: str):
+    """Lowercase department and expertise_areas on every employee, server-side."""
+    client = AsyncIOMotorClient(mongodb_uri)
+    database = client[db_name]
+
+    # An update pipeline rewrites the fields in place, no documents round-trip
+    # here; fields that are missing or not strings are left as they are
+    result = await database.employees.update_many(
+        {},
+        [
+            {
+                "$set": {
+                    "department": {
+                        "$cond": [
+                            {"$eq": [{"$type": "$department"}, "string"]},
+                            {"$toLower": "$department"},
+                            "$department"
+                        ]
+                    },
+                    "expertise_areas": {
+                        "$cond": [
+                            {"$isArray": "$expertise_areas"},
+                            {"$map": {"input": "$expertise_areas", "in": {"$toLower": "$$this"}}},
+                            "$expertise_areas"
+                        ]
+                    }
+                }
+            }
+        ]
+    )
+    print(f"✅ Lowercased routing fields on {result.modified_count}/{result.matched_count} employees")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    mongodb_uri = settings.mongodb_uri or os.getenv("MONGODB_URI")
+
+    if not mongodb_uri:
+        print("Error: MONGODB_URI environment variable not set")
+        print("Please set MONGODB_URI in your .env file or environment")
+        sys.exit(1)
+
+    db_name = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_DB_NAME
+    asyncio.run(lowercase_employee_routing_fields(mongodb_uri, db_name))
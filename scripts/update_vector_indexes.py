@@ -0,0 +1,76 @@
+"""
+Switch the Atlas Vector Search indexes to dotProduct similarity with int8 quantization.
+
+KnowledgeAgent L2-normalizes every query and QA library embedding (see
+src/agents/embedding_cache.py) and Voyage chunk embeddings are unit length,
+so dotProduct ranks exactly like cosine while skipping the per-candidate norm.
+Scores keep the same (1 + x) / 2 scale, so the 0.85 QA threshold is unchanged.
+
+Scalar quantization has Atlas keep an int8 copy of each vector in the index
+(about 4x smaller, and vector search is memory-bound) while the full-fidelity
+float32 vectors stay in the documents. No parallel int8 field is needed.
+
+Usage:
+    python scripts/update_vector_indexes.py
+"""
+import asyncio
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from dotenv import load_dotenv
+
+from src.core.config import settings
+
+# Load environment variables from .env file
+load_dotenv()
+
+EMBEDDING_DIMENSIONS = 1024  # voyage-3 family default output size
+
+# (collection, index name, embedding path, quantization)
+VECTOR_INDEXES = [
+    ("chunks", "chunk_vector_index", "embedding", "scalar"),
+    ("qa_library", "qa_question_index", "question_embedding", "scalar"),
+]
+
+
+async def update_vector_indexes(mongodb_uri: str, db_name: str):
+    """Rebuild each vector index definition with dotProduct similarity and quantization."""
+    client = AsyncIOMotorClient(mongodb_uri)
+    database = client[db_name]
+
+    for collection, index_name, path, quantization in VECTOR_INDEXES:
+        definition = {
+            "fields": [{
+                "type": "vector",
+                "path": path,
+                "numDimensions": EMBEDDING_DIMENSIONS,
+                "similarity": "dotProduct",
+                "quantization": quantization
+            }]
+        }
+        try:
+            await database.command({
+                "updateSearchIndex": collection,
+                "name": index_name,
+                "definition": definition
+            })
+            print(f"✅ {collection}.{index_name} → dotProduct, {quantization} quantization "
+                  f"(Atlas rebuilds it in the background)")
+        except Exception as e:
+            print(f"❌ Could not update {collection}.{index_name}: {e}")
+
+    client.close()
+
+
+if __name__ == "__main__":
+    mongodb_uri = settings.mongodb_uri or os.getenv("MONGODB_URI")
+
+    if not mongodb_uri:
+        print("Error: MONGODB_URI environment variable not set")
+        print("Please set MONGODB_URI in your .env file or environment")
+        sys.exit(1)
+
+    asyncio.run(update_vector_indexes(mongodb_uri, settings.mongodb_db_name))
@@ -9,7 +9,9 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from src.core.database import db
+from src.seed_data import FAKE_EMPLOYEES
 from motor.motor_asyncio import AsyncIOMotorCollection
+from pymongo.errors import BulkWriteError
 from datetime import datetime, timezone
 from dotenv import load_dotenv
 
@@ -17,75 +19,6 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
-# Fake employee data for the startup
-FAKE_EMPLOYEES = [
-    {
-        "name": "Alice Chen",
-        "email": "alice.chen@startup.com",
-        "role": "Chief Security Officer",
-        "department": "Security",
-        "codebase_modules": ["auth", "encryption", "api-security", "rbac"],
-        "expertise_areas": ["authentication", "authorization", "encryption", "data-protection", "compliance"]
-    },
-    {
-        "name": "Bob Martinez",
-        "email": "bob.martinez@startup.com",
-        "role": "Senior Security Engineer",
-        "department": "Security",
-        "codebase_modules": ["auth", "oauth", "jwt"],
-        "expertise_areas": ["authentication", "oauth", "jwt", "session-management"]
-    },
-    {
-        "name": "Carol Johnson",
-        "email": "carol.johnson@startup.com",
-        "role": "Security Compliance Lead",
-        "department": "Compliance",
-        "codebase_modules": ["audit", "logging", "data-retention"],
-        "expertise_areas": ["gdpr", "soc2", "compliance", "data-governance", "audit-trails"]
-    },
-    {
-        "name": "David Kim",
-        "email": "david.kim@startup.com",
-        "role": "Senior Backend Engineer",
-        "department": "Engineering",
-        "codebase_modules": ["api-security", "rate-limiting", "input-validation"],
-        "expertise_areas": ["api-security", "rate-limiting", "input-validation", "infrastructure"]
-    },
-    {
-        "name": "Emma Wilson",
-        "email": "emma.wilson@startup.com",
-        "role": "Security Engineer",
-        "department": "Security",
-        "codebase_modules": ["encryption", "key-management", "secrets"],
-        "expertise_areas": ["encryption", "key-management", "secrets-management", "data-protection"]
-    },
-    {
-        "name": "Frank Liu",
-        "email": "frank.liu@startup.com",
-        "role": "DevOps Engineer",
-        "department": "Engineering",
-        "codebase_modules": ["infrastructure", "deployment", "monitoring"],
-        "expertise_areas": ["infrastructure", "network-security", "devops", "monitoring"]
-    },
-    {
-        "name": "Grace Park",
-        "email": "grace.park@startup.com",
-        "role": "Data Engineer",
-        "department": "Engineering",
-        "codebase_modules": ["database", "data-pipeline", "etl"],
-        "expertise_areas": ["database-security", "data-protection", "data-governance"]
-    },
-    {
-        "name": "Henry Brown",
-        "email": "henry.brown@startup.com",
-        "role": "Compliance Analyst",
-        "department": "Compliance",
-        "codebase_modules": ["compliance-checks", "reporting"],
-        "expertise_areas": ["soc2", "gdpr", "compliance", "documentation"]
-    }
-]
-
-
 async def seed_employees(mongodb_uri: str, db_name: str = "Employees"):
     """Seed the employees collection with fake employee data"""
     await db.connect(mongodb_uri, db_name)
@@ -105,18 +38,31 @@ async def seed_employees(mongodb_uri: str, db_name: str = "Employees"):
     # Clear existing employees (optional - remove if you want to keep existing data)
     # await employees_collection.delete_many({})
     
-    inserted_count = 0
-    for employee_data in FAKE_EMPLOYEES:
-        # Check if employee already exists by email
-        existing = await employees_collection.find_one({"email": employee_data["email"]})
-        
-        if not existing:
-            employee_data["created_at"] = datetime.now(timezone.utc)
-            result = await employees_collection.insert_one(employee_data)
-            inserted_count += 1
-            print(f"Inserted employee: {employee_data['name']} ({employee_data['email']})")
-        else:
-            print(f"Employee already exists: {employee_data['email']}")
+    # The unique index on email (created in db.connect) rejects existing
+    # employees, so a single unordered insert_many replaces the per-employee
+    # find_one + insert_one round trips
+    now = datetime.now(timezone.utc)
+    # Lowercase routing fields so EscalationAgent can match them exactly
+    docs = [
+        {
+            **employee_data,
+            "department": employee_data["department"].lower(),
+            "codebase_modules": list(employee_data["codebase_modules"]),
+            "expertise_areas": [area.lower() for area in employee_data["expertise_areas"]],
+            "created_at": now
+        }
+        for employee_data in FAKE_EMPLOYEES
+    ]
+    try:
+        result = await employees_collection.insert_many(docs, ordered=False)
+        inserted_count = len(result.inserted_ids)
+    except BulkWriteError as bwe:
+        inserted_count = bwe.details["nInserted"]
+        for error in bwe.details.get("writeErrors", []):
+            if error.get("code") == 11000:
+                print(f"Employee already exists: {docs[error['index']]['email']}")
+            else:
+                print(f"Failed to insert {docs[error['index']]['email']}: {error.get('errmsg')}")
     
     print(f"\nTotal employees seeded: {inserted_count}/{len(FAKE_EMPLOYEES)}")
     
@@ -143,4 +89,11 @@ if __name__ == "__main__":
     print(f"Using MongoDB URI: {mongodb_uri[:50]}...")
     print(f"Using database name: {db_name}\n")
     
+    # uvloop has lower per-task overhead than the default loop (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     asyncio.run(seed_employees(mongodb_uri, db_name))
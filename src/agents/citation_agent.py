@@ -1,10 +1,12 @@
 """
 Citation Agent - Extracts relevant citations from context documents.
 """
+import asyncio
 import json
-from typing import List
+from typing import List, Optional
 
-from src.core.llm_client import fireworks_client
+from src.core.config import settings
+from src.core.llm_client import FireworksClient, fireworks_client
 from src.models.common import Question, ContextDocument, Citation
 from src.models.api import CitationResult
 
@@ -38,10 +40,15 @@ Output your response in the following JSON format:
 class CitationAgent:
     """Agent responsible for finding and extracting citations from context documents."""
     
-    def __init__(self):
-        self.client = fireworks_client
+    def __init__(self, client: Optional[FireworksClient] = None):
+        """
+        Args:
+            client: Fireworks client to use; defaults to the process-wide pooled one
+        """
+        self.client = client or fireworks_client
+        self._semaphore = asyncio.Semaphore(settings.max_concurrent_llm_calls)
     
-    def _format_context(self, documents: List[ContextDocument]) -> str:
+    def format_context(self, documents: List[ContextDocument]) -> str:
         """Format context documents for the prompt."""
         formatted = []
         for doc in documents:
@@ -59,7 +66,8 @@ Content:
     async def find_citations(
         self,
         question: Question,
-        context_documents: List[ContextDocument]
+        context_documents: List[ContextDocument],
+        context_text: Optional[str] = None
     ) -> CitationResult:
         """
         Find relevant citations for a single question.
@@ -67,11 +75,14 @@ Content:
         Args:
             question: The question to find citations for
             context_documents: List of context documents to search
+            context_text: format_context(context_documents), if already built;
+                lets callers format documents shared by many questions once
             
         Returns:
             CitationResult with list of relevant citations
         """
-        context_text = self._format_context(context_documents)
+        if context_text is None:
+            context_text = self.format_context(context_documents)
         
         user_prompt = f"""Find relevant citations from the context documents for the following question:
 
@@ -89,7 +100,8 @@ Analyze the documents and provide citations in JSON format."""
             {"role": "user", "content": user_prompt}
         ]
         
-        response = await self.client.chat_completion(messages, temperature=0.3)
+        async with self._semaphore:
+            response = await self.client.chat_completion(messages, temperature=0.3)
         result = self.client.parse_json_response(response)
         
         citations = [
@@ -113,18 +125,18 @@ Analyze the documents and provide citations in JSON format."""
         context_documents: List[ContextDocument]
     ) -> List[CitationResult]:
         """
-        Find citations for a batch of questions.
+        Find citations for a batch of questions concurrently.
         
         Args:
             questions: List of questions (max 5 recommended)
             context_documents: List of context documents
             
         Returns:
-            List of CitationResults for each question
+            List of CitationResults for each question, in question order
         """
-        results = []
-        for question in questions:
-            result = await self.find_citations(question, context_documents)
-            results.append(result)
-        return results
+        context_text = self.format_context(context_documents)
+        return list(await asyncio.gather(*(
+            self.find_citations(question, context_documents, context_text)
+            for question in questions
+        )))
 
@@ -1,10 +1,12 @@
 """
 Drafting Agent - Generates answers with confidence scores based on citations.
 """
+import asyncio
 import json
-from typing import List
+from typing import List, Optional
 
-from src.core.llm_client import fireworks_client
+from src.core.config import settings
+from src.core.llm_client import FireworksClient, fireworks_client
 from src.models.common import Question, Citation, ConfidenceLevel
 from src.models.api import CitationResult, DraftResult
 
@@ -37,11 +39,27 @@ Output your response in the following JSON format:
 }"""
 
 
+# Constant system message shared by every drafting request
+DRAFTING_SYSTEM_MESSAGE = {"role": "system", "content": DRAFTING_SYSTEM_PROMPT}
+
+# Maps the LLM's string confidence to the enum
+CONFIDENCE_LEVELS = {
+    "high": ConfidenceLevel.HIGH,
+    "medium": ConfidenceLevel.MEDIUM,
+    "low": ConfidenceLevel.LOW
+}
+
+
 class DraftingAgent:
     """Agent responsible for drafting answers based on citations."""
     
-    def __init__(self):
-        self.client = fireworks_client
+    def __init__(self, client: Optional[FireworksClient] = None):
+        """
+        Args:
+            client: Fireworks client to use; defaults to the process-wide pooled one
+        """
+        self.client = client or fireworks_client
+        self._semaphore = asyncio.Semaphore(settings.max_concurrent_llm_calls)
     
     def _format_citations(self, citations: List[Citation]) -> str:
         """Format citations for the prompt."""
@@ -87,24 +105,23 @@ AVAILABLE CITATIONS:
 Based on these citations, provide a comprehensive answer with confidence assessment in JSON format."""
 
         messages = [
-            {"role": "system", "content": DRAFTING_SYSTEM_PROMPT},
+            DRAFTING_SYSTEM_MESSAGE,
             {"role": "user", "content": user_prompt}
         ]
         
-        response = await self.client.chat_completion(messages, temperature=0.4)
+        async with self._semaphore:
+            response = await self.client.chat_completion(
+                messages,
+                temperature=0.4,
+                response_format={"type": "json_object"},
+                stream=settings.fireworks_stream_responses
+            )
         result = self.client.parse_json_response(response)
         
-        # Map string confidence to enum
-        confidence_map = {
-            "high": ConfidenceLevel.HIGH,
-            "medium": ConfidenceLevel.MEDIUM,
-            "low": ConfidenceLevel.LOW
-        }
-        
         return DraftResult(
             question_id=question.question_id,
             answer=result["answer"],
-            confidence=confidence_map.get(result["confidence"].lower(), ConfidenceLevel.MEDIUM),
+            confidence=CONFIDENCE_LEVELS.get(result["confidence"].lower(), ConfidenceLevel.MEDIUM),
             confidence_score=result["confidence_score"],
             reasoning=result.get("reasoning")
         )
@@ -115,25 +132,37 @@ Based on these citations, provide a comprehensive answer with confidence assessm
         citation_results: List[CitationResult]
     ) -> List[DraftResult]:
         """
-        Draft answers for a batch of questions.
+        Draft answers for a batch of questions concurrently.
         
         Args:
             questions: List of questions
-            citation_results: Corresponding citation results from Citation Agent
+            citation_results: Corresponding citation results from Citation Agent,
+                normally in the same order as questions (as find_citations_batch returns them)
             
         Returns:
             List of DraftResults for each question
         """
-        citation_map = {cr.question_id: cr for cr in citation_results}
+        aligned = len(citation_results) == len(questions) and all(
+            cr.question_id == q.question_id for q, cr in zip(questions, citation_results)
+        )
         
-        results = []
-        for question in questions:
-            citation_result = citation_map.get(
-                question.question_id,
-                CitationResult(question_id=question.question_id, citations=[])
-            )
-            result = await self.draft_answer(question, citation_result)
-            results.append(result)
+        if aligned:
+            pairs = list(zip(questions, citation_results))
+        else:
+            # Out-of-order or partial results: match by question_id instead
+            citation_map = {cr.question_id: cr for cr in citation_results}
+            pairs = []
+            for question in questions:
+                citation_result = citation_map.get(question.question_id)
+                if citation_result is None:
+                    print(f"⚠️  No citations for question {question.question_id}; drafting without evidence")
+                    citation_result = CitationResult(question_id=question.question_id, citations=[])
+                pairs.append((question, citation_result))
+        
+        tasks = [
+            self.draft_answer(question, citation_result)
+            for question, citation_result in pairs
+        ]
         
-        return results
+        return list(await asyncio.gather(*tasks))
 
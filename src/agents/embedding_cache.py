@@ -0,0 +1,181 @@
+"""
+Embedding Cache - Reuses Voyage query embeddings across questionnaires.
+
+Questionnaires repeat a lot of boilerplate ("Do you encrypt data at rest?"),
+so query embeddings are cached in two tiers:
+1. In-process LRU (OrderedDict) for sub-millisecond hits
+2. MongoDB `embedding_cache` collection shared across processes and restarts
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+from pymongo import UpdateOne
+
+VOYAGE_MAX_BATCH = 128  # Voyage embed() accepts at most 128 inputs per call
+
+
+def _unit_vectors(embeddings: List[List[float]]) -> List[List[float]]:
+    """
+    L2-normalize embeddings so the vector indexes can use dotProduct.
+    
+    Voyage vectors are already close to unit length; normalizing here makes
+    dot product and cosine rank identically without relying on that.
+    """
+    vectors = np.asarray(embeddings, dtype=np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True) + 1e-12
+    return vectors.tolist()
+
+
+class CachedEmbedder:
+    """Voyage query embedder backed by an LRU and an optional MongoDB collection."""
+    
+    def __init__(
+        self,
+        voyage_client,
+        model: str,
+        collection=None,
+        capacity: int = 2000,
+        ttl: int = 86400,
+        input_type: str = "query"
+    ):
+        """
+        Args:
+            voyage_client: voyageai.AsyncClient used for cache misses
+            model: Voyage model name (part of the cache key)
+            collection: Motor collection for the persistent tier, or None
+            capacity: Max embeddings kept in memory
+            ttl: Seconds before a cached embedding is recomputed
+            input_type: Voyage input_type (part of the cache key)
+        """
+        self.voyage = voyage_client
+        self.model = model
+        self.collection = collection
+        self.capacity = capacity
+        self.ttl = ttl
+        self.input_type = input_type
+        self._lru: "OrderedDict[str, Tuple[float, List[float]]]" = OrderedDict()
+        self._hits = 0
+        self._persistent_hits = 0
+        self._misses = 0
+        self._ttl_index_ready = False
+    
+    def _key(self, text: str) -> str:
+        """Cache key: trivial case/whitespace differences share an embedding."""
+        normalized = text.lower().strip()
+        return hashlib.sha256(f"{normalized}|{self.model}|{self.input_type}".encode()).hexdigest()
+    
+    async def embed(self, text: str) -> List[float]:
+        """Embed a single text."""
+        return (await self.embed_many([text]))[0]
+    
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed texts, calling Voyage only for those not already cached.
+        
+        Args:
+            texts: Texts to embed
+        
+        Returns:
+            One embedding per text, in input order
+        """
+        keys = [self._key(text) for text in texts]
+        embeddings: List[Optional[List[float]]] = [None] * len(texts)
+        now = time.monotonic()
+        
+        # Tier 1: in-process LRU
+        for i, key in enumerate(keys):
+            entry = self._lru.get(key)
+            if entry and entry[0] > now:
+                self._lru.move_to_end(key)
+                embeddings[i] = entry[1]
+                self._hits += 1
+        
+        # Tier 2: MongoDB, one query for all remaining keys
+        missing = [i for i, e in enumerate(embeddings) if e is None]
+        if missing and self.collection is not None:
+            try:
+                docs = await self.collection.find(
+                    {"_id": {"$in": list({keys[i] for i in missing})}}
+                ).to_list(length=None)
+                found = {doc["_id"]: doc["vec"] for doc in docs}
+            except Exception as e:
+                print(f"⚠️  Embedding cache lookup failed: {e}")
+                found = {}
+            for i in missing:
+                vec = found.get(keys[i])
+                if vec is not None:
+                    embeddings[i] = vec
+                    self._remember(keys[i], vec)
+                    self._persistent_hits += 1
+        
+        # Voyage for the rest, one call per distinct text
+        missing = [i for i, e in enumerate(embeddings) if e is None]
+        if missing:
+            first_by_key: Dict[str, int] = {}
+            for i in missing:
+                first_by_key.setdefault(keys[i], i)
+            to_embed = list(first_by_key.items())
+            self._misses += len(to_embed)
+            
+            computed: Dict[str, List[float]] = {}
+            for start in range(0, len(to_embed), VOYAGE_MAX_BATCH):
+                chunk = to_embed[start:start + VOYAGE_MAX_BATCH]
+                result = await self.voyage.embed(
+                    [texts[i] for _, i in chunk],
+                    model=self.model,
+                    input_type=self.input_type
+                )
+                for (key, _), vec in zip(chunk, _unit_vectors(result.embeddings)):
+                    computed[key] = vec
+                    self._remember(key, vec)
+            
+            for i in missing:
+                embeddings[i] = computed[keys[i]]
+            await self._persist(computed)
+        
+        return embeddings
+    
+    def _remember(self, key: str, vec: List[float]):
+        """Store in the LRU, evicting the least recently used entry when full."""
+        self._lru[key] = (time.monotonic() + self.ttl, vec)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.capacity:
+            self._lru.popitem(last=False)
+    
+    async def _persist(self, computed: Dict[str, List[float]]):
+        """Write freshly computed embeddings to MongoDB (best effort)."""
+        if self.collection is None or not computed:
+            return
+        
+        ts = datetime.now(timezone.utc)
+        try:
+            if not self._ttl_index_ready:
+                # MongoDB drops entries once they pass the TTL; created on first
+                # write so constructing the agent doesn't need a live server
+                await self.collection.create_index("ts", expireAfterSeconds=self.ttl)
+                self._ttl_index_ready = True
+            await self.collection.bulk_write(
+                [
+                    UpdateOne({"_id": key}, {"$set": {"vec": vec, "ts": ts}}, upsert=True)
+                    for key, vec in computed.items()
+                ],
+                ordered=False
+            )
+        except Exception as e:
+            print(f"⚠️  Embedding cache write failed: {e}")
+    
+    def stats(self) -> dict:
+        """Hit/miss counters for observability."""
+        total = self._hits + self._persistent_hits + self._misses
+        return {
+            "memory_hits": self._hits,
+            "persistent_hits": self._persistent_hits,
+            "misses": self._misses,
+            "hit_rate": (self._hits + self._persistent_hits) / total if total else 0.0,
+            "size": len(self._lru)
+        }
@@ -2,15 +2,20 @@
 Escalation Agent - Routes low-confidence answers to appropriate humans.
 Accepts citation agentic AI request format.
 """
-from typing import List, Dict, Optional
+from dataclasses import dataclass
+from typing import List, Dict, Optional, Tuple
+import asyncio
+import hashlib
 import httpx
 import json
+import re
+import time
 
 from src.core.config import settings
 from src.core.database import db
+from src.core.llm_client import FireworksClient, json_dumps, json_loads
 from src.models.common import Citation
 from src.models.api import (
-    QuestionAnswer,
     BatchResult,
     EscalationResult,
     EscalationResponse,
@@ -18,21 +23,277 @@ from src.models.api import (
 from src.models.escalation_request import (
     EscalationRequest,
     AnswerItem,
-    Citation as EscalationCitation,
 )
 
 
+# Optional Rust (Tokio + reqwest) batch HTTP client for large escalation fan-outs
+try:
+    import rusty_req
+except ImportError:
+    rusty_req = None
+
+# Employee routing rarely changes, so lookups are cached per (category, department)
+ROUTE_CACHE_TTL_SECONDS = 300
+ROUTE_CACHE_MAXSIZE = 256
+
+# Only the fields routing ranks on or returns
+EMPLOYEE_ROUTING_PROJECTION = {
+    "name": 1,
+    "email": 1,
+    "role": 1,
+    "title": 1,
+    "department": 1,
+    "expertise_areas": 1
+}
+
+# Firework AI decisions are reused for identical review inputs, except for
+# compliance-sensitive categories which always get a fresh review
+DECISION_CACHE_TTL_SECONDS = 3600
+DECISION_CACHE_MAXSIZE = 10_000
+UNCACHED_CATEGORIES = {"compliance", "gdpr", "hipaa"}
+
+# Models that return 404 are skipped for this long before being retried
+MODEL_DEMOTION_SECONDS = 300
+
+# Budget for each model attempt of a Firework AI review, so a hung model
+# leaves time to try the fallbacks (the 30s client timeout is per read)
+ESCALATION_REVIEW_TIMEOUT_SECONDS = 20.0
+
+# Answers reviewed per batched Firework AI request
+ESCALATION_REVIEW_BATCH_SIZE = 10
+
+# Keywords that identify an answer's category, in priority order
+CATEGORY_KEYWORDS = {
+    "encryption": ["encrypt", "encryption", "encrypted", "aes", "kms", "key management"],
+    "authentication": ["auth", "authenticate", "login", "credentials", "password", "jwt", "token", "mfa"],
+    "authorization": ["authorize", "permission", "access control", "rbac", "role"],
+    "compliance": ["compliance", "gdpr", "soc2", "hipaa", "iso 27001", "certification"],
+    "data_protection": ["data protection", "pii", "personal data", "data privacy"],
+    "api_security": ["api", "endpoint", "rate limit", "api key"],
+    "network_security": ["network", "firewall", "vpn", "ssl", "tls"],
+    "infrastructure": ["infrastructure", "cloud", "aws", "azure", "gcp", "server"],
+    "database": ["database", "sql", "nosql", "backup", "replication"],
+    "incident_response": ["incident", "breach", "notification", "response"],
+}
+_CATEGORY_PRIORITY = {category: i for i, category in enumerate(CATEGORY_KEYWORDS)}
+
+# Zero-width lookahead so every keyword occurrence is reported, even overlapping ones;
+# at each position the alternation prefers the higher-priority category
+_CATEGORY_KEYWORD_RE = re.compile("(?=" + "|".join(
+    f"(?P<{category}>{'|'.join(re.escape(k) for k in keywords)})"
+    for category, keywords in CATEGORY_KEYWORDS.items()
+) + ")")
+
+ESCALATION_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are an expert security analyst. Respond only with valid JSON."
+}
+
+# Request settings shared by every escalation review (JSON mode, low temperature)
+ESCALATION_BASE_PAYLOAD = {
+    "temperature": 0.3,
+    "response_format": {"type": "json_object"}
+}
+
+CATEGORY_TO_DEPARTMENT = {
+    "authentication": "Security",
+    "authorization": "Security",
+    "encryption": "Security",
+    "data_protection": "Security",
+    "data_handling": "Security",
+    "access_control": "Security",
+    "api_security": "Engineering",
+    "network_security": "Security",
+    "compliance": "Compliance",
+    "incident_response": "Security",
+    "logging": "Engineering",
+    "infrastructure": "Engineering",
+    "database": "Engineering",
+}
+
+# One alternation over every key; the named group that matched is the key
+_CATEGORY_RE = re.compile("|".join(f"(?P<{key}>{re.escape(key)})" for key in CATEGORY_TO_DEPARTMENT))
+
+
+class _JsonObjectTracker:
+    """Tracks brace depth across streamed text to spot the end of the first JSON object."""
+    
+    __slots__ = ("depth", "in_string", "escaped", "started")
+    
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.started = False
+    
+    def feed(self, text: str) -> int:
+        """Consume more text; the index just past the object's closing brace, or -1."""
+        for i, char in enumerate(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = True
+            elif char == "{":
+                self.depth += 1
+                self.started = True
+            elif char == "}":
+                self.depth -= 1
+                if self.started and self.depth == 0:
+                    return i + 1
+        return -1
+
+
+@dataclass(slots=True)
+class _NormalizedAnswer:
+    """An answer from either entry point, in the shape the escalation pipeline needs."""
+    question_id: str
+    question_text: str
+    answer: str
+    confidence: str
+    confidence_score: float
+    category: Optional[str]
+    citations: List[Citation]
+    reasoning: Optional[str] = None
+    # Set when an upstream agent already decided the answer must escalate
+    flagged_reason: Optional[str] = None
+    # Review prompt context and decision cache key, set once by _review_with_firework
+    citations_context: str = ""
+    decision_key: Optional[str] = None
+
+
 class EscalationAgent:
     """Agent that determines if human escalation is needed and routes to appropriate employees."""
     
     def __init__(
         self, 
         firework_api_key: Optional[str] = None, 
-        confidence_threshold: float = 0.7
+        confidence_threshold: float = 0.7,
+        skip_llm_on_clear_threshold: bool = True,
+        llm: Optional[FireworksClient] = None
     ):
         self.firework_api_key = firework_api_key or settings.fireworks_api_key
         self.confidence_threshold = confidence_threshold
+        # Below-threshold answers escalate either way; set False to still get
+        # a Firework AI reason and department for them
+        self.skip_llm_on_clear_threshold = skip_llm_on_clear_threshold
         self.firework_base_url = "https://api.fireworks.ai/inference/v1"
+        self._semaphore = asyncio.Semaphore(settings.max_concurrent_llm_calls)
+        self._route_cache: Dict[Tuple[Optional[str], str], Tuple[float, asyncio.Task]] = {}
+        self._decision_cache: Dict[str, Tuple[float, Dict]] = {}
+        
+        # Last model that answered, and models to skip until their expiry after a 404
+        self._preferred_model: Optional[str] = None
+        self._demoted_models: Dict[str, float] = {}
+        
+        # In-process routing table, populated by warm_routing_table()
+        self._routing_table_loaded = False
+        self._routing_table_retry_at = 0.0
+        self._by_expertise: Dict[str, Dict] = {}
+        self._by_department: Dict[str, Dict] = {}
+        self._any_employee: Optional[Dict] = None
+        self._employee_watch_task: Optional[asyncio.Task] = None
+        
+        # Built once and shared by the httpx client and rusty_req batches
+        self._headers = {
+            "Authorization": f"Bearer {self.firework_api_key}",
+            "Content-Type": "application/json"
+        }
+        
+        # Escalation checks reuse the given FireworksClient's HTTP/2 pool when it
+        # authenticates with the same key; otherwise this agent pools its own
+        self._llm = llm if llm is not None and llm.api_key == self.firework_api_key else None
+        self._http: Optional[httpx.AsyncClient] = None
+        if self._llm is None:
+            self._http = httpx.AsyncClient(
+                timeout=30.0,
+                headers=self._headers,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=settings.fireworks_max_connections,
+                    max_keepalive_connections=settings.fireworks_max_keepalive_connections
+                )
+            )
+    
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Pooled Firework AI HTTP client: the shared FireworksClient's, or this agent's own."""
+        return self._llm.http if self._llm is not None else self._http
+    
+    async def aclose(self):
+        """Close this agent's own HTTP client (not a shared one) and stop the employee watcher."""
+        if self._employee_watch_task:
+            self._employee_watch_task.cancel()
+            self._employee_watch_task = None
+        if self._http is not None:
+            await self._http.aclose()
+    
+    async def warm_routing_table(self):
+        """
+        Load employees into an in-process routing table and keep it fresh.
+        
+        Once loaded, _route_to_employee is served from memory. A change stream
+        reloads the table when the employees collection changes.
+        """
+        if db.database is None:
+            return
+        
+        await self._load_routing_table()
+        if self._employee_watch_task is None:
+            self._employee_watch_task = asyncio.create_task(self._watch_employees())
+    
+    async def _ensure_routing_table(self):
+        """
+        Load the routing table on first use when warm_routing_table wasn't called at startup.
+        
+        A failed load is retried after ROUTE_CACHE_TTL_SECONDS; until then
+        _route_to_employee falls back to cached per-item lookups.
+        """
+        if self._routing_table_loaded or time.monotonic() < self._routing_table_retry_at:
+            return
+        try:
+            await self.warm_routing_table()
+        except Exception as e:
+            self._routing_table_retry_at = time.monotonic() + ROUTE_CACHE_TTL_SECONDS
+            print(f"⚠️  Employee routing table load failed ({str(e)[:50]}); using per-item lookups")
+    
+    async def _load_routing_table(self):
+        """Rebuild the expertise/department routing maps from MongoDB."""
+        employees = await db.database.employees.find(
+            {},
+            projection=EMPLOYEE_ROUTING_PROJECTION
+        ).to_list(length=None)
+        
+        # First employee wins, matching find_one's natural-order pick
+        by_expertise: Dict[str, Dict] = {}
+        by_department: Dict[str, Dict] = {}
+        for doc in employees:
+            for area in doc.get("expertise_areas", []):
+                by_expertise.setdefault(area.lower(), doc)
+            if doc.get("department"):
+                by_department.setdefault(doc["department"].lower(), doc)
+        
+        self._by_expertise = by_expertise
+        self._by_department = by_department
+        self._any_employee = employees[0] if employees else None
+        self._routing_table_loaded = True
+        print(f"✅ Employee routing table loaded ({len(employees)} employees)")
+    
+    async def _watch_employees(self):
+        """Reload the routing table whenever the employees collection changes."""
+        try:
+            async with db.database.employees.watch() as stream:
+                async for _ in stream:
+                    await self._load_routing_table()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Change streams need a replica set; standalone servers keep the startup snapshot
+            print(f"⚠️  Employee change stream unavailable ({e}); routing table won't auto-refresh")
     
     async def process_batch(
         self,
@@ -47,73 +308,16 @@ class EscalationAgent:
         Returns:
             EscalationResponse with escalation decisions and employee routing info
         """
-        escalation_results: List[EscalationResult] = []
-        
-        for batch in request.batches:
-            for answer_item in batch.answers:
-                # Extract category from citations or question text
-                category = self._extract_category_from_answer(answer_item)
-                
-                # Check threshold-based escalation
-                threshold_escalation = answer_item.confidence_score < self.confidence_threshold
-                
-                # Use Firework AI to make intelligent escalation decision
-                citations_context = self._format_citations_context_from_escalation(answer_item.citations)
-                firework_decision = await self._check_with_firework(
-                    answer_item.question_text,
-                    answer_item.answer,
-                    answer_item.confidence_score,
-                    category,
-                    citations_context=citations_context,
-                    reasoning=answer_item.reasoning
-                )
-                
-                # Final decision: escalate if either threshold or Firework says so
-                requires_escalation = threshold_escalation or firework_decision.get("requires_escalation", False)
-                
-                routed_to = None
-                department = None
-                escalation_reason = None
-                
-                if requires_escalation:
-                    routed_to = await self._route_to_employee(
-                        answer_item.question_text,
-                        category,
-                        firework_decision.get("department")
-                    )
-                    department = routed_to.get("department") if routed_to else None
-                    escalation_reason = firework_decision.get(
-                        "reason",
-                        f"Low confidence score: {answer_item.confidence_score:.2f}"
-                    )
-                
-                # Convert citations to common Citation format
-                citations = [
-                    Citation(
-                        doc_id=c.doc_id,
-                        doc_title=c.doc_title,
-                        relevant_excerpt=c.relevant_excerpt,
-                        relevance_score=c.relevance_score
-                    ) for c in answer_item.citations
-                ]
-                
-                escalation_results.append(EscalationResult(
-                    question_id=answer_item.question_id,
-                    question_text=answer_item.question_text,
-                    answer=answer_item.answer,
-                    confidence=answer_item.confidence,
-                    confidence_score=answer_item.confidence_score,
-                    requires_escalation=requires_escalation,
-                    escalation_reason=escalation_reason,
-                    routed_to=routed_to,
-                    department=department,
-                    category=category,
-                    citations=citations
-                ))
+        items = [
+            self._normalize_answer_item(answer_item)
+            for batch in request.batches
+            for answer_item in batch.answers
+        ]
+        escalation_results = await self._run_pipeline(items)
         
         escalations_required = sum(1 for r in escalation_results if r.requires_escalation)
         
-        return EscalationResponse(
+        return EscalationResponse.model_construct(
             request_id=request.request_id,
             total_questions=request.total_questions,
             escalations_required=escalations_required,
@@ -136,68 +340,30 @@ class EscalationAgent:
         Returns:
             EscalationResponse with escalation decisions and routing info
         """
-        escalation_results: List[EscalationResult] = []
-        
-        for batch in batches:
-            for answer in batch.answers:
-                # Check if already flagged for escalation
-                if answer.needs_escalation:
-                    requires_escalation = True
-                    firework_decision = {
-                        "requires_escalation": True,
-                        "reason": answer.escalation_reason or "Flagged by Knowledge Agent",
-                        "department": self._suggest_department_from_category(answer.category)
-                    }
-                else:
-                    # Check threshold-based escalation
-                    threshold_escalation = answer.confidence_score < self.confidence_threshold
-                    
-                    # Use Firework AI for intelligent escalation decision
-                    firework_decision = await self._check_with_firework(
-                        answer.question_text,
-                        answer.answer,
-                        answer.confidence_score,
-                        answer.category,
-                        citations_context=self._format_citations_context(answer.citations),
-                        reasoning=answer.reasoning
-                    )
-                    
-                    requires_escalation = threshold_escalation or firework_decision.get("requires_escalation", False)
-                
-                routed_to = None
-                department = None
-                escalation_reason = None
-                
-                if requires_escalation:
-                    routed_to = await self._route_to_employee(
-                        answer.question_text,
-                        answer.category,
-                        firework_decision.get("department")
-                    )
-                    department = routed_to.get("department") if routed_to else None
-                    escalation_reason = firework_decision.get(
-                        "reason",
-                        f"Low confidence score: {answer.confidence_score:.2f}"
-                    )
-                
-                escalation_results.append(EscalationResult(
-                    question_id=answer.question_id,
-                    question_text=answer.question_text,
-                    answer=answer.answer,
-                    confidence=answer.confidence.value,
-                    confidence_score=answer.confidence_score,
-                    requires_escalation=requires_escalation,
-                    escalation_reason=escalation_reason,
-                    routed_to=routed_to,
-                    department=department,
-                    category=answer.category,
-                    citations=answer.citations
-                ))
+        items = [
+            _NormalizedAnswer(
+                question_id=answer.question_id,
+                question_text=answer.question_text,
+                answer=answer.answer,
+                confidence=answer.confidence.value,
+                confidence_score=answer.confidence_score,
+                category=answer.category,
+                citations=answer.citations,
+                reasoning=answer.reasoning,
+                flagged_reason=(
+                    answer.escalation_reason or "Flagged by Knowledge Agent"
+                    if answer.needs_escalation else None
+                )
+            )
+            for batch in batches
+            for answer in batch.answers
+        ]
+        escalation_results = await self._run_pipeline(items)
         
         total_questions = sum(len(b.answers) for b in batches)
         escalations_required = sum(1 for r in escalation_results if r.requires_escalation)
         
-        return EscalationResponse(
+        return EscalationResponse.model_construct(
             request_id=request_id,
             total_questions=total_questions,
             escalations_required=escalations_required,
@@ -205,85 +371,273 @@ class EscalationAgent:
             status="completed"
         )
     
-    def _extract_category_from_answer(self, answer_item: AnswerItem) -> Optional[str]:
-        """Extract category from citations, question text, or answer content."""
-        question_lower = answer_item.question_text.lower()
-        answer_lower = answer_item.answer.lower()
-        
-        category_keywords = {
-            "encryption": ["encrypt", "encryption", "encrypted", "aes", "kms", "key management"],
-            "authentication": ["auth", "authenticate", "login", "credentials", "password", "jwt", "token", "mfa"],
-            "authorization": ["authorize", "permission", "access control", "rbac", "role"],
-            "compliance": ["compliance", "gdpr", "soc2", "hipaa", "iso 27001", "certification"],
-            "data_protection": ["data protection", "pii", "personal data", "data privacy"],
-            "api_security": ["api", "endpoint", "rate limit", "api key"],
-            "network_security": ["network", "firewall", "vpn", "ssl", "tls"],
-            "infrastructure": ["infrastructure", "cloud", "aws", "azure", "gcp", "server"],
-            "database": ["database", "sql", "nosql", "backup", "replication"],
-            "incident_response": ["incident", "breach", "notification", "response"],
-        }
+    def _normalize_answer_item(self, answer_item: AnswerItem) -> _NormalizedAnswer:
+        """Convert a citation-agent answer into the pipeline's answer shape."""
+        return _NormalizedAnswer(
+            question_id=answer_item.question_id,
+            question_text=answer_item.question_text,
+            answer=answer_item.answer,
+            confidence=answer_item.confidence,
+            confidence_score=answer_item.confidence_score,
+            # Extract category from citations or question text
+            category=self._extract_category_from_answer(answer_item),
+            # Convert citations to common Citation format
+            citations=[
+                Citation(
+                    doc_id=c.doc_id,
+                    doc_title=c.doc_title,
+                    relevant_excerpt=c.relevant_excerpt,
+                    relevance_score=c.relevance_score
+                ) for c in answer_item.citations
+            ],
+            reasoning=answer_item.reasoning
+        )
+    
+    async def _run_pipeline(self, items: List[_NormalizedAnswer]) -> List[EscalationResult]:
+        """
+        Decide, review and route answers from either entry point.
+        
+        Args:
+            items: Answers normalized by process_batch or process_answers
+        
+        Returns:
+            One EscalationResult per item, in input order
+        """
+        # Flagged and below-threshold answers escalate regardless of review
+        decisions: List[Optional[Dict]] = [self._forced_decision(item) for item in items]
+        
+        # Repeated sub-questions share one review; only the first item of
+        # each identical (question, answer, confidence, category) is sent.
+        # Forced decisions are settled above and confidence is compared
+        # exactly, so items either side of the threshold never share one
+        unique: Dict[Tuple[str, str, float, Optional[str]], List[int]] = {}
+        for i, (item, decision) in enumerate(zip(items, decisions)):
+            if decision is None:
+                key = (item.question_text, item.answer, item.confidence_score, item.category)
+                unique.setdefault(key, []).append(i)
         
-        # Check question first
-        for category, keywords in category_keywords.items():
-            if any(keyword in question_lower for keyword in keywords):
-                return category
+        reviews = await self._review_with_firework([items[indices[0]] for indices in unique.values()])
+        for indices, decision in zip(unique.values(), reviews):
+            for i in indices:
+                decisions[i] = decision
         
-        # Check answer content
-        for category, keywords in category_keywords.items():
-            if any(keyword in answer_lower for keyword in keywords):
-                return category
+        # A second-opinion review can't overrule the confidence threshold
+        for i, item in enumerate(items):
+            if item.confidence_score < self.confidence_threshold and not decisions[i].get("requires_escalation"):
+                decisions[i] = self._below_threshold_decision(item.confidence_score, item.category)
         
-        # Check citation titles
-        for citation in answer_item.citations:
-            citation_lower = citation.doc_title.lower()
-            for category, keywords in category_keywords.items():
-                if any(keyword in citation_lower for keyword in keywords):
-                    return category
+        # Route every escalated answer concurrently, from one employees
+        # query rather than per-item lookups (which remain the fallback
+        # when the table can't be loaded)
+        if any(decision.get("requires_escalation", False) for decision in decisions):
+            await self._ensure_routing_table()
+        async with asyncio.TaskGroup() as tg:
+            route_tasks = [
+                tg.create_task(self._route_or_none(item, decision.get("department")))
+                if decision.get("requires_escalation", False) else None
+                for item, decision in zip(items, decisions)
+            ]
+        routes = [task.result() if task else None for task in route_tasks]
+        
+        return [
+            self._build_result(item, decision, routed_to)
+            for item, decision, routed_to in zip(items, decisions, routes)
+        ]
+    
+    def _forced_decision(self, item: _NormalizedAnswer) -> Optional[Dict]:
+        """Decision for answers that escalate without review, or None if review is needed."""
+        if item.flagged_reason:
+            return {
+                "requires_escalation": True,
+                "reason": item.flagged_reason,
+                "department": self._suggest_department_from_category(item.category)
+            }
+        
+        # Below threshold always escalates, so only ask Firework AI when it can change the outcome
+        if self.skip_llm_on_clear_threshold and item.confidence_score < self.confidence_threshold:
+            return self._below_threshold_decision(item.confidence_score, item.category)
         
         return None
     
-    def _format_citations_context(self, citations: List[Citation]) -> str:
-        """Format citations for context in Firework AI prompt."""
-        if not citations:
-            return "No citations provided."
+    async def _review_with_firework(self, items: List[_NormalizedAnswer]) -> List[Dict]:
+        """Firework AI decisions for answers that need review, in input order."""
+        for item in items:
+            item.citations_context = self._format_citations_context(item.citations)
+            item.decision_key = self._decision_cache_key(
+                item.question_text,
+                item.answer,
+                item.confidence_score,
+                item.category,
+                item.citations_context,
+                item.reasoning
+            )
+        
+        decisions: List[Optional[Dict]] = [None] * len(items)
+        if rusty_req is not None and items:
+            decisions = await self._prefetch_decisions(items)
+        
+        # Anything rusty_req didn't settle is reviewed in chunks of one request each
+        pending = [i for i, decision in enumerate(decisions) if decision is None]
+        chunks = [
+            pending[i:i + ESCALATION_REVIEW_BATCH_SIZE]
+            for i in range(0, len(pending), ESCALATION_REVIEW_BATCH_SIZE)
+        ]
+        async with asyncio.TaskGroup() as tg:
+            reviews = [
+                tg.create_task(self._check_batch_with_firework([items[i] for i in chunk]))
+                for chunk in chunks
+            ]
+        for chunk, review in zip(chunks, reviews):
+            for i, decision in zip(chunk, review.result()):
+                decisions[i] = decision
+        
+        return decisions
+    
+    async def _prefetch_decisions(self, items: List[_NormalizedAnswer]) -> List[Optional[Dict]]:
+        """Fetch one Firework AI decision per item via rusty_req; None where it failed."""
+        prefetched: List[Optional[Dict]] = [self._cached_decision(item.decision_key) for item in items]
         
-        context_parts = []
-        for i, citation in enumerate(citations, 1):
-            excerpt = citation.relevant_excerpt[:200] + "..." if len(citation.relevant_excerpt) > 200 else citation.relevant_excerpt
-            context_parts.append(
-                f"Citation {i}: {citation.doc_title}\n"
-                f"  Excerpt: {excerpt}\n"
-                f"  Relevance: {citation.relevance_score:.2f}"
+        # Only the cache misses go out in the rusty_req batch
+        misses = [i for i, decision in enumerate(prefetched) if decision is None]
+        if not misses:
+            return prefetched
+        requests = [
+            (
+                self._escalation_prompt(
+                    items[i].question_text,
+                    items[i].answer,
+                    items[i].confidence_score,
+                    items[i].category,
+                    items[i].citations_context,
+                    items[i].reasoning
+                ),
+                items[i].category
             )
+            for i in misses
+        ]
         
-        return "\n\n".join(context_parts)
+        try:
+            results = await self._check_many_with_rusty_req(requests)
+        except Exception as e:
+            print(f"⚠️  rusty_req batch failed ({str(e)[:50]}); falling back to httpx")
+            return prefetched
+        
+        for i, decision in zip(misses, results):
+            prefetched[i] = decision
+            if decision is not None:
+                self._store_decision(items[i].decision_key, decision)
+        return prefetched
     
-    def _format_citations_context_from_escalation(self, citations: List[EscalationCitation]) -> str:
-        """Format escalation citations for context in Firework AI prompt."""
-        if not citations:
-            return "No citations provided."
+    async def _route_or_none(self, item: _NormalizedAnswer, department: Optional[str]) -> Optional[Dict]:
+        """Route one escalated answer; a routing failure leaves just that answer unrouted."""
+        try:
+            return await self._route_to_employee(item.question_text, item.category, department)
+        except Exception as e:
+            print(f"⚠️  Employee routing failed for {item.question_id}: {str(e)[:50]}")
+            return None
+    
+    def _build_result(
+        self,
+        item: _NormalizedAnswer,
+        firework_decision: Dict,
+        routed_to: Optional[Dict]
+    ) -> EscalationResult:
+        """Assemble the EscalationResult for one answer."""
+        requires_escalation = firework_decision.get("requires_escalation", False)
+        
+        department = None
+        escalation_reason = None
         
-        context_parts = []
-        for i, citation in enumerate(citations, 1):
-            excerpt = citation.relevant_excerpt[:200] + "..." if len(citation.relevant_excerpt) > 200 else citation.relevant_excerpt
-            context_parts.append(
-                f"Citation {i}: {citation.doc_title}\n"
-                f"  Excerpt: {excerpt}\n"
-                f"  Relevance: {citation.relevance_score:.2f}"
+        if requires_escalation:
+            department = routed_to.get("department") if routed_to else None
+            escalation_reason = firework_decision.get(
+                "reason",
+                f"Low confidence score: {item.confidence_score:.2f}"
             )
         
-        return "\n\n".join(context_parts)
+        return EscalationResult(
+            question_id=item.question_id,
+            question_text=item.question_text,
+            answer=item.answer,
+            confidence=item.confidence,
+            confidence_score=item.confidence_score,
+            requires_escalation=requires_escalation,
+            escalation_reason=escalation_reason,
+            routed_to=routed_to,
+            department=department,
+            category=item.category,
+            citations=item.citations
+        )
     
-    async def _check_with_firework(
-        self, 
-        question: str, 
-        answer: str, 
-        confidence: float, 
+    def _extract_category_from_answer(self, answer_item: AnswerItem) -> Optional[str]:
+        """Extract category from citations, question text, or answer content."""
+        # Check question first, then answer content, then citation titles
+        for text in answer_item.lowered_texts:
+            found = {match.lastgroup for match in _CATEGORY_KEYWORD_RE.finditer(text)}
+            if found:
+                # Earlier categories win, as in CATEGORY_KEYWORDS order
+                return min(found, key=_CATEGORY_PRIORITY.__getitem__)
+        
+        return None
+    
+    def _format_citations_context(self, citations: List[Citation]) -> str:
+        """Format drafting or citation-agent citations for context in Firework AI prompt."""
+        if not citations:
+            return "No citations provided."
+        
+        return "\n\n".join(
+            f"Citation {i}: {citation.doc_title}\n"
+            f"  Excerpt: {citation.short_excerpt}\n"
+            f"  Relevance: {citation.relevance_score:.2f}"
+            for i, citation in enumerate(citations, 1)
+        )
+    
+    def _decision_cache_key(
+        self,
+        question: str,
+        answer: str,
+        confidence: float,
+        category: Optional[str],
+        citations_context: Optional[str] = None,
+        reasoning: Optional[str] = None
+    ) -> Optional[str]:
+        """Stable hash of the review inputs, or None if the category must not be cached."""
+        if category and category.lower() in UNCACHED_CATEGORIES:
+            return None
+        raw = f"{question}|{answer}|{round(confidence, 2)}|{category}|{citations_context}|{reasoning}"
+        return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
+    
+    def _cached_decision(self, key: Optional[str]) -> Optional[Dict]:
+        """Return an unexpired cached decision (as a copy) for key."""
+        if key is None:
+            return None
+        entry = self._decision_cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._decision_cache[key]
+            return None
+        return dict(entry[1])
+    
+    def _store_decision(self, key: Optional[str], decision: Dict):
+        """Cache a Firework AI decision, evicting the oldest entry when full."""
+        if key is None:
+            return
+        self._decision_cache.pop(key, None)
+        if len(self._decision_cache) >= DECISION_CACHE_MAXSIZE:
+            self._decision_cache.pop(next(iter(self._decision_cache)))
+        self._decision_cache[key] = (time.monotonic() + DECISION_CACHE_TTL_SECONDS, dict(decision))
+    
+    def _escalation_prompt(
+        self,
+        question: str,
+        answer: str,
+        confidence: float,
         category: Optional[str],
         citations_context: Optional[str] = None,
         reasoning: Optional[str] = None
-    ) -> Dict:
-        """Use Firework AI to determine if escalation is needed."""
+    ) -> str:
+        """Build the single Q&A escalation review prompt."""
         citations_section = f"\n\nCitations Context:\n{citations_context}" if citations_context else ""
         reasoning_section = f"\n\nOriginal Reasoning: {reasoning}" if reasoning else ""
         
@@ -307,83 +661,292 @@ Respond in JSON format:
     "reason": "Brief explanation",
     "department": "Suggested department (e.g., Security, Compliance, Engineering) or null"
 }}"""
+        
+        return prompt
+    
+    async def _check_many_with_rusty_req(self, requests: List[Tuple[str, Optional[str]]]) -> List[Optional[Dict]]:
+        """
+        Send many single-answer escalation prompts in one Rust-executed batch.
+        
+        Args:
+            requests: (prompt, category) pairs
+        
+        Returns:
+            Parsed decision per request, or None where the request failed
+        """
+        items = [
+            rusty_req.RequestItem(
+                url=f"{self.firework_base_url}/chat/completions",
+                method="POST",
+                params=self._firework_payload(prompt, self._model_for([category]), settings.escalation_max_tokens),
+                headers=self._headers,
+                tag=str(i),
+                timeout=30.0
+            )
+            for i, (prompt, category) in enumerate(requests)
+        ]
+        responses = await rusty_req.fetch_requests(
+            items,
+            total_timeout=30.0,
+            mode=rusty_req.ConcurrencyMode.JOIN_ALL
+        )
+        
+        decisions: List[Optional[Dict]] = [None] * len(requests)
+        for response in responses:
+            if response.get("http_status") != 200 or response.get("exception", {}).get("type"):
+                continue
+            try:
+                index = int(response["meta"]["tag"])
+                response_data = json_loads(response["response"]["content"])
+                decision = json_loads(response_data["choices"][0]["message"]["content"])
+            except (KeyError, IndexError, ValueError, TypeError):
+                continue
+            if isinstance(decision, dict):
+                decisions[index] = decision
+        
+        return decisions
+    
+    async def _check_batch_with_firework(self, answers: List[_NormalizedAnswer]) -> List[Dict]:
+        """
+        Review several Q&A pairs with a single Firework AI request.
+        
+        Args:
+            answers: Answers to review, at most ESCALATION_REVIEW_BATCH_SIZE
+        
+        Returns:
+            One escalation decision per answer, in input order
+        """
+        decisions: List[Optional[Dict]] = [self._cached_decision(answer.decision_key) for answer in answers]
+        
+        # Only the answers without a cached decision go to Firework AI
+        uncached = [i for i, decision in enumerate(decisions) if decision is None]
+        if uncached:
+            reviewed = await self._review_answers_with_firework([answers[i] for i in uncached])
+            for i, decision in zip(uncached, reviewed):
+                decisions[i] = decision
+        
+        return decisions
+    
+    async def _review_answers_with_firework(self, answers: List[_NormalizedAnswer]) -> List[Dict]:
+        """Send one batched review prompt and cache the verdicts it returns."""
+        items = []
+        for i, answer in enumerate(answers, 1):
+            reasoning_line = f"\nOriginal Reasoning: {answer.reasoning}" if answer.reasoning else ""
+            items.append(
+                f"### Item {i}\n"
+                f"Question ID: {answer.question_id}\n"
+                f"Question: {answer.question_text}\n"
+                f"Answer: {answer.answer}\n"
+                f"Confidence Score: {answer.confidence_score:.2f}\n"
+                f"Category: {answer.category or 'Unknown'}\n"
+                f"Citations Context:\n{answer.citations_context}"
+                f"{reasoning_line}"
+            )
+        items_section = "\n\n".join(items)
+        
+        prompt = f"""You are a security questionnaire review system. Analyze whether each of the following Q&A pairs requires human escalation.
 
-        # Try multiple models with fallback
-        model_names = [
+{items_section}
+
+For each item consider these factors:
+1. Is the answer complete and accurate?
+2. Does the answer address all aspects of the question?
+3. Are the citations relevant and sufficient?
+4. Is the confidence score appropriate for the complexity?
+5. Are there any security concerns that need human review?
+
+Respond in JSON format, with exactly one verdict per item in the same order:
+{{
+    "verdicts": [
+        {{
+            "question_id": "The item's Question ID",
+            "requires_escalation": true/false,
+            "reason": "Brief explanation",
+            "department": "Suggested department (e.g., Security, Compliance, Engineering) or null"
+        }}
+    ]
+}}"""
+
+        async with self._semaphore:
+            # A failed or timed-out review degrades this chunk to threshold
+            # decisions; other chunks carry on
+            result, last_error = await self._request_firework_json(
+                prompt,
+                model=self._model_for([answer.category for answer in answers]),
+                max_tokens=settings.escalation_max_tokens * len(answers)
+            )
+        
+        verdicts = result.get("verdicts") if result else None
+        by_id: Dict[str, Dict] = {}
+        if isinstance(verdicts, list):
+            by_id = {
+                str(v.get("question_id")): v
+                for v in verdicts if isinstance(v, dict)
+            }
+        else:
+            self._warn_fireworks_unavailable(last_error)
+        
+        decisions = []
+        for answer in answers:
+            verdict = by_id.get(answer.question_id)
+            if verdict is None:
+                # Anything the model skipped falls back to the threshold decision
+                verdict = self._threshold_decision(answer.confidence_score, answer.category)
+            else:
+                self._store_decision(answer.decision_key, verdict)
+            decisions.append(verdict)
+        
+        return decisions
+    
+    def _model_for(self, categories: List[Optional[str]]) -> str:
+        """Pick the escalation judge model, using the large one for high-stakes categories."""
+        high_stakes = settings.escalation_high_stakes_categories
+        if any(category and category.lower() in high_stakes for category in categories):
+            return settings.escalation_high_stakes_model
+        return settings.escalation_model
+    
+    def _firework_payload(self, prompt: str, model: str, max_tokens: int) -> Dict:
+        """Chat completion body for an escalation review in JSON mode."""
+        return {
+            "model": model,
+            "messages": [
+                ESCALATION_SYSTEM_MESSAGE,
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": max_tokens,
+            **ESCALATION_BASE_PAYLOAD
+        }
+    
+    async def _request_firework_json(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        max_tokens: Optional[int] = None
+    ) -> Tuple[Optional[Dict], Optional[str]]:
+        """
+        Send a prompt to Firework AI in JSON mode, trying each fallback model in turn.
+        
+        Returns:
+            (parsed JSON object, None) on success, (None, last error) otherwise
+        """
+        # Try the requested model first, then the last model that worked, then
+        # the larger fallbacks, skipping any that recently returned 404
+        candidates = [
+            model or settings.escalation_model,
+            self._preferred_model,
             "accounts/fireworks/models/deepseek-v3p2",
             "accounts/fireworks/models/llama-v3-70b-instruct",
             "fireworks/llama-v3-70b-instruct",
         ]
+        candidates = list(dict.fromkeys(name for name in candidates if name))
+        now = time.monotonic()
+        model_names = [
+            name for name in candidates
+            if self._demoted_models.get(name, 0) <= now
+        ] or candidates
+        max_tokens = max_tokens or settings.escalation_max_tokens
         
         last_error = None
         for model_name in model_names:
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.post(
-                        f"{self.firework_base_url}/chat/completions",
-                        headers={
-                            "Authorization": f"Bearer {self.firework_api_key}",
-                            "Content-Type": "application/json"
-                        },
-                        json={
-                            "model": model_name,
-                            "messages": [
-                                {
-                                    "role": "system",
-                                    "content": "You are an expert security analyst. Respond only with valid JSON."
-                                },
-                                {
-                                    "role": "user",
-                                    "content": prompt
-                                }
-                            ],
-                            "temperature": 0.3,
-                            "max_tokens": 200
-                        }
+                async with asyncio.timeout(ESCALATION_REVIEW_TIMEOUT_SECONDS):
+                    response, content = await self._stream_firework_content(
+                        self._firework_payload(prompt, model_name, max_tokens)
                     )
-                    
-                    if response.status_code == 200:
-                        response_data = response.json()
-                        result_text = response_data["choices"][0]["message"]["content"].strip()
-                        
-                        # Extract JSON from response
-                        if "```json" in result_text:
-                            result_text = result_text.split("```json")[1].split("```")[0].strip()
-                        elif "```" in result_text:
-                            result_text = result_text.split("```")[1].split("```")[0].strip()
-                        
-                        result_text = result_text.strip()
-                        if result_text.startswith("{"):
-                            decision = json.loads(result_text)
-                            if not hasattr(self, '_fireworks_success_logged'):
-                                print(f"✅ Fireworks AI model '{model_name}' working successfully")
-                                self._fireworks_success_logged = True
-                            return decision
-                        else:
-                            last_error = f"Invalid JSON format from model {model_name}"
-                            continue
-                    elif response.status_code == 404:
-                        last_error = f"Model {model_name} not found (404)"
-                        continue
+                
+                if response.status_code == 200:
+                    # JSON mode guarantees a bare JSON object, no markdown fences
+                    decision = json_loads(content)
+                    if isinstance(decision, dict):
+                        self._preferred_model = model_name
+                        self._demoted_models.pop(model_name, None)
+                        if not hasattr(self, '_fireworks_success_logged'):
+                            print(f"✅ Fireworks AI model '{model_name}' working successfully")
+                            self._fireworks_success_logged = True
+                        return decision, None
                     else:
-                        try:
-                            error_data = response.json()
-                            error_msg = error_data.get("error", {}).get("message", response.text[:100])
-                            last_error = f"Model {model_name}: {error_msg}"
-                        except:
-                            last_error = f"Model {model_name}: HTTP {response.status_code}"
+                        last_error = f"Invalid JSON format from model {model_name}"
                         continue
+                elif response.status_code == 404:
+                    last_error = f"Model {model_name} not found (404)"
+                    self._demoted_models[model_name] = time.monotonic() + MODEL_DEMOTION_SECONDS
+                    continue
+                else:
+                    try:
+                        error_data = json_loads(response.content)
+                        error_msg = error_data.get("error", {}).get("message", response.text[:100])
+                        last_error = f"Model {model_name}: {error_msg}"
+                    except:
+                        last_error = f"Model {model_name}: HTTP {response.status_code}"
+                    continue
+            except TimeoutError:
+                last_error = f"Model {model_name} timed out after {ESCALATION_REVIEW_TIMEOUT_SECONDS:.0f}s"
+                continue
             except json.JSONDecodeError:
                 continue
             except Exception as e:
                 last_error = f"Error with {model_name}: {str(e)[:50]}"
                 continue
         
-        # Fallback to threshold-based decision
+        return None, last_error
+    
+    async def _stream_firework_content(self, payload: Dict) -> Tuple[httpx.Response, str]:
+        """
+        Stream a chat completion, stopping as soon as its first JSON object is complete.
+        
+        Closing the stream early also stops Fireworks generating the rest.
+        
+        Returns:
+            (response, streamed message content); non-200 bodies are read in full
+        """
+        async with self.http.stream(
+            "POST",
+            f"{self.firework_base_url}/chat/completions",
+            content=json_dumps({**payload, "stream": True}),
+            timeout=30.0
+        ) as response:
+            if response.status_code != 200:
+                await response.aread()
+                return response, ""
+            
+            parts: List[str] = []
+            tracker = _JsonObjectTracker()
+            async for line in response.aiter_lines():
+                # Server-sent events: "data: {chunk}" lines, ending with "data: [DONE]"
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                choices = json_loads(data).get("choices") or [{}]
+                delta = (choices[0].get("delta") or {}).get("content") or ""
+                end = tracker.feed(delta)
+                if end >= 0:
+                    parts.append(delta[:end])
+                    break
+                parts.append(delta)
+        
+        return response, "".join(parts)
+    
+    def _warn_fireworks_unavailable(self, last_error: Optional[str]):
+        """Log (once) that escalation is falling back to the confidence threshold."""
         if not hasattr(self, '_fireworks_warning_shown'):
             print(f"⚠️  Fireworks AI models unavailable ({last_error}). Using threshold-based escalation.")
             self._fireworks_warning_shown = True
-        
+    
+    def _below_threshold_decision(self, confidence: float, category: Optional[str]) -> Dict:
+        """Escalation decision for answers whose confidence is already below the threshold."""
+        return {
+            "requires_escalation": True,
+            "reason": f"Low confidence score: {confidence:.2f} (threshold {self.confidence_threshold})",
+            "department": self._suggest_department_from_category(category)
+        }
+    
+    def _threshold_decision(self, confidence: float, category: Optional[str]) -> Dict:
+        """Fallback escalation decision when Firework AI gives no usable answer."""
         return {
             "requires_escalation": confidence < self.confidence_threshold,
             "reason": f"Threshold-based: Confidence {confidence:.2f} {'below' if confidence < self.confidence_threshold else 'above'} threshold {self.confidence_threshold}",
@@ -399,80 +962,118 @@ Respond in JSON format:
         """Route escalation to the most appropriate employee."""
         department = suggested_department or self._suggest_department_from_category(category) or "Security"
         
+        # A loaded routing table implies MongoDB was reachable; serve from memory
+        if self._routing_table_loaded:
+            return self._route_from_table(category, department)
+        
         # Check if database is connected
         if db.database is None:
             print("⚠️  MongoDB not connected - using fallback employee routing")
             # Return None so frontend knows employee routing failed
             return None
         
+        key = (category.lower() if category else None, department.lower())
+        now = time.monotonic()
+        cached = self._route_cache.get(key)
+        
+        # Concurrent escalations in the same category share one in-flight lookup
+        if cached and cached[0] > now:
+            lookup = cached[1]
+        else:
+            lookup = asyncio.ensure_future(self._lookup_employee(*key))
+            self._route_cache.pop(key, None)
+            if len(self._route_cache) >= ROUTE_CACHE_MAXSIZE:
+                self._route_cache.pop(next(iter(self._route_cache)))
+            self._route_cache[key] = (now + ROUTE_CACHE_TTL_SECONDS, lookup)
+        
+        try:
+            employee = await asyncio.shield(lookup)
+        except Exception:
+            self._route_cache.pop(key, None)
+            raise
+        
+        return dict(employee) if employee else None
+    
+    async def _lookup_employee(self, category: Optional[str], department: str) -> Optional[Dict]:
+        """Query MongoDB for the best employee for a lowercased category/department."""
         employees_collection = db.database.employees
         
-        # Try to find employee by category/expertise match
-        employee_doc = None
+        # Seeded department/expertise values are lowercase-hyphenated, so
+        # exact matches can use the indexes instead of regex scans (older
+        # title-case records: scripts/lowercase_employee_routing_fields.py)
+        expertise = category.replace("_", "-") if category else None
+        departments = list(dict.fromkeys([department, "security"]))
         
-        # Strategy 1: Match by expertise areas
-        if category:
-            employee_doc = await employees_collection.find_one({
-                "expertise_areas": {"$regex": category, "$options": "i"}
-            })
+        clauses: List[Dict] = [{"department": {"$in": departments}}]
+        if expertise:
+            clauses.append({"expertise_areas": expertise})
         
-        # Strategy 2: Match by department
-        if not employee_doc:
-            employee_doc = await employees_collection.find_one({
-                "department": {"$regex": department, "$options": "i"}
-            })
+        candidates = await employees_collection.find(
+            {"$or": clauses},
+            projection=EMPLOYEE_ROUTING_PROJECTION
+        ).to_list(length=50)
         
-        # Strategy 3: Any Security team member
-        if not employee_doc:
-            employee_doc = await employees_collection.find_one({
-                "department": {"$regex": "security", "$options": "i"}
-            })
+        # Preference: expertise match, then suggested department, then Security
+        def rank(doc: Dict) -> int:
+            if expertise and expertise in doc.get("expertise_areas", []):
+                return 0
+            dept = doc.get("department")
+            return departments.index(dept) + 1 if dept in departments else len(departments) + 1
         
-        # Strategy 4: Just get any employee
+        employee_doc = min(candidates, key=rank) if candidates else None
+        
+        # Fallback: just get any employee
         if not employee_doc:
-            employee_doc = await employees_collection.find_one({})
+            employee_doc = await employees_collection.find_one({}, projection=EMPLOYEE_ROUTING_PROJECTION)
         
         if employee_doc:
-            return {
-                "id": str(employee_doc.get("_id")),
-                "name": employee_doc.get("name"),
-                "email": employee_doc.get("email"),
-                "title": employee_doc.get("role") or employee_doc.get("title"),
-                "role": employee_doc.get("role"),
-                "department": employee_doc.get("department")
-            }
+            return self._employee_summary(employee_doc)
         
         # No employees in database
         print("⚠️  No employees found in database")
         return None
+    
+    def _route_from_table(self, category: Optional[str], department: str) -> Optional[Dict]:
+        """Route using the in-process table: expertise, department, Security, then anyone."""
+        expertise = category.lower().replace("_", "-") if category else None
+        employee_doc = (
+            (self._by_expertise.get(expertise) if expertise else None)
+            or self._by_department.get(department.lower())
+            or self._by_department.get("security")
+            or self._any_employee
+        )
+        
+        if employee_doc:
+            return self._employee_summary(employee_doc)
         
+        print("⚠️  No employees found in database")
         return None
     
+    def _employee_summary(self, employee_doc: Dict) -> Dict:
+        """Shape an employee document for EscalationResult.routed_to."""
+        return {
+            "id": str(employee_doc.get("_id")),
+            "name": employee_doc.get("name"),
+            "email": employee_doc.get("email"),
+            "title": employee_doc.get("role") or employee_doc.get("title"),
+            "role": employee_doc.get("role"),
+            "department": (employee_doc.get("department") or "").title() or None
+        }
+    
     def _suggest_department_from_category(self, category: Optional[str]) -> Optional[str]:
         """Suggest department based on question category."""
         if not category:
             return None
         
+        # Categories from _extract_category_from_answer are exact keys
         category_lower = category.lower()
+        department = CATEGORY_TO_DEPARTMENT.get(category_lower)
+        if department:
+            return department
         
-        category_to_dept = {
-            "authentication": "Security",
-            "authorization": "Security",
-            "encryption": "Security",
-            "data_protection": "Security",
-            "data_handling": "Security",
-            "access_control": "Security",
-            "api_security": "Engineering",
-            "network_security": "Security",
-            "compliance": "Compliance",
-            "incident_response": "Security",
-            "logging": "Engineering",
-            "infrastructure": "Engineering",
-            "database": "Engineering",
-        }
-        
-        for key, dept in category_to_dept.items():
-            if key in category_lower:
-                return dept
+        # Free-text categories fall back to a substring match
+        match = _CATEGORY_RE.search(category_lower)
+        if match:
+            return CATEGORY_TO_DEPARTMENT[match.lastgroup]
         
         return "Security"
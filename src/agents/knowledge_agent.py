@@ -10,16 +10,22 @@ The actual answer generation and confidence scoring is handled by
 Citation Agent + Drafting Agent.
 """
 
+import asyncio
 import os
 import json
+import re
+from functools import lru_cache
 from datetime import datetime, timezone
-from typing import Optional, List
+from typing import Dict, Optional, List, Tuple
 from dotenv import load_dotenv
+import aiohttp
+import numpy as np
 import voyageai
-from pymongo import MongoClient
 
 from src.core.config import settings
+from src.core.database import get_motor_client
 from src.models.common import Evidence
+from src.agents.embedding_cache import CachedEmbedder
 
 load_dotenv()
 
@@ -30,6 +36,108 @@ load_dotenv()
 VOYAGE_MODEL = settings.voyage_model
 QA_LIBRARY_BOOST = 0.15
 
+# Questions per batched search aggregation; each adds two query vectors to the
+# command document, so this keeps it far below MongoDB's 16MB command limit
+BATCH_SEARCH_MAX_QUERIES = 50
+
+# Common SIG / CAIQ-style questions embedded at startup (see KnowledgeAgent.warmup)
+CANONICAL_QUESTIONS_PATH = os.path.join(os.path.dirname(__file__), "canonical_questions.json")
+
+# Atlas Vector Search: numCandidates = max(limit * multiplier, floor), capped at 10000
+QA_SEARCH_LIMIT = 3
+NUM_CANDIDATES_FLOOR = 50
+QA_NUM_CANDIDATES_FLOOR = 20
+MAX_NUM_CANDIDATES = 10000
+
+# The only qa_library fields retrieve reads from a match (_id is always returned);
+# leaves out the ~8KB question_embedding and other unused fields
+QA_MATCH_PROJECTION = {"answer": 1, "evidence_source": 1, "confidence": 1, "last_verified": 1}
+
+# Questions in a batch whose embeddings are at least this similar share one
+# chunk search over their centroid, re-ranked per question on the client
+CLUSTER_SIMILARITY_THRESHOLD = 0.9
+
+# Keywords that identify a question's category; earlier categories win
+CATEGORY_KEYWORDS = {
+    "encryption": ["encrypt", "aes", "kms", "key management", "data at rest", "in transit", "tls", "ssl"],
+    "authentication": ["auth", "mfa", "multi-factor", "password", "login", "sso", "saml", "oauth"],
+    "access_control": ["access control", "rbac", "permission", "privilege", "least privilege"],
+    "compliance": ["soc 2", "soc2", "gdpr", "hipaa", "iso 27001", "compliance", "certification", "audit"],
+    "incident_response": ["incident", "breach", "notification", "response"],
+    "data_handling": ["data retention", "backup", "deletion", "processing", "dpa"],
+    "logging": ["log", "audit trail", "monitoring"],
+    "network": ["network", "firewall", "vpc", "segmentation"],
+}
+_CATEGORY_PRIORITY = {category: i for i, category in enumerate(CATEGORY_KEYWORDS)}
+
+# Optional Aho-Corasick automaton (pyahocorasick) scans all keywords in one pass;
+# without it, a zero-width-lookahead regex reports every (overlapping) keyword hit
+try:
+    import ahocorasick
+    _CATEGORY_AUTOMATON = ahocorasick.Automaton()
+    for _category, _keywords in CATEGORY_KEYWORDS.items():
+        for _keyword in _keywords:
+            _existing = _CATEGORY_AUTOMATON.get(_keyword, None)
+            if _existing is None or _CATEGORY_PRIORITY[_category] < _CATEGORY_PRIORITY[_existing]:
+                _CATEGORY_AUTOMATON.add_word(_keyword, _category)
+    _CATEGORY_AUTOMATON.make_automaton()
+except ImportError:
+    _CATEGORY_AUTOMATON = None
+_CATEGORY_KEYWORD_RE = re.compile("(?=" + "|".join(
+    f"(?P<{category}>{'|'.join(re.escape(k) for k in keywords)})"
+    for category, keywords in CATEGORY_KEYWORDS.items()
+) + ")")
+
+_FINGERPRINT_DELETE = str.maketrans("", "", "?'")
+
+
+@lru_cache(maxsize=4096)
+def _fingerprint_and_category(question: str) -> Tuple[str, str]:
+    """Keyword category and 5-word fingerprint; cached since questions repeat."""
+    question_lower = question.lower()
+    
+    if _CATEGORY_AUTOMATON is not None:
+        found = {category for _, category in _CATEGORY_AUTOMATON.iter(question_lower)}
+    else:
+        found = {match.lastgroup for match in _CATEGORY_KEYWORD_RE.finditer(question_lower)}
+    category = min(found, key=_CATEGORY_PRIORITY.__getitem__) if found else "other"
+    
+    fingerprint = "_".join(question_lower.split(maxsplit=5)[:5]).translate(_FINGERPRINT_DELETE)
+    return fingerprint, category
+
+
+class _PooledVoyageClient:
+    """
+    voyageai.AsyncClient whose calls share one keep-alive aiohttp session.
+    
+    Without voyageai.aiosession set, the SDK opens (and closes) a fresh
+    ClientSession per call, paying a TCP + TLS handshake for every embed.
+    """
+    
+    def __init__(self, client: voyageai.AsyncClient, max_connections: int):
+        self._client = client
+        self._max_connections = max_connections
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled session, creating it on first use (or after aclose)."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self._max_connections)
+            )
+        return self._session
+    
+    async def embed(self, texts: List[str], **kwargs):
+        # aiosession is a ContextVar, so set it in the calling task's context
+        voyageai.aiosession.set(self._get_session())
+        return await self._client.embed(texts, **kwargs)
+    
+    async def aclose(self):
+        """Close the pooled session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
 
 # ============================================================================
 # Knowledge Agent
@@ -49,19 +157,58 @@ class KnowledgeAgent:
         self,
         voyage_api_key: Optional[str] = None,
         mongodb_uri: Optional[str] = None,
+        num_candidates_multiplier: int = 20,
+        qa_num_candidates_multiplier: int = 5,
     ):
-        self.voyage = voyageai.Client(
-            api_key=voyage_api_key or settings.voyage_api_key or os.getenv("VOYAGE_API_KEY")
+        """
+        Args:
+            voyage_api_key: Voyage AI key (defaults to settings / VOYAGE_API_KEY)
+            mongodb_uri: MongoDB URI (defaults to settings / MONGODB_URI)
+            num_candidates_multiplier: Chunk search candidates per requested result;
+                higher improves recall at the cost of search CPU
+            qa_num_candidates_multiplier: Same, for the QA library search
+        """
+        self.num_candidates_multiplier = num_candidates_multiplier
+        self.qa_num_candidates_multiplier = qa_num_candidates_multiplier
+        self.voyage = _PooledVoyageClient(
+            voyageai.AsyncClient(
+                api_key=voyage_api_key or settings.voyage_api_key or os.getenv("VOYAGE_API_KEY")
+            ),
+            max_connections=settings.voyage_max_connections
         )
-        self.mongo = MongoClient(
+        self.mongo = get_motor_client(
             mongodb_uri or settings.mongodb_uri or os.getenv("MONGODB_URI")
         )
         self.db = self.mongo[settings.mongodb_db_name]
+        
+        # Repeated questions reuse cached query embeddings instead of calling Voyage
+        self._embedder = CachedEmbedder(
+            self.voyage,
+            VOYAGE_MODEL,
+            collection=self.db["embedding_cache"]
+        )
+        self._qa_index_ready = False
     
-    def retrieve(self, question: str, limit: int = 5, verbose: bool = True) -> dict:
+    async def aclose(self):
+        """Release the pooled Voyage HTTP session (recreated on next use)."""
+        await self.voyage.aclose()
+    
+    async def retrieve(
+        self,
+        question: str,
+        limit: int = 5,
+        verbose: bool = True,
+        query_embedding: Optional[List[float]] = None,
+        chunk_evidence: Optional[List[Evidence]] = None,
+        search_result: Optional[Tuple[Optional[dict], List[Evidence]]] = None
+    ) -> dict:
         """
         Main entry point - retrieve evidence for a question.
         
+        Pass query_embedding (e.g. from embed_queries) to skip the Voyage call,
+        chunk_evidence (from search_chunks_clustered) to skip the chunk search,
+        or search_result (from _search_qa_and_chunks_batch) to skip both searches.
+        
         Returns JSON data in format compatible with Citation Agent:
         {
             "question": str,
@@ -77,29 +224,37 @@ class KnowledgeAgent:
                     "metadata": {"similarity_score": float, "section": str}
                 }
             ],
-            "verified_answer": str | None  # If found in QA library
+            "verified_answer": str | None,  # If found in QA library
+            "qa_match_score": float  # Semantic QA library matches only: the vector score
         }
         """
         if verbose:
-            print(f"\n{'='*60}")
-            print(f"🔍 KNOWLEDGE AGENT - RETRIEVING")
-            print(f"{'='*60}")
-            print(f"Question: {question}\n")
+            print(f"\n{'='*60}\n🔍 KNOWLEDGE AGENT - RETRIEVING\n{'='*60}\nQuestion: {question}\n")
         
         # Step 1: Normalize question to get fingerprint and category
         normalized = self._normalize_question(question)
         if verbose:
-            print(f"📝 Fingerprint: {normalized['fingerprint']}")
-            print(f"   Category: {normalized['category']}\n")
+            print(f"📝 Fingerprint: {normalized['fingerprint']}\n   Category: {normalized['category']}\n")
+        
+        # Step 2: Check QA library first; an exact fingerprint match needs no embedding
+        qa_match = await self._check_qa_library(normalized['fingerprint'])
+        evidence: Optional[List[Evidence]] = None
+        if not qa_match and search_result is not None:
+            qa_match, evidence = search_result
+        elif not qa_match:
+            if query_embedding is None:
+                query_embedding = (await self.embed_queries([question]))[0]
+            if chunk_evidence is not None:
+                qa_match, evidence = await self._search_qa_library(query_embedding), chunk_evidence
+            else:
+                # One aggregation searches the QA library and document chunks together
+                qa_match, evidence = await self._search_qa_and_chunks(query_embedding, limit)
         
-        # Step 2: Check QA library first
-        qa_match = self._check_qa_library(normalized['fingerprint'], question)
         if qa_match:
             if verbose:
-                print(f"✅ FOUND IN QA LIBRARY (verified answer)")
-                print(f"   Confidence: {qa_match.get('confidence', 0.95)}")
+                print(f"✅ FOUND IN QA LIBRARY (verified answer)\n   Confidence: {qa_match.get('confidence', 0.95)}")
             
-            return {
+            result = {
                 "question": question,
                 "question_id": normalized['fingerprint'],
                 "category": normalized['category'],
@@ -117,26 +272,32 @@ class KnowledgeAgent:
                 }],
                 "verified_answer": qa_match["answer"]
             }
+            # Only semantic matches get a score. A fingerprint hit only means the
+            # first five words agree, so it must still go through Citation and
+            # Drafting rather than the orchestrator's verified-answer fast path
+            if "score" in qa_match:
+                result["qa_match_score"] = qa_match["score"]
+            return result
         
         if verbose:
             print("❌ Not in QA library, searching document chunks...\n")
         
-        # Step 3: Vector search for evidence
-        evidence = self._vector_search(question, limit=limit)
+        # Step 3: Evidence from the chunk half of the combined search
         
         if verbose:
-            print(f"🔍 Found {len(evidence)} evidence chunks:")
+            lines = [f"🔍 Found {len(evidence)} evidence chunks:"]
             for i, e in enumerate(evidence[:5]):
-                print(f"   [{i+1}] {e.doc_title} - Score: {e.similarity_score:.3f}")
+                lines.append(f"   [{i+1}] {e.doc_title} - Score: {e.similarity_score:.3f}")
                 if e.section:
-                    print(f"       Section: {e.section}")
-            print()
-        
-        # Convert to context_documents format for Citation Agent
-        context_documents = []
-        for e in evidence:
-            context_documents.append({
-                "doc_id": e.doc_title.lower().replace(" ", "_"),
+                    lines.append(f"       Section: {e.section}")
+            print("\n".join(lines) + "\n")
+        
+        # Convert to context_documents format for Citation Agent; chunks often
+        # share a document, so each distinct title is slugified only once
+        doc_ids = {title: title.lower().replace(" ", "_") for title in {e.doc_title for e in evidence}}
+        context_documents = [
+            {
+                "doc_id": doc_ids[e.doc_title],
                 "title": e.doc_title,
                 "content": e.text,
                 "source": e.doc_type,
@@ -144,7 +305,9 @@ class KnowledgeAgent:
                     "similarity_score": e.similarity_score,
                     "section": e.section
                 }
-            })
+            }
+            for e in evidence
+        ]
         
         return {
             "question": question,
@@ -155,45 +318,70 @@ class KnowledgeAgent:
             "verified_answer": None
         }
     
-    def retrieve_batch(
+    async def retrieve_batch(
         self, 
         questions: List[str], 
         limit: int = 5,
         verbose: bool = False
     ) -> List[dict]:
-        """Retrieve evidence for multiple questions."""
+        """
+        Retrieve evidence for multiple questions.
+        
+        All questions are embedded in one call and their QA library and chunk
+        searches run in one aggregation per BATCH_SEARCH_MAX_QUERIES questions;
+        only the cheap exact-fingerprint checks stay per question.
+        """
+        embeddings = await self.embed_queries(questions)
+        search_results = await self._search_qa_and_chunks_batch(embeddings, limit)
+        
+        if not verbose:
+            return list(await asyncio.gather(*(
+                self.retrieve(question, limit=limit, verbose=False, search_result=search_result)
+                for question, search_result in zip(questions, search_results)
+            )))
+        
+        # Verbose output stays readable one question at a time
         results = []
-        for i, question in enumerate(questions):
-            if verbose:
-                print(f"\nProcessing {i+1}/{len(questions)}...")
-            result = self.retrieve(question, limit=limit, verbose=verbose)
+        for i, (question, search_result) in enumerate(zip(questions, search_results)):
+            print(f"\nProcessing {i+1}/{len(questions)}...")
+            result = await self.retrieve(question, limit=limit, verbose=verbose, search_result=search_result)
             results.append(result)
         return results
     
-    def _normalize_question(self, question: str) -> dict:
-        """Create a simple fingerprint and category for the question."""
-        # Simple keyword-based categorization (no LLM needed)
-        question_lower = question.lower()
-        
-        category_keywords = {
-            "encryption": ["encrypt", "aes", "kms", "key management", "data at rest", "in transit", "tls", "ssl"],
-            "authentication": ["auth", "mfa", "multi-factor", "password", "login", "sso", "saml", "oauth"],
-            "access_control": ["access control", "rbac", "permission", "privilege", "least privilege"],
-            "compliance": ["soc 2", "soc2", "gdpr", "hipaa", "iso 27001", "compliance", "certification", "audit"],
-            "incident_response": ["incident", "breach", "notification", "response"],
-            "data_handling": ["data retention", "backup", "deletion", "processing", "dpa"],
-            "logging": ["log", "audit trail", "monitoring"],
-            "network": ["network", "firewall", "vpc", "segmentation"],
-        }
+    async def embed_queries(self, questions: List[str]) -> List[List[float]]:
+        """Embed questions for search, reusing cached embeddings where possible."""
+        return await self._embedder.embed_many(questions)
+    
+    async def warmup(self, canonical_questions: Optional[List[str]] = None) -> int:
+        """
+        Embed frequently asked questions ahead of the first request.
         
-        category = "other"
-        for cat, keywords in category_keywords.items():
-            if any(kw in question_lower for kw in keywords):
-                category = cat
-                break
+        The vectors land in the embedding cache (in-process LRU and the
+        embedding_cache collection), so canonical questions never put Voyage
+        on the request path. Already-cached questions cost no Voyage call.
         
-        # Simple fingerprint from question
-        fingerprint = "_".join(question_lower.split()[:5]).replace("?", "").replace("'", "")
+        Args:
+            canonical_questions: Questions to warm; defaults to canonical_questions.json
+        
+        Returns:
+            Number of questions warmed
+        """
+        if canonical_questions is None:
+            with open(CANONICAL_QUESTIONS_PATH) as f:
+                canonical_questions = json.load(f)
+        
+        await asyncio.gather(
+            self._embedder.embed_many(canonical_questions),
+            self._ensure_qa_index()
+        )
+        print(f"🔥 Warmed {len(canonical_questions)} canonical question embeddings")
+        return len(canonical_questions)
+    
+    def _normalize_question(self, question: str) -> dict:
+        """Create a simple fingerprint and category for the question."""
+        # Simple keyword-based categorization (no LLM needed); the cached
+        # helper returns a tuple so callers still get their own dict
+        fingerprint, category = _fingerprint_and_category(question)
         
         return {
             "fingerprint": fingerprint,
@@ -201,104 +389,309 @@ class KnowledgeAgent:
             "intent": question
         }
     
-    def _check_qa_library(self, fingerprint: str, question: str) -> Optional[dict]:
-        """Check if we have a verified answer for this question."""
-        qa_collection = self.db["qa_library"]
+    async def _check_qa_library(self, fingerprint: str) -> Optional[dict]:
+        """Check if we have a verified answer for this exact question fingerprint."""
+        await self._ensure_qa_index()
+        return await self.db["qa_library"].find_one(
+            {"question_fingerprint": fingerprint}, projection=QA_MATCH_PROJECTION
+        )
+    
+    async def _ensure_qa_index(self):
+        """
+        Unique index on question_fingerprint so the exact-match check is an
+        index lookup rather than a collection scan. learn_from_feedback keys
+        records as qa_<fingerprint>, so fingerprints are already unique there.
+        Created on first use so constructing the agent doesn't need a live server.
+        """
+        if self._qa_index_ready:
+            return
+        # Set before awaiting so concurrent retrieves in a batch don't all issue it;
+        # a failure (e.g. duplicate fingerprints from an external import) isn't retried
+        self._qa_index_ready = True
+        try:
+            await self.db["qa_library"].create_index("question_fingerprint", unique=True)
+        except Exception as e:
+            print(f"⚠️  Could not create qa_library fingerprint index: {e}")
+    
+    async def _search_qa_and_chunks(
+        self,
+        query_embedding: List[float],
+        limit: int = 5
+    ) -> Tuple[Optional[dict], List[Evidence]]:
+        """
+        Semantic QA library lookup and chunk vector search in one aggregation.
         
-        # First try exact fingerprint match
-        exact_match = qa_collection.find_one({"question_fingerprint": fingerprint})
-        if exact_match:
-            return exact_match
+        Returns:
+            (verified QA match scoring above 0.85 or None, chunk evidence)
+        """
+        pipeline = [
+            *self._qa_search_stages(query_embedding),
+            {
+                "$unionWith": {
+                    "coll": "chunks",
+                    "pipeline": self._chunk_search_stages(query_embedding, limit)
+                }
+            }
+        ]
         
-        # Try semantic similarity
         try:
-            query_embedding = self.voyage.embed(
-                [question], model=VOYAGE_MODEL, input_type="query"
-            ).embeddings[0]
-            
-            pipeline = [
-                {
-                    "$vectorSearch": {
-                        "index": "qa_question_index",
-                        "path": "question_embedding",
-                        "queryVector": query_embedding,
-                        "numCandidates": 20,
-                        "limit": 3
-                    }
-                },
-                {
-                    "$project": {
-                        "question_fingerprint": 1, "question_text": 1,
-                        "answer": 1, "evidence_source": 1, "confidence": 1,
-                        "last_verified": 1,
-                        "score": {"$meta": "vectorSearchScore"}
-                    }
-                }
-            ]
-            
-            results = list(qa_collection.aggregate(pipeline))
-            if results and results[0].get("score", 0) > 0.85:
-                return results[0]
+            results = await self.db["qa_library"].aggregate(pipeline).to_list(length=None)
+        except Exception as e:
+            # e.g. no qa_question_index yet: chunks can still be searched on their own
+            print(f"   (QA library search error: {e})")
+            return None, await self._vector_search(limit=limit, query_embedding=query_embedding)
+        
+        qa_results = [r for r in results if r.get("result_source") == "qa_library"]
+        qa_match = None
+        if qa_results and qa_results[0].get("score", 0) > 0.85:
+            qa_match = qa_results[0]
+        
+        evidence = [
+            self._to_evidence(r) for r in results
+            if r.get("result_source") == "chunks"
+        ]
+        return qa_match, evidence
+    
+    async def _search_qa_and_chunks_batch(
+        self,
+        query_embeddings: List[List[float]],
+        limit: int = 5
+    ) -> List[Tuple[Optional[dict], List[Evidence]]]:
+        """
+        _search_qa_and_chunks for many questions, one aggregation per chunk of
+        BATCH_SEARCH_MAX_QUERIES questions.
+        
+        $vectorSearch is not allowed inside $facet, so each question's QA and
+        chunk searches are chained with $unionWith and tagged with query_index.
+        Results come back as separate documents, so the batch is not bound by
+        the 16MB single-document limit a $facet result would have.
+        
+        Returns:
+            (QA match or None, chunk evidence) per question, in input order
+        """
+        if len(query_embeddings) < 2:
+            return [await self._search_qa_and_chunks(e, limit) for e in query_embeddings]
+        
+        groups = [
+            query_embeddings[start:start + BATCH_SEARCH_MAX_QUERIES]
+            for start in range(0, len(query_embeddings), BATCH_SEARCH_MAX_QUERIES)
+        ]
+        grouped = await asyncio.gather(*(self._search_group(group, limit) for group in groups))
+        return [result for group_results in grouped for result in group_results]
+    
+    async def _search_group(
+        self,
+        query_embeddings: List[List[float]],
+        limit: int
+    ) -> List[Tuple[Optional[dict], List[Evidence]]]:
+        """One $unionWith aggregation covering every question in the group."""
+        def tagged(stages: List[dict], i: int) -> List[dict]:
+            return [*stages, {"$addFields": {"query_index": i}}]
+        
+        pipeline = tagged(self._qa_search_stages(query_embeddings[0]), 0)
+        for i, query_embedding in enumerate(query_embeddings):
+            if i:
+                pipeline.append({"$unionWith": {
+                    "coll": "qa_library",
+                    "pipeline": tagged(self._qa_search_stages(query_embedding), i)
+                }})
+            pipeline.append({"$unionWith": {
+                "coll": "chunks",
+                "pipeline": tagged(self._chunk_search_stages(query_embedding, limit), i)
+            }})
+        
+        try:
+            results = await self.db["qa_library"].aggregate(pipeline).to_list(length=None)
+        except Exception as e:
+            # Fall back to one combined search per question (which has its own fallback)
+            print(f"   (Batched search error: {e})")
+            return list(await asyncio.gather(*(
+                self._search_qa_and_chunks(query_embedding, limit)
+                for query_embedding in query_embeddings
+            )))
+        
+        qa_matches: List[Optional[dict]] = [None] * len(query_embeddings)
+        evidence: List[List[Evidence]] = [[] for _ in query_embeddings]
+        for r in results:
+            i = r["query_index"]
+            if r.get("result_source") == "chunks":
+                evidence[i].append(self._to_evidence(r))
+            elif r.get("score", 0) > max(0.85, (qa_matches[i] or {}).get("score", 0)):
+                qa_matches[i] = r
+        return list(zip(qa_matches, evidence))
+    
+    async def _search_qa_library(self, query_embedding: List[float]) -> Optional[dict]:
+        """Semantic QA library lookup; the best match if it scores above 0.85."""
+        try:
+            results = await self.db["qa_library"].aggregate(
+                self._qa_search_stages(query_embedding)
+            ).to_list(length=None)
         except Exception as e:
             print(f"   (QA library search error: {e})")
+            return None
         
+        if results and results[0].get("score", 0) > 0.85:
+            return results[0]
         return None
     
-    def _vector_search(self, question: str, limit: int = 5) -> List[Evidence]:
-        """Search document chunks for relevant evidence."""
-        query_embedding = self.voyage.embed(
-            [question], model=VOYAGE_MODEL, input_type="query"
-        ).embeddings[0]
+    async def search_chunks_clustered(
+        self,
+        query_embeddings: List[List[float]],
+        limit: int = 5
+    ) -> List[Optional[List[Evidence]]]:
+        """
+        Chunk evidence for groups of near-duplicate questions, one search per group.
         
-        pipeline = [
+        Questions are grouped greedily by cosine similarity. Each group of two
+        or more runs a single $vectorSearch over its centroid with a wider
+        limit, then every question re-ranks those candidates by its own
+        embedding and keeps the top `limit`.
+        
+        Args:
+            query_embeddings: One (Voyage, unit-length) embedding per question
+            limit: Evidence chunks to keep per question
+        
+        Returns:
+            Evidence per question, or None for questions left to search alone
+        """
+        results: List[Optional[List[Evidence]]] = [None] * len(query_embeddings)
+        if len(query_embeddings) < 2:
+            return results
+        
+        vectors = np.asarray(query_embeddings, dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        similarity = vectors @ vectors.T
+        
+        clusters: List[List[int]] = []
+        assigned = np.zeros(len(vectors), dtype=bool)
+        for i in range(len(vectors)):
+            if assigned[i]:
+                continue
+            members = np.flatnonzero(~assigned & (similarity[i] >= CLUSTER_SIMILARITY_THRESHOLD))
+            assigned[members] = True
+            if len(members) > 1:
+                clusters.append(members.tolist())
+        
+        async def search_cluster(members: List[int]):
+            centroid = vectors[members].mean(axis=0)
+            pipeline = self._chunk_search_stages(
+                centroid.tolist(),
+                len(members) * limit * 2,
+                include_embedding=True
+            )
+            candidates = await self.db["chunks"].aggregate(pipeline).to_list(length=None)
+            candidates = [c for c in candidates if c.get("embedding")]
+            if not candidates:
+                return
+            
+            chunk_vectors = np.asarray([c["embedding"] for c in candidates], dtype=np.float32)
+            chunk_vectors /= np.linalg.norm(chunk_vectors, axis=1, keepdims=True)
+            scores = vectors[members] @ chunk_vectors.T
+            for row, i in enumerate(members):
+                top = np.argsort(-scores[row])[:limit]
+                # Same scale as Atlas's dotProduct/cosine vectorSearchScore: (1 + x) / 2
+                results[i] = [
+                    self._to_evidence({**candidates[j], "score": float((1 + scores[row, j]) / 2)})
+                    for j in top
+                ]
+        
+        try:
+            await asyncio.gather(*(search_cluster(members) for members in clusters))
+        except Exception as e:
+            print(f"   (Clustered chunk search error: {e})")
+            return [None] * len(query_embeddings)
+        
+        return results
+    
+    def _qa_search_stages(self, query_embedding: List[float]) -> List[dict]:
+        """Aggregation stages for a semantic search of verified QA answers."""
+        return [
             {
                 "$vectorSearch": {
-                    "index": "chunk_vector_index",
-                    "path": "embedding",
+                    "index": "qa_question_index",
+                    "path": "question_embedding",
                     "queryVector": query_embedding,
-                    "numCandidates": 100,
-                    "limit": limit
+                    "numCandidates": self._num_candidates(
+                        QA_SEARCH_LIMIT, self.qa_num_candidates_multiplier, QA_NUM_CANDIDATES_FLOOR
+                    ),
+                    "limit": QA_SEARCH_LIMIT
                 }
             },
             {
-                "$lookup": {
-                    "from": "documents",
-                    "localField": "doc_id",
-                    "foreignField": "_id",
-                    "as": "doc_info"
+                "$project": {
+                    **QA_MATCH_PROJECTION,
+                    "score": {"$meta": "vectorSearchScore"}
                 }
             },
+            {"$addFields": {"result_source": "qa_library"}}
+        ]
+    
+    def _num_candidates(self, limit: int, multiplier: int, floor: int) -> int:
+        """HNSW candidates to consider for a vector search returning `limit` results."""
+        return min(max(limit * multiplier, floor), MAX_NUM_CANDIDATES)
+    
+    def _chunk_search_stages(
+        self,
+        query_embedding: List[float],
+        limit: int,
+        include_embedding: bool = False
+    ) -> List[dict]:
+        """Aggregation stages for a vector search of document chunks."""
+        # doc_title is denormalized onto chunks (scripts/denormalize_chunk_titles.py),
+        # so no $lookup join on documents is needed
+        projection = {
+            "text": 1, "section": 1, "doc_id": 1, "doc_type": 1, "doc_title": 1,
+            "score": {"$meta": "vectorSearchScore"}
+        }
+        if include_embedding:
+            projection["embedding"] = 1
+        
+        return [
             {
-                "$project": {
-                    "text": 1, "section": 1, "doc_id": 1, "doc_type": 1,
-                    "doc_info": {"$arrayElemAt": ["$doc_info", 0]},
-                    "score": {"$meta": "vectorSearchScore"}
+                "$vectorSearch": {
+                    "index": "chunk_vector_index",
+                    "path": "embedding",
+                    "queryVector": query_embedding,
+                    "numCandidates": self._num_candidates(
+                        limit, self.num_candidates_multiplier, NUM_CANDIDATES_FLOOR
+                    ),
+                    "limit": limit
                 }
-            }
+            },
+            {"$project": projection},
+            {"$addFields": {"result_source": "chunks"}}
         ]
+    
+    async def _vector_search(
+        self,
+        question: Optional[str] = None,
+        limit: int = 5,
+        query_embedding: Optional[List[float]] = None
+    ) -> List[Evidence]:
+        """Search document chunks for relevant evidence."""
+        if query_embedding is None:
+            query_embedding = (await self.embed_queries([question]))[0]
         
-        results = list(self.db["chunks"].aggregate(pipeline))
+        pipeline = self._chunk_search_stages(query_embedding, limit)
+        results = await self.db["chunks"].aggregate(pipeline).to_list(length=None)
         
-        evidence = []
-        for r in results:
-            doc_info = r.get("doc_info", {})
-            evidence.append(Evidence(
-                text=r.get("text", ""),
-                doc_title=doc_info.get("title", r.get("doc_id", "Unknown")),
-                doc_type=r.get("doc_type", "unknown"),
-                section=r.get("section"),
-                similarity_score=r.get("score", 0)
-            ))
-        
-        return evidence
+        return [self._to_evidence(r) for r in results]
+    
+    def _to_evidence(self, result: dict) -> Evidence:
+        """Convert a chunk search result to Evidence."""
+        return Evidence(
+            text=result.get("text", ""),
+            doc_title=result.get("doc_title") or result.get("doc_id", "Unknown"),
+            doc_type=result.get("doc_type", "unknown"),
+            section=result.get("section"),
+            similarity_score=result.get("score", 0)
+        )
     
-    def learn_from_feedback(self, question: str, approved_answer: str, evidence_source: str) -> str:
+    async def learn_from_feedback(self, question: str, approved_answer: str, evidence_source: str) -> str:
         """Store approved answer in QA library for future reuse."""
         normalized = self._normalize_question(question)
         
-        embedding = self.voyage.embed(
-            [question], model=VOYAGE_MODEL, input_type="query"
-        ).embeddings[0]
+        embedding = await self._embedder.embed(question)
         
         qa_record = {
             "_id": f"qa_{normalized['fingerprint']}",
@@ -314,17 +707,24 @@ class KnowledgeAgent:
             "usage_count": 0
         }
         
-        self.db["qa_library"].replace_one(
+        await self.db["qa_library"].replace_one(
             {"_id": qa_record["_id"]}, qa_record, upsert=True
         )
         
         print(f"✅ Learned new answer (fingerprint: {normalized['fingerprint']})")
         return normalized['fingerprint']
     
-    def get_stats(self) -> dict:
+    async def get_stats(self) -> dict:
         """Get statistics about the knowledge base."""
+        # Collection metadata counts: O(1) instead of scanning with count_documents({})
+        qa_count, chunks_count, documents_count = await asyncio.gather(
+            self.db["qa_library"].estimated_document_count(),
+            self.db["chunks"].estimated_document_count(),
+            self.db["documents"].estimated_document_count()
+        )
         return {
-            "qa_library_count": self.db["qa_library"].count_documents({}),
-            "chunks_count": self.db["chunks"].count_documents({}),
-            "documents_count": self.db["documents"].count_documents({})
+            "qa_library_count": qa_count,
+            "chunks_count": chunks_count,
+            "documents_count": documents_count,
+            "embedding_cache": self._embedder.stats()
         }
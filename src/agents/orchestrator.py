@@ -11,12 +11,17 @@ Pipeline Flow:
 3. Return structured output with all answers, citations, and escalations
 """
 
+import asyncio
 import math
-from typing import List, Optional
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 from src.core.config import settings
-from src.models.common import Question, ContextDocument, Citation, ConfidenceLevel
+from src.core.llm_client import fireworks_client
+from src.core.semantic_cache import SemanticAnswerCache, context_namespace
+from src.models.common import Question, ContextDocument, Citation, ConfidenceLevel, Evidence
 from src.models.api import (
     QuestionnaireInput,
     QuestionnaireOutput,
@@ -29,6 +34,27 @@ from src.agents.citation_agent import CitationAgent
 from src.agents.drafting_agent import DraftingAgent
 from src.agents.escalation_agent import EscalationAgent
 
+# A QA library match at least this close is returned as-is, skipping the
+# Citation and Drafting LLM calls
+VERIFIED_ANSWER_MIN_SCORE = 0.92
+
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+
+def _dedupe_key(question_text: str) -> str:
+    """Questions equal after lowercasing, dropping punctuation and collapsing whitespace share an answer."""
+    return " ".join(_PUNCTUATION_RE.sub("", question_text.lower()).split())
+
+
+def _escalation_reason(confidence_score: float) -> str:
+    """Human-readable reason for escalating an answer with this confidence."""
+    confidence_pct = int(confidence_score * 100)
+    if confidence_score < 0.3:
+        return f"Very low confidence ({confidence_pct}%) - insufficient documentation found"
+    if confidence_score < 0.5:
+        return f"Low confidence ({confidence_pct}%) - requires human verification"
+    return f"Medium confidence ({confidence_pct}%) - may need additional review"
+
 
 @dataclass
 class OrchestratorConfig:
@@ -38,6 +64,47 @@ class OrchestratorConfig:
     use_knowledge_agent: bool = True  # Use MongoDB vector search
     use_citation_agent: bool = True   # Use RAG context documents
     run_escalation: bool = True       # Route to humans
+    use_answer_cache: bool = True     # Reuse answers for near-duplicate questions
+    max_concurrent_batches: Optional[int] = None  # None = all batches at once
+
+
+# Stateless-per-request agents are shared process-wide so every orchestrator
+# reuses the same Voyage client, Motor pool, embedding LRU and LLM semaphore.
+# Every Fireworks-calling agent is handed fireworks_client explicitly so they all
+# draw on its one HTTP/2 pool. EscalationAgent stays per-orchestrator: it owns
+# the employee watcher (and its caches) stopped by aclose().
+
+@lru_cache(maxsize=1)
+def _default_knowledge_agent() -> KnowledgeAgent:
+    return KnowledgeAgent()
+
+
+@lru_cache(maxsize=1)
+def _default_citation_agent() -> CitationAgent:
+    return CitationAgent(fireworks_client)
+
+
+@lru_cache(maxsize=1)
+def _default_drafting_agent() -> DraftingAgent:
+    return DraftingAgent(fireworks_client)
+
+
+async def close_shared_clients():
+    """
+    Close the process-wide pools shared by every orchestrator: the knowledge
+    agent's Voyage session and the Fireworks client. Call once at shutdown.
+    """
+    if _default_knowledge_agent.cache_info().currsize:
+        await _default_knowledge_agent().aclose()
+    await fireworks_client.aclose()
+
+
+@lru_cache(maxsize=1)
+def _default_answer_cache() -> SemanticAnswerCache:
+    return SemanticAnswerCache(
+        threshold=settings.semantic_cache_threshold,
+        ttl_seconds=settings.semantic_cache_ttl_seconds
+    )
 
 
 class QuestionnaireOrchestrator:
@@ -53,23 +120,51 @@ class QuestionnaireOrchestrator:
     
     def __init__(self, config: Optional[OrchestratorConfig] = None):
         self.config = config or OrchestratorConfig()
+        # Read once here rather than through self.config for every question
+        self._confidence_threshold = self.config.confidence_threshold
         
         # Initialize agents
         if self.config.use_knowledge_agent:
-            self.knowledge_agent = KnowledgeAgent()
+            self.knowledge_agent = _default_knowledge_agent()
         else:
             self.knowledge_agent = None
         
-        self.citation_agent = CitationAgent()
-        self.drafting_agent = DraftingAgent()
+        self.citation_agent = _default_citation_agent()
+        self.drafting_agent = _default_drafting_agent()
+        
+        # Keyed by question embedding, so only useful with the knowledge agent embedding
+        if self.config.use_answer_cache and self.knowledge_agent:
+            self.answer_cache = _default_answer_cache()
+        else:
+            self.answer_cache = None
         
         if self.config.run_escalation:
             self.escalation_agent = EscalationAgent(
-                confidence_threshold=self.config.confidence_threshold
+                confidence_threshold=self.config.confidence_threshold,
+                llm=fireworks_client
             )
         else:
             self.escalation_agent = None
     
+    async def warm(self):
+        """Preload state the agents serve from memory (employee routing, canonical embeddings)."""
+        if self.escalation_agent:
+            await self.escalation_agent.warm_routing_table()
+        if self.knowledge_agent:
+            try:
+                await self.knowledge_agent.warmup()
+            except Exception as e:
+                # Warmup only saves latency; requests still embed on demand
+                print(f"⚠️  Knowledge agent warmup failed: {e}")
+    
+    async def aclose(self):
+        """
+        Release what this orchestrator owns (the escalation agent). The shared
+        agents' pools stay open for other orchestrators; see close_shared_clients.
+        """
+        if self.escalation_agent:
+            await self.escalation_agent.aclose()
+    
     async def process_questionnaire(
         self,
         input_data: QuestionnaireInput,
@@ -93,39 +188,70 @@ class QuestionnaireOrchestrator:
         total_batches = math.ceil(total_questions / batch_size)
         
         if verbose:
-            print(f"\n{'='*60}")
-            print(f"🚀 QUESTIONNAIRE ORCHESTRATOR")
-            print(f"{'='*60}")
-            print(f"Request ID: {input_data.request_id}")
-            print(f"Questions: {total_questions}")
-            print(f"Context Documents: {len(context_docs)}")
-            print(f"Batches: {total_batches}")
-            print()
-        
-        all_batches: List[BatchResult] = []
-        total_escalations = 0
-        
-        for batch_num in range(total_batches):
+            print(
+                f"\n{'='*60}\n"
+                f"🚀 QUESTIONNAIRE ORCHESTRATOR\n"
+                f"{'='*60}\n"
+                f"Request ID: {input_data.request_id}\n"
+                f"Questions: {total_questions}\n"
+                f"Context Documents: {len(context_docs)}\n"
+                f"Batches: {total_batches}\n"
+            )
+        
+        cache_namespace = context_namespace(context_docs)
+        # Fallback citation context shared by every question, formatted once
+        context_text = self.citation_agent.format_context(context_docs)
+        
+        # Embed every question up front in one Voyage request (the cached embedder
+        # splits only past Voyage's 128-input limit) rather than one per batch
+        query_embeddings: List[Optional[List[float]]] = [None] * total_questions
+        if self.knowledge_agent:
+            try:
+                query_embeddings = await self.knowledge_agent.embed_queries(
+                    [q.question_text for q in questions]
+                )
+            except Exception as e:
+                if verbose:
+                    print(f"  Questionnaire embedding failed, embedding per question: {e}")
+        
+        # Repeated questions (often across sections) run the pipeline once; later
+        # occurrences await the first one's task, keyed by _dedupe_key. Those
+        # tasks belong to the questionnaire's TaskGroup below, not to a batch
+        inflight: Dict[str, "asyncio.Task[QuestionAnswer]"] = {}
+        
+        # Batches are only a reporting grouping, so they run concurrently; the
+        # citation/drafting agents' semaphores bound the Fireworks calls in flight
+        batch_limit = asyncio.Semaphore(self.config.max_concurrent_batches or total_batches or 1)
+        
+        async def run_batch(batch_num: int, group: asyncio.TaskGroup) -> BatchResult:
             start_idx = batch_num * batch_size
             end_idx = min(start_idx + batch_size, total_questions)
-            batch_questions = questions[start_idx:end_idx]
-            
-            if verbose:
-                print(f"\n--- Batch {batch_num + 1}/{total_batches} ---")
-            
-            batch_answers = await self._process_batch(
-                batch_questions, context_docs, verbose
-            )
-            
-            all_batches.append(BatchResult(
-                batch_number=batch_num + 1,
-                answers=batch_answers
-            ))
-            
-            # Count escalations
-            total_escalations += sum(1 for a in batch_answers if a.needs_escalation)
+            async with batch_limit:
+                if verbose:
+                    print(f"\n--- Batch {batch_num + 1}/{total_batches} ---")
+                batch_answers = await self._process_batch(
+                    questions[start_idx:end_idx], query_embeddings[start_idx:end_idx],
+                    context_docs, context_text, cache_namespace, inflight, group, verbose
+                )
+            return BatchResult.model_construct(batch_number=batch_num + 1, answers=batch_answers)
+        
+        # One failure cancels every other batch and shared question task, so
+        # nothing keeps calling Fireworks after the request has failed
+        try:
+            async with asyncio.TaskGroup() as group:
+                batch_tasks = [
+                    group.create_task(run_batch(batch_num, group)) for batch_num in range(total_batches)
+                ]
+        except ExceptionGroup as errors:
+            # Surface the original failure (as gather did); the group stays chained
+            raise errors.exceptions[0] from errors
+        all_batches: List[BatchResult] = [task.result() for task in batch_tasks]
+        
+        # Count escalations (bools sum directly, no per-answer branch)
+        total_escalations = sum(a.needs_escalation for batch in all_batches for a in batch.answers)
         
-        output = QuestionnaireOutput(
+        # Every part is already validated, so skip re-validating the whole tree
+        output = QuestionnaireOutput.model_construct(
             request_id=input_data.request_id,
             total_questions=total_questions,
             total_batches=total_batches,
@@ -135,127 +261,260 @@ class QuestionnaireOrchestrator:
         )
         
         if verbose:
-            print(f"\n{'='*60}")
-            print(f"✅ PROCESSING COMPLETE")
-            print(f"{'='*60}")
-            print(f"Total Questions: {total_questions}")
-            print(f"Escalations Required: {total_escalations}")
-            print()
+            print(
+                f"\n{'='*60}\n"
+                f"✅ PROCESSING COMPLETE\n"
+                f"{'='*60}\n"
+                f"Total Questions: {total_questions}\n"
+                f"Escalations Required: {total_escalations}\n"
+            )
         
         return output
     
     async def _process_batch(
         self,
         questions: List[Question],
+        query_embeddings: List[Optional[List[float]]],
         context_docs: List[ContextDocument],
+        context_text: str,
+        cache_namespace: str,
+        inflight: Dict[str, "asyncio.Task[QuestionAnswer]"],
+        group: asyncio.TaskGroup,
         verbose: bool
     ) -> List[QuestionAnswer]:
-        """Process a batch of questions through the agent pipeline."""
-        answers: List[QuestionAnswer] = []
+        """
+        Process a batch of questions through the agent pipeline, all questions concurrently.
         
-        for question in questions:
-            if verbose:
-                print(f"\n  Processing: {question.question_text[:50]}...")
-            
-            # Step 1: Knowledge Agent retrieves relevant evidence (if enabled)
-            knowledge_result = None
-            if self.knowledge_agent:
-                try:
-                    knowledge_result = self.knowledge_agent.retrieve(
-                        question.question_text, 
-                        verbose=False
-                    )
-                    
-                    if verbose:
-                        source = knowledge_result.get("source", "unknown")
-                        docs = knowledge_result.get("context_documents", [])
-                        avg_sim = sum(d.get("metadata", {}).get("similarity_score", 0) for d in docs) / max(len(docs), 1)
-                        print(f"    KnowledgeAgent: {source} (avg similarity: {avg_sim:.2f}, {len(docs)} docs)")
-                except Exception as e:
-                    if verbose:
-                        print(f"    KnowledgeAgent error: {e}")
-                    knowledge_result = None
-            
-            # Step 2: Citation + Drafting agents process the question
-            # Use documents from Knowledge Agent if available, else fall back to input context_docs
-            if verbose:
-                print(f"    Using Citation+Drafting agents...")
-            
-            # Convert Knowledge Agent docs to ContextDocument objects
-            docs_for_citation = context_docs  # default fallback
-            if knowledge_result and knowledge_result.get("context_documents"):
-                docs_for_citation = [
-                    ContextDocument(
-                        doc_id=doc.get("doc_id", f"doc_{i}"),
-                        title=doc.get("title", "Unknown"),
-                        content=doc.get("content", ""),
-                        source=doc.get("source", "knowledge_base"),
-                        metadata=doc.get("metadata", {})
-                    )
-                    for i, doc in enumerate(knowledge_result["context_documents"])
-                ]
-            
-            # Citation Agent: Find relevant citations from retrieved docs
-            citation_result = await self.citation_agent.find_citations(
-                question, docs_for_citation
-            )
-            
-            # Drafting Agent: Generate answer based on citations
-            draft_result = await self.drafting_agent.draft_answer(
-                question, citation_result
+        query_embeddings holds one precomputed embedding per question (None when
+        embedding failed; retrieve then embeds that question itself). inflight is
+        shared by every batch of the questionnaire so duplicates are answered once;
+        its tasks are created in group, the questionnaire-level TaskGroup.
+        """
+        # Questions close to one answered before with the same context documents
+        # reuse that answer and skip retrieval, citation and drafting entirely
+        answers: List[Optional[QuestionAnswer]] = [None] * len(questions)
+        if self.answer_cache is not None:
+            for i, (question, query_embedding) in enumerate(zip(questions, query_embeddings)):
+                if query_embedding is None:
+                    continue
+                cached = self.answer_cache.get(cache_namespace, query_embedding)
+                if cached is not None:
+                    answers[i] = cached.model_copy(update={
+                        "question_id": question.question_id,
+                        "question_text": question.question_text,
+                        "category": question.category
+                    })
+            if verbose and any(answers):
+                print(f"  Answer cache: {sum(1 for a in answers if a)}/{len(questions)} questions reused")
+        pending = [i for i, answer in enumerate(answers) if answer is None]
+        
+        # Near-duplicate questions share one chunk search over their centroid
+        chunk_evidence: List[Optional[List[Evidence]]] = [None] * len(pending)
+        if self.knowledge_agent and all(query_embeddings[i] is not None for i in pending):
+            chunk_evidence = await self.knowledge_agent.search_chunks_clustered(
+                [query_embeddings[i] for i in pending]
             )
-            
-            # Determine if escalation needed based on Drafting Agent confidence
-            # <50% = needs escalation, 50-70% = needs review (handled in frontend)
-            needs_escalation = draft_result.confidence_score < self.config.confidence_threshold
-            escalation_reason = None
-            
-            if needs_escalation:
-                confidence_pct = int(draft_result.confidence_score * 100)
-                if draft_result.confidence_score < 0.3:
-                    escalation_reason = f"Very low confidence ({confidence_pct}%) - insufficient documentation found"
-                elif draft_result.confidence_score < 0.5:
-                    escalation_reason = f"Low confidence ({confidence_pct}%) - requires human verification"
-                else:
-                    escalation_reason = f"Medium confidence ({confidence_pct}%) - may need additional review"
-            
-            answer = QuestionAnswer(
+        
+        duplicates = set()
+        
+        async def answer(i: int, evidence: Optional[List[Evidence]]) -> QuestionAnswer:
+            question = questions[i]
+            key = _dedupe_key(question.question_text)
+            task = inflight.get(key)
+            if task is None:
+                task = inflight[key] = group.create_task(self._answer_with_timeout(
+                    question, query_embeddings[i], evidence, context_docs, context_text, verbose
+                ))
+                return await task
+            duplicates.add(i)
+            return (await task).model_copy(update={
+                "question_id": question.question_id,
+                "question_text": question.question_text,
+                "category": question.category
+            })
+        
+        # TaskGroup cancels the batch's remaining questions if one fails outright
+        try:
+            async with asyncio.TaskGroup() as group:
+                drafted = [
+                    group.create_task(answer(i, evidence)) for i, evidence in zip(pending, chunk_evidence)
+                ]
+        except ExceptionGroup as errors:
+            # Surface the original failure (as gather did), not the group wrapper
+            raise errors.exceptions[0] from errors
+        for i, task in zip(pending, drafted):
+            answers[i] = drafted_answer = task.result()
+            # Only confident answers are reused, so a cache hit never needs escalation
+            if (
+                self.answer_cache is not None
+                and i not in duplicates
+                and query_embeddings[i] is not None
+                and not drafted_answer.needs_escalation
+            ):
+                self.answer_cache.put(cache_namespace, query_embeddings[i], drafted_answer)
+        return answers
+    
+    async def _answer_with_timeout(
+        self,
+        question: Question,
+        query_embedding: Optional[List[float]],
+        chunk_evidence: Optional[List[Evidence]],
+        context_docs: List[ContextDocument],
+        context_text: str,
+        verbose: bool
+    ) -> QuestionAnswer:
+        """Run _answer_one, escalating the question instead if it exceeds its time budget."""
+        try:
+            async with asyncio.timeout(settings.question_timeout_seconds):
+                return await self._answer_one(
+                    question, query_embedding, chunk_evidence, context_docs, context_text, verbose
+                )
+        except TimeoutError:
+            if verbose:
+                print(f"\n  ⏱️  Timed out after {settings.question_timeout_seconds:.0f}s: {question.question_text[:50]}...")
+            return QuestionAnswer.model_construct(
                 question_id=question.question_id,
                 question_text=question.question_text,
-                answer=draft_result.answer,
-                confidence=draft_result.confidence,
-                confidence_score=draft_result.confidence_score,
-                citations=citation_result.citations,
-                reasoning=draft_result.reasoning,
-                needs_escalation=needs_escalation,
-                escalation_reason=escalation_reason,
+                answer="Unable to generate an answer in time",
+                confidence=ConfidenceLevel.LOW,
+                confidence_score=0.0,
+                citations=[],
+                reasoning=f"Answer generation exceeded {settings.question_timeout_seconds:.0f}s",
+                needs_escalation=True,
+                escalation_reason="Timed out - requires human answer",
                 category=question.category
             )
-            
-            answers.append(answer)
-            
+    
+    async def _answer_one(
+        self,
+        question: Question,
+        query_embedding: Optional[List[float]],
+        chunk_evidence: Optional[List[Evidence]],
+        context_docs: List[ContextDocument],
+        context_text: str,
+        verbose: bool
+    ) -> QuestionAnswer:
+        """Retrieve, cite and draft the answer for one question."""
+        # Verbose lines are buffered and written once, so the output of
+        # concurrently processed questions doesn't interleave line by line
+        log: List[str] = []
+        if verbose:
+            log.append(f"\n  Processing: {question.question_text[:50]}...")
+        
+        # Step 1: Knowledge Agent retrieves relevant evidence (if enabled)
+        knowledge_result = None
+        if self.knowledge_agent:
+            try:
+                knowledge_result = await self.knowledge_agent.retrieve(
+                    question.question_text,
+                    verbose=False,
+                    query_embedding=query_embedding,
+                    chunk_evidence=chunk_evidence
+                )
+                
+                if verbose:
+                    source = knowledge_result.get("source", "unknown")
+                    docs = knowledge_result.get("context_documents", [])
+                    avg_sim = sum(d.get("metadata", {}).get("similarity_score", 0) for d in docs) / max(len(docs), 1)
+                    log.append(f"    KnowledgeAgent: {source} (avg similarity: {avg_sim:.2f}, {len(docs)} docs)")
+            except Exception as e:
+                if verbose:
+                    log.append(f"    KnowledgeAgent error: {e}")
+                knowledge_result = None
+        
+        # Verified QA library answers need no Citation/Drafting LLM calls
+        if (
+            knowledge_result
+            and knowledge_result.get("verified_answer")
+            and knowledge_result.get("qa_match_score", 0) >= VERIFIED_ANSWER_MIN_SCORE
+        ):
+            answer = self._answer_from_verified(question, knowledge_result)
             if verbose:
-                status = "⚠️ ESCALATE" if needs_escalation else "✅ OK"
-                print(f"    Result: {status} (confidence: {draft_result.confidence_score:.2f})")
+                log.append(f"    Result: ✅ OK (verified QA library answer)")
+                print("\n".join(log))
+            return answer
         
-        return answers
+        # Step 2: Citation + Drafting agents process the question
+        # Use documents from Knowledge Agent if available, else fall back to input context_docs
+        if verbose:
+            log.append(f"    Using Citation+Drafting agents...")
+        
+        # Convert Knowledge Agent docs to ContextDocument objects
+        docs_for_citation = context_docs  # default fallback
+        citation_context_text: Optional[str] = context_text
+        retrieved_docs = knowledge_result.get("context_documents") if knowledge_result else None
+        if retrieved_docs:
+            docs_for_citation = [
+                ContextDocument(
+                    doc_id=doc.get("doc_id", f"doc_{i}"),
+                    title=doc.get("title", "Unknown"),
+                    content=doc.get("content", ""),
+                    source=doc.get("source", "knowledge_base"),
+                    metadata=doc.get("metadata", {})
+                )
+                for i, doc in enumerate(retrieved_docs)
+            ]
+            citation_context_text = None
+        
+        # Citation Agent: Find relevant citations from retrieved docs
+        citation_result = await self.citation_agent.find_citations(
+            question, docs_for_citation, citation_context_text
+        )
+        
+        # Drafting Agent: Generate answer based on citations
+        draft_result = await self.drafting_agent.draft_answer(
+            question, citation_result
+        )
+        
+        # Determine if escalation needed based on Drafting Agent confidence
+        # <50% = needs escalation, 50-70% = needs review (handled in frontend)
+        confidence_score = draft_result.confidence_score
+        needs_escalation = confidence_score < self._confidence_threshold
+        escalation_reason = _escalation_reason(confidence_score) if needs_escalation else None
+        
+        # Built from the validated DraftResult and Citations, so no re-validation
+        answer = QuestionAnswer.model_construct(
+            question_id=question.question_id,
+            question_text=question.question_text,
+            answer=draft_result.answer,
+            confidence=draft_result.confidence,
+            confidence_score=confidence_score,
+            citations=citation_result.citations,
+            reasoning=draft_result.reasoning,
+            needs_escalation=needs_escalation,
+            escalation_reason=escalation_reason,
+            category=question.category
+        )
+        
+        if verbose:
+            status = "⚠️ ESCALATE" if needs_escalation else "✅ OK"
+            log.append(f"    Result: {status} (confidence: {confidence_score:.2f})")
+            print("\n".join(log))
+        
+        return answer
     
-    def _convert_knowledge_evidence_to_context(
-        self, 
-        evidence: List[dict]
-    ) -> str:
-        """Convert KnowledgeAgent evidence to context string for Citation Agent."""
-        if not evidence:
-            return ""
-        
-        context_parts = []
-        for e in evidence:
-            text = e.get("text", "")
-            source = e.get("source_document", "unknown")
-            similarity = e.get("similarity_score", 0)
-            context_parts.append(f"[Source: {source}, Similarity: {similarity:.2f}]\n{text}")
-        
-        return "\n\n".join(context_parts)
+    def _answer_from_verified(self, question: Question, knowledge_result: dict) -> QuestionAnswer:
+        """Build the answer directly from a verified QA library entry."""
+        doc = knowledge_result["context_documents"][0]
+        score = min(knowledge_result["qa_match_score"], 1.0)
+        # The Citation is validated (its fields come from the database); the
+        # answer around it is assembled from known-good values
+        return QuestionAnswer.model_construct(
+            question_id=question.question_id,
+            question_text=question.question_text,
+            answer=knowledge_result["verified_answer"],
+            confidence=ConfidenceLevel.HIGH,
+            confidence_score=score,
+            citations=[Citation(
+                doc_id=str(doc.get("doc_id", "qa_library")),
+                doc_title=doc.get("title", "Verified Answer Library"),
+                relevant_excerpt=knowledge_result["verified_answer"],
+                relevance_score=score
+            )],
+            reasoning="Previously approved answer from the verified QA library",
+            needs_escalation=False,
+            category=question.category
+        )
     
     async def process_with_escalation(
         self,
@@ -282,13 +541,16 @@ class QuestionnaireOrchestrator:
             )
             
             if verbose:
+                lines = []
                 for result in escalation_response.results:
                     if result.requires_escalation:
                         routed = result.routed_to
                         if routed:
-                            print(f"   → {result.question_text[:40]}... → {routed['name']} ({routed['department']})")
+                            lines.append(f"   → {result.question_text[:40]}... → {routed['name']} ({routed['department']})")
                         else:
-                            print(f"   → {result.question_text[:40]}... → [No employee found]")
+                            lines.append(f"   → {result.question_text[:40]}... → [No employee found]")
+                if lines:
+                    print("\n".join(lines))
         
         return output, escalation_response
 
@@ -301,7 +563,8 @@ async def process_questionnaire(
     request_id: str,
     questions: List[dict],
     context_documents: List[dict],
-    verbose: bool = False
+    verbose: bool = False,
+    orchestrator: Optional[QuestionnaireOrchestrator] = None
 ) -> QuestionnaireOutput:
     """
     Convenience function to process a questionnaire from raw dicts.
@@ -311,16 +574,26 @@ async def process_questionnaire(
         questions: List of question dicts with question_id, question_text, category
         context_documents: List of document dicts with doc_id, title, content, source
         verbose: Whether to print progress
+        orchestrator: Long-lived orchestrator to reuse (left open); if omitted,
+            a temporary one is created and closed after the call
         
     Returns:
         QuestionnaireOutput with all answers
     """
-    input_data = QuestionnaireInput(
-        request_id=request_id,
-        context_documents=[ContextDocument(**d) for d in context_documents],
-        questions=[Question(**q) for q in questions]
-    )
+    # One validation pass over the raw dicts through the compiled core schema,
+    # rather than building each Question/ContextDocument from **kwargs first
+    input_data = QuestionnaireInput.model_validate({
+        "request_id": request_id,
+        "context_documents": context_documents,
+        "questions": questions
+    })
+    
+    if orchestrator is not None:
+        return await orchestrator.process_questionnaire(input_data, verbose)
     
     orchestrator = QuestionnaireOrchestrator()
-    return await orchestrator.process_questionnaire(input_data, verbose)
+    try:
+        return await orchestrator.process_questionnaire(input_data, verbose)
+    finally:
+        await orchestrator.aclose()
 
@@ -6,19 +6,25 @@ Unified API that orchestrates all agents:
 - Engineer 2: Citation Agent + Drafting Agent
 - Engineer 3: Escalation Agent
 """
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from contextlib import asynccontextmanager
-from typing import Optional
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Response
+from contextlib import asynccontextmanager, suppress
+from typing import List, Optional, Tuple, Union
+from pydantic import BaseModel, TypeAdapter
+import asyncio
 import httpx
 
 from src.core.config import settings
-from src.core.database import db
+from src.core.database import db, close_motor_clients
+from src.core.llm_client import json_dumps
 from src.models.api import (
     QuestionnaireInput,
     QuestionnaireOutput,
+    QuestionnaireWithEscalationOutput,
     EscalationResponse,
+    QUESTIONNAIRE_OUTPUT_ADAPTER,
+    QUESTIONNAIRE_WITH_ESCALATION_ADAPTER,
 )
-from src.agents.orchestrator import QuestionnaireOrchestrator, OrchestratorConfig
+from src.agents.orchestrator import QuestionnaireOrchestrator, OrchestratorConfig, close_shared_clients
 
 
 # Initialize orchestrator
@@ -44,15 +50,24 @@ async def lifespan(app: FastAPI):
     try:
         if settings.mongodb_uri:
             await db.connect(settings.mongodb_uri, settings.mongodb_db_name)
+            await orchestrator.warm()
         else:
             print("⚠️  MongoDB URI not configured - escalation routing disabled")
     except Exception as e:
         print(f"⚠️  MongoDB connection failed: {e}")
     
+    _start_callback_workers()
+    
     yield
     
     # Cleanup
+    await _stop_callback_workers()
+    await orchestrator.aclose()
+    await close_shared_clients()
+    if _callback_http is not None:
+        await _callback_http.aclose()
     await db.disconnect()
+    close_motor_clients()
     print("👋 Shutting down...")
 
 
@@ -77,16 +92,113 @@ Pipeline:
 )
 
 
-async def forward_to_callback(callback_url: str, data: dict):
+# Reused across callbacks so forwarding doesn't pay a new TCP/TLS handshake each time
+_callback_http: Optional[httpx.AsyncClient] = None
+
+
+def _callback_client() -> httpx.AsyncClient:
+    """Shared HTTP client for callback forwarding, created on first use."""
+    global _callback_http
+    if _callback_http is None or _callback_http.is_closed:
+        _callback_http = httpx.AsyncClient(timeout=30.0)
+    return _callback_http
+
+
+async def forward_to_callback(callback_url: str, data: Union[BaseModel, dict]):
     """Forward the response to a callback URL."""
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(callback_url, json=data)
-            print(f"✅ Forwarded to {callback_url} - Status: {response.status_code}")
+        # Models serialize straight to JSON in pydantic-core, no model_dump() dict first
+        body = data.model_dump_json() if isinstance(data, BaseModel) else json_dumps(data)
+        response = await _callback_client().post(
+            callback_url,
+            content=body,
+            headers={"Content-Type": "application/json"}
+        )
+        print(f"✅ Forwarded to {callback_url} - Status: {response.status_code}")
     except Exception as e:
         print(f"❌ Failed to forward to {callback_url}: {e}")
 
 
+# Callbacks go through a bounded queue drained by a fixed pool of workers, so a
+# storm of slow or failing callback URLs can't pile up unbounded coroutines
+_callback_queue: Optional["asyncio.Queue[Tuple[str, Union[BaseModel, dict]]]"] = None
+_callback_workers: List[asyncio.Task] = []
+_callbacks_dropped = 0
+
+
+async def _callback_worker(queue: "asyncio.Queue[Tuple[str, Union[BaseModel, dict]]]"):
+    """Forward queued callbacks one at a time until cancelled."""
+    while True:
+        callback_url, data = await queue.get()
+        try:
+            await forward_to_callback(callback_url, data)
+        finally:
+            queue.task_done()
+
+
+def _start_callback_workers():
+    """Create the callback queue and its workers (idempotent)."""
+    global _callback_queue
+    if _callback_queue is None:
+        _callback_queue = asyncio.Queue(maxsize=settings.callback_queue_size)
+        _callback_workers.extend(
+            asyncio.create_task(_callback_worker(_callback_queue))
+            for _ in range(settings.callback_workers)
+        )
+
+
+async def _stop_callback_workers():
+    """Give queued callbacks a short grace period, then stop the workers."""
+    global _callback_queue
+    if _callback_queue is None:
+        return
+    with suppress(TimeoutError):
+        await asyncio.wait_for(_callback_queue.join(), timeout=10.0)
+    for worker in _callback_workers:
+        worker.cancel()
+    await asyncio.gather(*_callback_workers, return_exceptions=True)
+    _callback_workers.clear()
+    _callback_queue = None
+
+
+async def enqueue_callback(callback_url: str, data: Union[BaseModel, dict]):
+    """
+    Queue a callback for the worker pool.
+    
+    When the queue is full this waits for space (backpressure) and drops the
+    callback if none frees up within callback_enqueue_timeout_seconds.
+    """
+    global _callbacks_dropped
+    _start_callback_workers()
+    try:
+        await asyncio.wait_for(
+            _callback_queue.put((callback_url, data)),
+            timeout=settings.callback_enqueue_timeout_seconds
+        )
+    except TimeoutError:
+        _callbacks_dropped += 1
+        print(f"❌ Callback queue full - dropped callback to {callback_url}")
+
+
+def _callback_queue_stats() -> dict:
+    """Callback queue depth and drop count for /health and /stats."""
+    return {
+        "depth": _callback_queue.qsize() if _callback_queue else 0,
+        "capacity": settings.callback_queue_size,
+        "dropped": _callbacks_dropped
+    }
+
+
+def _json_response(adapter: TypeAdapter, value) -> Response:
+    """
+    Serialize a response model once, bypassing FastAPI's response_model pass.
+    
+    pydantic-core flattens the model to Python objects and orjson encodes them;
+    for these string-heavy payloads that beats dump_json() by roughly 10%.
+    """
+    return Response(json_dumps(adapter.dump_python(value)), media_type="application/json")
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
@@ -94,7 +206,8 @@ async def health_check():
         "status": "healthy",
         "service": "security-questionnaire-answerer",
         "version": "2.0.0",
-        "agents": ["knowledge", "citation", "drafting", "escalation"]
+        "agents": ["knowledge", "citation", "drafting", "escalation"],
+        "callback_queue": _callback_queue_stats()
     }
 
 
@@ -103,7 +216,7 @@ async def process_questionnaire(
     input_data: QuestionnaireInput,
     background_tasks: BackgroundTasks,
     callback_url: Optional[str] = None
-) -> QuestionnaireOutput:
+) -> Response:
     """
     Process a security questionnaire through the multi-agent pipeline.
     
@@ -120,28 +233,27 @@ async def process_questionnaire(
         QuestionnaireOutput with answers, citations, confidence, and escalation flags
     """
     try:
-        output = await orchestrator.process_questionnaire(input_data, verbose=True)
+        output = await orchestrator.process_questionnaire(
+            input_data, verbose=settings.verbose_pipeline
+        )
         
         # Forward to callback URL if provided
         if callback_url:
-            background_tasks.add_task(
-                forward_to_callback,
-                callback_url,
-                output.model_dump()
-            )
+            background_tasks.add_task(enqueue_callback, callback_url, output)
         
-        return output
+        # response_model still documents the schema
+        return _json_response(QUESTIONNAIRE_OUTPUT_ADAPTER, output)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/process/with-escalation")
+@app.post("/process/with-escalation", response_model=QuestionnaireWithEscalationOutput)
 async def process_with_escalation(
     input_data: QuestionnaireInput,
     background_tasks: BackgroundTasks,
     callback_url: Optional[str] = None
-) -> dict:
+) -> Response:
     """
     Process questionnaire and run full escalation routing.
     
@@ -150,18 +262,18 @@ async def process_with_escalation(
     """
     try:
         output, escalation_response = await orchestrator.process_with_escalation(
-            input_data, verbose=True
+            input_data, verbose=settings.verbose_pipeline
         )
         
-        result = {
-            "questionnaire": output.model_dump(),
-            "escalation": escalation_response.model_dump() if escalation_response else None
-        }
+        result = QuestionnaireWithEscalationOutput(
+            questionnaire=output,
+            escalation=escalation_response
+        )
         
         if callback_url:
-            background_tasks.add_task(forward_to_callback, callback_url, result)
+            background_tasks.add_task(enqueue_callback, callback_url, result)
         
-        return result
+        return _json_response(QUESTIONNAIRE_WITH_ESCALATION_ADAPTER, result)
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -180,13 +292,10 @@ async def process_questionnaire_async(
     async def process_and_forward():
         try:
             output, escalation = await orchestrator.process_with_escalation(input_data)
-            result = {
-                "questionnaire": output.model_dump(),
-                "escalation": escalation.model_dump() if escalation else None
-            }
-            await forward_to_callback(callback_url, result)
+            result = QuestionnaireWithEscalationOutput(questionnaire=output, escalation=escalation)
+            await enqueue_callback(callback_url, result)
         except Exception as e:
-            await forward_to_callback(callback_url, {"error": str(e)})
+            await enqueue_callback(callback_url, {"error": str(e)})
     
     background_tasks.add_task(process_and_forward)
     
@@ -201,10 +310,12 @@ async def process_questionnaire_async(
 async def get_stats():
     """Get statistics about the knowledge base."""
     if orchestrator.knowledge_agent:
-        stats = orchestrator.knowledge_agent.get_stats()
+        stats = await orchestrator.knowledge_agent.get_stats()
         return {
             "status": "ok",
-            "knowledge_base": stats
+            "knowledge_base": stats,
+            "answer_cache": orchestrator.answer_cache.stats() if orchestrator.answer_cache else None,
+            "callback_queue": _callback_queue_stats()
         }
-    return {"status": "ok", "knowledge_base": "not configured"}
+    return {"status": "ok", "knowledge_base": "not configured", "callback_queue": _callback_queue_stats()}
 
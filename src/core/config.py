@@ -3,7 +3,7 @@ Unified configuration settings for the application.
 """
 import os
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Optional
 
 
 class Settings(BaseSettings):
@@ -12,10 +12,16 @@ class Settings(BaseSettings):
     # MongoDB Configuration
     mongodb_uri: str = ""
     mongodb_db_name: str = "security_questionnaire"
+    mongodb_max_pool_size: int = 32
+    mongodb_min_pool_size: int = 4
+    mongodb_max_idle_time_ms: int = 30000
+    mongodb_server_selection_timeout_ms: int = 3000
+    mongodb_wait_queue_timeout_ms: int = 5000
     
     # VoyageAI Configuration (for embeddings)
     voyage_api_key: str = ""
     voyage_model: str = "voyage-3-large"
+    voyage_max_connections: int = 16
     
     # Anthropic Configuration (for Knowledge Agent)
     anthropic_api_key: str = ""
@@ -25,6 +31,13 @@ class Settings(BaseSettings):
     fireworks_base_url: str = "https://api.fireworks.ai/inference/v1/chat/completions"
     fireworks_model: str = "accounts/fireworks/models/deepseek-v3p2"
     
+    # Escalation judge: a small model for the yes/no review, with the large
+    # model kept for high-stakes categories
+    escalation_model: str = "accounts/fireworks/models/llama-v3p1-8b-instruct"
+    escalation_high_stakes_model: str = "accounts/fireworks/models/deepseek-v3p2"
+    escalation_high_stakes_categories: List[str] = ["compliance"]
+    escalation_max_tokens: int = 120
+    
     # Model Parameters
     max_tokens: int = 4096
     temperature: float = 0.6
@@ -32,7 +45,28 @@ class Settings(BaseSettings):
     # Agent Configuration
     confidence_threshold: float = 0.5  # Below 50% = needs escalation
     batch_size: int = 5
+    verbose_pipeline: bool = False  # Per-question progress output from API requests
     answerability_penalty: float = 0.5
+    max_concurrent_llm_calls: int = 8  # Per-agent cap on in-flight Fireworks requests
+    question_timeout_seconds: float = 300.0  # Per-question pipeline budget, incl. queueing for LLM slots
+    
+    # Semantic answer cache (near-duplicate questions reuse drafted answers)
+    semantic_cache_threshold: float = 0.93
+    semantic_cache_ttl_seconds: int = 86400
+    
+    # Shared Fireworks HTTP connection pool
+    fireworks_max_connections: int = 1000
+    fireworks_max_keepalive_connections: int = 1000
+    
+    # Streamed completions fail once no token arrives for this long, instead of
+    # waiting out the full request timeout on a stalled generation
+    fireworks_stream_responses: bool = True
+    fireworks_stream_idle_timeout: float = 20.0
+    
+    # Callback forwarding: a bounded queue drained by a fixed worker pool
+    callback_workers: int = 8
+    callback_queue_size: int = 1000
+    callback_enqueue_timeout_seconds: float = 5.0  # Wait for queue space before dropping
     
     class Config:
         env_file = ".env"
@@ -2,10 +2,14 @@
 MongoDB database connection and schema setup.
 """
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import IndexModel
 from pymongo.server_api import ServerApi
-from typing import Optional
+from typing import Dict, Optional
+import importlib.util
 import os
 
+from src.core.config import settings
+
 # Try to import certifi for SSL certificate verification
 try:
     import certifi
@@ -13,6 +17,50 @@ try:
 except ImportError:
     CA_BUNDLE = None
 
+# Wire compression: zstd/snappy need optional packages, zlib is always available.
+# PyMongo imports the codecs itself, so only check that they are installed
+COMPRESSORS = [
+    name for name, module in (("zstd", "zstandard"), ("snappy", "snappy"))
+    if importlib.util.find_spec(module) is not None
+]
+COMPRESSORS.append("zlib")
+
+# One Motor client per URI for the whole process (MongoDB and KnowledgeAgent
+# share it), so every caller draws from the same connection pool
+_MOTOR_CLIENTS: Dict[str, AsyncIOMotorClient] = {}
+
+
+def get_motor_client(mongodb_uri: str) -> AsyncIOMotorClient:
+    """Return the process-wide Motor client for a URI, creating it on first use."""
+    client = _MOTOR_CLIENTS.get(mongodb_uri)
+    if client is None:
+        client_kwargs = {
+            "server_api": ServerApi('1'),
+            "maxPoolSize": settings.mongodb_max_pool_size,
+            "minPoolSize": settings.mongodb_min_pool_size,
+            "maxIdleTimeMS": settings.mongodb_max_idle_time_ms,
+            "serverSelectionTimeoutMS": settings.mongodb_server_selection_timeout_ms,
+            # Fail fast instead of queueing forever when the pool is exhausted
+            "waitQueueTimeoutMS": settings.mongodb_wait_queue_timeout_ms,
+            "retryWrites": True,
+            "compressors": ",".join(COMPRESSORS)
+        }
+        
+        # Use certifi if available for SSL certificate verification
+        if CA_BUNDLE:
+            client_kwargs["tlsCAFile"] = CA_BUNDLE
+        
+        client = AsyncIOMotorClient(mongodb_uri, **client_kwargs)
+        _MOTOR_CLIENTS[mongodb_uri] = client
+    return client
+
+
+def close_motor_clients():
+    """Close every process-wide Motor client. Call once at shutdown."""
+    for client in _MOTOR_CLIENTS.values():
+        client.close()
+    _MOTOR_CLIENTS.clear()
+
 
 class MongoDB:
     """MongoDB connection manager."""
@@ -23,16 +71,7 @@ class MongoDB:
     async def connect(cls, mongodb_uri: str, db_name: str = "security_qa"):
         """Connect to MongoDB Atlas."""
         try:
-            # Configure client with SSL certificate bundle if available
-            client_kwargs = {
-                "server_api": ServerApi('1')
-            }
-            
-            # Use certifi if available for SSL certificate verification
-            if CA_BUNDLE:
-                client_kwargs["tlsCAFile"] = CA_BUNDLE
-            
-            cls.client = AsyncIOMotorClient(mongodb_uri, **client_kwargs)
+            cls.client = get_motor_client(mongodb_uri)
             
             # Test connection
             await cls.client.admin.command('ping')
@@ -50,20 +89,25 @@ class MongoDB:
     @classmethod
     async def _create_indexes(cls):
         """Create indexes for collections."""
-        # Employee indexes
-        employees_collection = cls.database.employees
-        await employees_collection.create_index("email", unique=True)
-        await employees_collection.create_index("department")
-        await employees_collection.create_index("expertise_areas")
-        await employees_collection.create_index("codebase_modules")
+        # Employee indexes, in one createIndexes round-trip; the server skips
+        # any that already exist with the same spec, so restarts are cheap
+        await cls.database.employees.create_indexes([
+            IndexModel("email", unique=True),
+            IndexModel("department"),
+            IndexModel("expertise_areas"),
+            IndexModel("codebase_modules"),
+            IndexModel([("department", 1), ("expertise_areas", 1)]),
+        ])
         
         print("Database indexes created")
     
     @classmethod
     async def disconnect(cls):
-        """Close MongoDB connection."""
+        """Release the MongoDB connection."""
         if cls.client:
-            cls.client.close()
+            # The pooled client is shared with KnowledgeAgent, so it stays
+            # open here; close_motor_clients() closes it at shutdown
+            cls.client = None
             print("Disconnected from MongoDB")
 
 
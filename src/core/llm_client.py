@@ -3,10 +3,34 @@ LLM clients for Fireworks AI and other providers.
 """
 import httpx
 import json
+import re
 from typing import Optional, List, Dict
 
 from src.core.config import settings
 
+# orjson decodes several times faster than the stdlib; its JSONDecodeError
+# subclasses json.JSONDecodeError so existing except clauses still apply.
+# json_dumps returns bytes, ready to send as an httpx request body.
+try:
+    import orjson
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+except ImportError:
+    json_loads = json.loads
+    
+    def json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+# Body of a ```json ... ``` (or bare ```) fenced block; a fence left open by
+# truncated output runs to the end of the text
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*(?:```|\Z)", re.S)
+
+
+def extract_json_block(text: str) -> str:
+    """Return the contents of the first fenced code block, or the stripped text."""
+    match = _FENCE_RE.search(text)
+    return match.group(1) if match else text.strip()
+
 
 class FireworksClient:
     """Client for Fireworks AI API."""
@@ -19,6 +43,28 @@ class FireworksClient:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {self.api_key}"
         }
+        self._http: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Shared pooled HTTP/2 client, created on first use."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                timeout=120.0,
+                headers=self.headers,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=settings.fireworks_max_connections,
+                    max_keepalive_connections=settings.fireworks_max_keepalive_connections
+                )
+            )
+        return self._http
+    
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
     
     async def chat_completion(
         self,
@@ -26,7 +72,8 @@ class FireworksClient:
         max_tokens: Optional[int] = None,
         temperature: Optional[float] = None,
         model: Optional[str] = None,
-        response_format: Optional[dict] = None
+        response_format: Optional[dict] = None,
+        stream: bool = False
     ) -> dict:
         """
         Make a chat completion request to Fireworks AI.
@@ -37,9 +84,10 @@ class FireworksClient:
             temperature: Override default temperature
             model: Override default model
             response_format: Optional JSON schema for structured output
+            stream: Receive the completion as server-sent events
             
         Returns:
-            The API response as a dict
+            The API response as a dict (same shape whether streamed or not)
         """
         payload = {
             "model": model or settings.fireworks_model,
@@ -51,20 +99,63 @@ class FireworksClient:
         if response_format:
             payload["response_format"] = response_format
         
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            response = await client.post(
-                self.base_url,
-                headers=self.headers,
-                json=payload
-            )
-            
+        if stream:
+            payload["stream"] = True
+            return await self._stream_completion(payload)
+        
+        response = await self.http.post(self.base_url, content=json_dumps(payload))
+        
+        if response.status_code != 200:
+            error_text = response.text
+            print(f"❌ Fireworks API Error: {response.status_code}")
+            print(f"   Response: {error_text}")
+            response.raise_for_status()
+        
+        return json_loads(response.content)
+    
+    async def _stream_completion(self, payload: dict) -> dict:
+        """
+        Stream a chat completion and assemble it into a regular response dict.
+        
+        Tokens arrive as they are generated, so the read timeout only has to
+        cover the gap between two tokens rather than the whole generation.
+        """
+        timeout = httpx.Timeout(120.0, read=settings.fireworks_stream_idle_timeout)
+        parts: List[str] = []
+        finish_reason = None
+        usage = None
+        
+        async with self.http.stream(
+            "POST", self.base_url, content=json_dumps(payload), timeout=timeout
+        ) as response:
             if response.status_code != 200:
-                error_text = response.text
+                await response.aread()
                 print(f"❌ Fireworks API Error: {response.status_code}")
-                print(f"   Response: {error_text}")
+                print(f"   Response: {response.text}")
                 response.raise_for_status()
             
-            return response.json()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                chunk = json_loads(data)
+                usage = chunk.get("usage") or usage
+                for choice in chunk.get("choices", []):
+                    content = choice.get("delta", {}).get("content")
+                    if content:
+                        parts.append(content)
+                    finish_reason = choice.get("finish_reason") or finish_reason
+        
+        return {
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "".join(parts)},
+                "finish_reason": finish_reason
+            }],
+            "usage": usage
+        }
     
     def extract_content(self, response: dict) -> str:
         """Extract the content from a chat completion response."""
@@ -74,13 +165,10 @@ class FireworksClient:
         """Extract and parse JSON content from a response."""
         content = self.extract_content(response)
         # Handle potential markdown code blocks
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        elif "```" in content:
-            content = content.split("```")[1].split("```")[0]
+        content = extract_json_block(content)
         
         try:
-            return json.loads(content.strip())
+            return json_loads(content)
         except json.JSONDecodeError as e:
             print(f"⚠️ JSON parse error: {e}")
             print(f"   Raw content: {content[:500]}...")
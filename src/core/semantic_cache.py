@@ -0,0 +1,177 @@
+"""
+Semantic answer cache - reuses drafted answers for near-duplicate questions.
+
+Security questionnaires repeat the same questions with slightly different
+wording across customers. Answers are cached against the question's (unit
+length) Voyage embedding and served when a new question is at least
+`threshold` cosine-similar, skipping the Citation and Drafting LLM calls.
+
+Entries are namespaced (the orchestrator uses a hash of the request's
+context documents, so answers never cross different documentation) and
+expire after a TTL so policy changes are picked up.
+"""
+import hashlib
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from src.models.api import QuestionAnswer
+from src.models.common import ContextDocument
+
+INITIAL_CAPACITY = 16  # Rows preallocated per namespace, doubled as it fills
+
+
+@dataclass(slots=True)
+class _Namespace:
+    """
+    Cached answers for one namespace; row i of vectors belongs to answers[i].
+    
+    vectors is preallocated and grown by doubling, so only its first
+    len(answers) rows are in use. Entries are appended in insertion order
+    with one TTL, so expires_at is ascending.
+    """
+    vectors: np.ndarray
+    answers: List[QuestionAnswer]
+    expires_at: List[float]
+
+
+def context_namespace(context_documents: List[ContextDocument]) -> str:
+    """Stable namespace key for a set of context documents (order-independent)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for doc_id, content in sorted((d.doc_id, d.content) for d in context_documents):
+        digest.update(doc_id.encode())
+        digest.update(b"\0")
+        digest.update(content.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class SemanticAnswerCache:
+    """In-memory nearest-neighbour cache of QuestionAnswers keyed by embedding."""
+    
+    def __init__(
+        self,
+        threshold: float = 0.93,
+        ttl_seconds: float = 86400,
+        max_entries_per_namespace: int = 5000,
+        max_namespaces: int = 256
+    ):
+        """
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            ttl_seconds: Seconds before a cached answer expires
+            max_entries_per_namespace: Oldest entries are dropped beyond this
+            max_namespaces: Least recently used namespaces are dropped beyond this
+        """
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_namespace = max_entries_per_namespace
+        self.max_namespaces = max_namespaces
+        self._namespaces: "OrderedDict[str, _Namespace]" = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+    
+    def get(self, namespace: str, embedding: List[float]) -> Optional[QuestionAnswer]:
+        """
+        Return the cached answer for the most similar question, if similar enough.
+        
+        Args:
+            namespace: Cache namespace (see context_namespace)
+            embedding: Unit-length question embedding
+        
+        Returns:
+            Cached QuestionAnswer (carrying the original question's ids), or None
+        """
+        entries = self._namespaces.get(namespace)
+        if entries is None or not entries.answers:
+            self._misses += 1
+            return None
+        self._namespaces.move_to_end(namespace)
+        
+        # expires_at is ascending, so live entries are the rows from start on;
+        # once half the rows are expired they are dropped here rather than at
+        # the next put that finds the namespace full
+        now = time.monotonic()
+        size = len(entries.answers)
+        start = bisect_right(entries.expires_at, now)
+        if start and 2 * start >= size:
+            self._compact(entries, now)
+            size, start = len(entries.answers), 0
+        if start == size:
+            self._misses += 1
+            return None
+        
+        # Embeddings are unit length, so the dot product is the cosine similarity
+        scores = entries.vectors[start:size] @ np.asarray(embedding, dtype=np.float32)
+        best = int(np.argmax(scores))
+        if scores[best] < self.threshold:
+            self._misses += 1
+            return None
+        
+        self._hits += 1
+        return entries.answers[start + best]
+    
+    def put(self, namespace: str, embedding: List[float], answer: QuestionAnswer):
+        """Cache an answer under its question's embedding."""
+        now = time.monotonic()
+        vector = np.asarray(embedding, dtype=np.float32)
+        entries = self._namespaces.get(namespace)
+        if entries is None:
+            self._evict_namespaces(now)
+            entries = _Namespace(
+                np.empty((min(INITIAL_CAPACITY, self.max_entries_per_namespace), vector.shape[0]), dtype=np.float32),
+                [],
+                []
+            )
+            self._namespaces[namespace] = entries
+        else:
+            self._namespaces.move_to_end(namespace)
+        
+        if len(entries.answers) >= self.max_entries_per_namespace:
+            self._compact(entries, now)
+        
+        size = len(entries.answers)
+        if size == entries.vectors.shape[0]:
+            grown = np.empty(
+                (min(2 * size, self.max_entries_per_namespace), vector.shape[0]), dtype=np.float32
+            )
+            grown[:size] = entries.vectors[:size]
+            entries.vectors = grown
+        
+        entries.vectors[size] = vector
+        entries.answers.append(answer)
+        entries.expires_at.append(now + self.ttl_seconds)
+    
+    def _compact(self, entries: _Namespace, now: float):
+        """Drop expired entries and, if still full, the oldest quarter."""
+        size = len(entries.answers)
+        start = bisect_right(entries.expires_at, now)
+        if size - start >= self.max_entries_per_namespace:
+            # Freeing a quarter at once keeps a full namespace from shifting
+            # every row on every put
+            start = size - self.max_entries_per_namespace * 3 // 4
+        entries.vectors[:size - start] = entries.vectors[start:size]
+        del entries.answers[:start]
+        del entries.expires_at[:start]
+    
+    def _evict_namespaces(self, now: float):
+        """Drop fully expired namespaces, then the least recently used beyond the cap."""
+        for name in [n for n, e in self._namespaces.items() if not e.expires_at or e.expires_at[-1] < now]:
+            del self._namespaces[name]
+        while len(self._namespaces) >= self.max_namespaces:
+            self._namespaces.popitem(last=False)
+    
+    def stats(self) -> dict:
+        """Hit/miss counters for observability."""
+        total = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / total if total else 0.0,
+            "namespaces": len(self._namespaces),
+            "size": sum(len(entries.answers) for entries in self._namespaces.values())
+        }
@@ -1,68 +1,56 @@
 """
 Unified models for the Security Questionnaire system.
+
+Models are imported lazily (PEP 562): `from src.models import X` only loads
+the submodule defining X, so Pydantic builds schemas for the models a code
+path actually uses.
 """
-from src.models.common import (
-    ConfidenceLevel,
-    Citation,
-    Evidence,
-    Question,
-    ContextDocument,
-)
-from src.models.employee import (
-    Employee,
-    EmployeeCreate,
-    EmployeeResponse,
-    PyObjectId,
-)
-from src.models.api import (
-    # Input models
-    QuestionnaireInput,
-    # Output models
-    QuestionAnswer,
-    BatchResult,
-    QuestionnaireOutput,
-    # Internal models
-    CitationResult,
-    DraftResult,
-    # Escalation models (internal orchestrator format)
-    EscalationRequest,
-    EscalationResult,
-    EscalationResponse,
-)
-from src.models.escalation_request import (
-    # External citation agent request format
-    EscalationRequest as CitationEscalationRequest,
-    AnswerItem,
-    Batch,
-    Citation as EscalationCitation,
-)
+import importlib
 
-__all__ = [
+# Exported name -> (submodule, attribute in that submodule)
+_LAZY = {
     # Common
-    "ConfidenceLevel",
-    "Citation",
-    "Evidence",
-    "Question",
-    "ContextDocument",
+    "ConfidenceLevel": ("src.models.common", "ConfidenceLevel"),
+    "Citation": ("src.models.common", "Citation"),
+    "Evidence": ("src.models.common", "Evidence"),
+    "Question": ("src.models.common", "Question"),
+    "ContextDocument": ("src.models.common", "ContextDocument"),
+    "UTCDatetime": ("src.models.common", "UTCDatetime"),
     # Employee
-    "Employee",
-    "EmployeeCreate",
-    "EmployeeResponse",
-    "PyObjectId",
-    # API
-    "QuestionnaireInput",
-    "QuestionAnswer",
-    "BatchResult",
-    "QuestionnaireOutput",
-    "CitationResult",
-    "DraftResult",
-    "EscalationRequest",
-    "EscalationResult",
-    "EscalationResponse",
-    # External citation agent format
-    "CitationEscalationRequest",
-    "AnswerItem",
-    "Batch",
-    "EscalationCitation",
-]
+    "Employee": ("src.models.employee", "Employee"),
+    "EmployeeCreate": ("src.models.employee", "EmployeeCreate"),
+    "EmployeeResponse": ("src.models.employee", "EmployeeResponse"),
+    "PyObjectId": ("src.models.employee", "PyObjectId"),
+    # API: input, output, internal and escalation (internal orchestrator format) models
+    "QuestionnaireInput": ("src.models.api", "QuestionnaireInput"),
+    "QuestionAnswer": ("src.models.api", "QuestionAnswer"),
+    "BatchResult": ("src.models.api", "BatchResult"),
+    "QuestionnaireOutput": ("src.models.api", "QuestionnaireOutput"),
+    "CitationResult": ("src.models.api", "CitationResult"),
+    "DraftResult": ("src.models.api", "DraftResult"),
+    "EscalationRequest": ("src.models.api", "EscalationRequest"),
+    "EscalationResult": ("src.models.api", "EscalationResult"),
+    "EscalationResponse": ("src.models.api", "EscalationResponse"),
+    # External citation agent request format
+    "CitationEscalationRequest": ("src.models.escalation_request", "EscalationRequest"),
+    "AnswerItem": ("src.models.escalation_request", "AnswerItem"),
+    "Batch": ("src.models.escalation_request", "Batch"),
+    "EscalationCitation": ("src.models.common", "Citation"),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+    """Import the submodule defining `name` on first access and cache the result."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,7 @@
 """
 API request/response models for the questionnaire system.
 """
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 from typing import List, Optional
 
 from src.models.common import (
@@ -22,6 +22,8 @@ class QuestionnaireInput(BaseModel):
 
 
 # ============== OUTPUT MODELS ==============
+# The orchestrator and escalation agent build these from already-validated
+# parts with model_construct(); validation runs at the API and LLM boundaries.
 
 class QuestionAnswer(BaseModel):
     """Complete answer for a single question with citations and confidence."""
@@ -66,7 +68,7 @@ class DraftResult(BaseModel):
     question_id: str
     answer: str
     confidence: ConfidenceLevel
-    confidence_score: float
+    confidence_score: float = Field(..., ge=0.0, le=1.0)
     reasoning: Optional[str] = None
 
 
@@ -104,3 +106,14 @@ class EscalationResponse(BaseModel):
     results: List[EscalationResult]
     status: str = "completed"
 
+
+class QuestionnaireWithEscalationOutput(BaseModel):
+    """Questionnaire answers together with escalation routing."""
+    questionnaire: QuestionnaireOutput
+    escalation: Optional[EscalationResponse] = None
+
+
+# Built once so response serialization reuses the compiled core serializers
+QUESTIONNAIRE_OUTPUT_ADAPTER = TypeAdapter(QuestionnaireOutput)
+QUESTIONNAIRE_WITH_ESCALATION_ADAPTER = TypeAdapter(QuestionnaireWithEscalationOutput)
+
@@ -1,10 +1,23 @@
 """
 Common models shared across all agents.
 """
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import AfterValidator, BaseModel, Field
+from typing import Annotated, Optional
+from datetime import datetime, timezone
 from enum import Enum
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+
+
+def _ensure_utc(v: datetime) -> datetime:
+    """Coerce naive timestamps from older records to UTC."""
+    if v.tzinfo is None:
+        return v.replace(tzinfo=timezone.utc)
+    return v
+
+
+# Older records were written with naive utcnow() timestamps
+UTCDatetime = Annotated[datetime, AfterValidator(_ensure_utc)]
 
 
 class ConfidenceLevel(str, Enum):
@@ -20,9 +33,21 @@ class Citation(BaseModel):
     doc_title: str = Field(..., description="Title of the cited document")
     relevant_excerpt: str = Field(..., description="Relevant excerpt from the document")
     relevance_score: float = Field(..., ge=0.0, le=1.0, description="Relevance score (0-1)")
+    
+    @cached_property
+    def short_excerpt(self) -> str:
+        """Excerpt truncated to 200 characters for LLM prompts."""
+        excerpt = self.relevant_excerpt
+        return excerpt[:200] + "..." if len(excerpt) > 200 else excerpt
+
+
+@lru_cache(maxsize=1024)
+def _doc_id_for_title(doc_title: str) -> str:
+    """Slug used as the citation doc_id; many chunks share a title."""
+    return doc_title.lower().replace(" ", "_")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Evidence:
     """Evidence from vector search (used by Knowledge Agent)."""
     text: str
@@ -32,12 +57,19 @@ class Evidence:
     similarity_score: float
     
     def to_dict(self) -> dict:
-        return asdict(self)
+        # Flat fields, so a literal avoids asdict()'s recursive deep copy
+        return {
+            "text": self.text,
+            "doc_title": self.doc_title,
+            "doc_type": self.doc_type,
+            "section": self.section,
+            "similarity_score": self.similarity_score
+        }
     
     def to_citation(self) -> Citation:
         """Convert Evidence to Citation format."""
         return Citation(
-            doc_id=self.doc_title.lower().replace(" ", "_"),
+            doc_id=_doc_id_for_title(self.doc_title),
             doc_title=self.doc_title,
             relevant_excerpt=self.text[:500],
             relevance_score=self.similarity_score
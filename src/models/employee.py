@@ -1,11 +1,13 @@
 """
 Employee model for the security questionnaire system.
 """
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from bson import ObjectId
 
+from src.models.common import UTCDatetime
+
 
 class PyObjectId(ObjectId):
     """Pydantic v2 compatible ObjectId type."""
@@ -46,13 +48,14 @@ class Employee(BaseModel):
     department: str
     codebase_modules: List[str] = []  # Parts of codebase they work on
     expertise_areas: List[str] = []   # Security domains they handle
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: UTCDatetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
-    class Config:
-        populate_by_name = True
-        arbitrary_types_allowed = True
-        json_encoders = {ObjectId: str}
-        json_schema_extra = {
+    # No json_encoders: PyObjectId serializes to str in its own core schema and
+    # datetimes are ISO 8601 natively, both handled inside pydantic-core
+    model_config = ConfigDict(
+        populate_by_name=True,
+        arbitrary_types_allowed=True,
+        json_schema_extra={
             "example": {
                 "name": "John Doe",
                 "email": "john.doe@startup.com",
@@ -62,6 +65,7 @@ class Employee(BaseModel):
                 "expertise_areas": ["authentication", "encryption", "data-protection"]
             }
         }
+    )
 
 
 class EmployeeCreate(BaseModel):
@@ -83,7 +87,4 @@ class EmployeeResponse(BaseModel):
     department: str
     codebase_modules: List[str]
     expertise_areas: List[str]
-    created_at: datetime
-    
-    class Config:
-        json_encoders = {ObjectId: str}
+    created_at: UTCDatetime
@@ -1,16 +1,12 @@
 """
 Pydantic models for escalation request format from citation agentic AI
 """
+from functools import cached_property
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-
-class Citation(BaseModel):
-    """Citation from document agent"""
-    doc_id: str
-    doc_title: str
-    relevant_excerpt: str
-    relevance_score: float = Field(ge=0.0, le=1.0)
+# Same shape as the orchestrator's citations, so both formats share one model
+from src.models.common import Citation
 
 
 class AnswerItem(BaseModel):
@@ -22,6 +18,15 @@ class AnswerItem(BaseModel):
     confidence_score: float = Field(ge=0.0, le=1.0, description="Numeric confidence score 0-1")
     citations: List[Citation] = Field(default_factory=list)
     reasoning: Optional[str] = None
+    
+    @cached_property
+    def lowered_texts(self) -> Tuple[str, ...]:
+        """Lowercased question, answer, then citation titles, for keyword matching"""
+        return (
+            self.question_text.lower(),
+            self.answer.lower(),
+            *(citation.doc_title.lower() for citation in self.citations)
+        )
 
 
 class Batch(BaseModel):
@@ -0,0 +1,73 @@
+"""
+Fake employee records used to seed the employees collection.
+"""
+from typing import Dict, Tuple
+
+
+# Fake employee data for the startup
+FAKE_EMPLOYEES: Tuple[Dict, ...] = (
+    {
+        "name": "Alice Chen",
+        "email": "alice.chen@startup.com",
+        "role": "Chief Security Officer",
+        "department": "Security",
+        "codebase_modules": ("auth", "encryption", "api-security", "rbac"),
+        "expertise_areas": ("authentication", "authorization", "encryption", "data-protection", "compliance")
+    },
+    {
+        "name": "Bob Martinez",
+        "email": "bob.martinez@startup.com",
+        "role": "Senior Security Engineer",
+        "department": "Security",
+        "codebase_modules": ("auth", "oauth", "jwt"),
+        "expertise_areas": ("authentication", "oauth", "jwt", "session-management")
+    },
+    {
+        "name": "Carol Johnson",
+        "email": "carol.johnson@startup.com",
+        "role": "Security Compliance Lead",
+        "department": "Compliance",
+        "codebase_modules": ("audit", "logging", "data-retention"),
+        "expertise_areas": ("gdpr", "soc2", "compliance", "data-governance", "audit-trails")
+    },
+    {
+        "name": "David Kim",
+        "email": "david.kim@startup.com",
+        "role": "Senior Backend Engineer",
+        "department": "Engineering",
+        "codebase_modules": ("api-security", "rate-limiting", "input-validation"),
+        "expertise_areas": ("api-security", "rate-limiting", "input-validation", "infrastructure")
+    },
+    {
+        "name": "Emma Wilson",
+        "email": "emma.wilson@startup.com",
+        "role": "Security Engineer",
+        "department": "Security",
+        "codebase_modules": ("encryption", "key-management", "secrets"),
+        "expertise_areas": ("encryption", "key-management", "secrets-management", "data-protection")
+    },
+    {
+        "name": "Frank Liu",
+        "email": "frank.liu@startup.com",
+        "role": "DevOps Engineer",
+        "department": "Engineering",
+        "codebase_modules": ("infrastructure", "deployment", "monitoring"),
+        "expertise_areas": ("infrastructure", "network-security", "devops", "monitoring")
+    },
+    {
+        "name": "Grace Park",
+        "email": "grace.park@startup.com",
+        "role": "Data Engineer",
+        "department": "Engineering",
+        "codebase_modules": ("database", "data-pipeline", "etl"),
+        "expertise_areas": ("database-security", "data-protection", "data-governance")
+    },
+    {
+        "name": "Henry Brown",
+        "email": "henry.brown@startup.com",
+        "role": "Compliance Analyst",
+        "department": "Compliance",
+        "codebase_modules": ("compliance-checks", "reporting"),
+        "expertise_areas": ("soc2", "gdpr", "compliance", "documentation")
+    }
+)
@@ -66,7 +66,7 @@ async def test_knowledge_agent():
         agent = KnowledgeAgent()
         
         # Show stats
-        stats = agent.get_stats()
+        stats = await agent.get_stats()
         print(f"\n📊 Knowledge Base Stats:")
         print(f"   QA Library: {stats['qa_library_count']} verified answers")
         print(f"   Documents: {stats['documents_count']} documents")
@@ -74,7 +74,7 @@ async def test_knowledge_agent():
         
         # Test retrieval
         print("\n🔍 Testing: 'Is customer data encrypted at rest?'")
-        result = agent.retrieve("Is customer data encrypted at rest?", verbose=True)
+        result = await agent.retrieve("Is customer data encrypted at rest?", verbose=True)
         
         print("\n📋 RETRIEVED DATA (for Citation Agent):")
         print(f"   Question ID: {result['question_id']}")
@@ -158,7 +158,7 @@ async def test_full_pipeline():
             
             # Step 1: Knowledge Agent retrieves evidence
             print("\n🧠 Step 1: Knowledge Agent (Retrieval)")
-            knowledge_result = knowledge_agent.retrieve(question_text, verbose=False)
+            knowledge_result = await knowledge_agent.retrieve(question_text, verbose=False)
             print(f"   Source: {knowledge_result['source']}")
             print(f"   Documents found: {len(knowledge_result['context_documents'])}")
             